@@ -0,0 +1,287 @@
+"""
+Offline benchmark of `SporeClient` against the local mock server:
+requests per second and p50/p99 latency per endpoint, parse time
+per endpoint and backend, and peak RSS of `parse_assets`:
+
+    python -m benchmarks.bench_client --requests 500 --concurrency 20 --output results.json
+
+Compare the JSON files before and after an upgrade to catch regressions.
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import subprocess
+import sys
+import time
+import timeit
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from spore_api import iterparsers, parsers
+from spore_api.client import SporeClient
+from spore_api.enums import Endpoint, ViewType
+
+from . import fixtures
+from .mock_server import MockSporeServer
+
+
+PAGE_LENGTH = 100
+# Paged requests cycle over the first pages, which the mock server keeps built
+PAGES = 10
+
+
+def page_start(index: int) -> int:
+    return index % PAGES * PAGE_LENGTH
+
+
+REQUESTS: Dict[Endpoint, Callable[[SporeClient, int], Awaitable[Any]]] = {
+    Endpoint.stats: lambda client, index: client.get_stats(),
+    Endpoint.creature: lambda client, index: client.get_creature(500000000000 + index),
+    Endpoint.user: lambda client, index: client.get_user_info(f"user{index}"),
+    Endpoint.user_assets: (
+        lambda client, index: client.get_user_assets("user", page_start(index), PAGE_LENGTH)
+    ),
+    Endpoint.sporecasts: lambda client, index: client.get_user_sporecasts(f"user{index}"),
+    Endpoint.sporecast_assets: (
+        lambda client, index: client.get_sporecast_assets(
+            500190457259,
+            page_start(index),
+            PAGE_LENGTH,
+        )
+    ),
+    Endpoint.achievements: (
+        lambda client, index: client.get_user_achievements("user", page_start(index), PAGE_LENGTH)
+    ),
+    Endpoint.asset: lambda client, index: client.get_asset_info(500000000000 + index),
+    Endpoint.comments: (
+        lambda client, index: client.get_asset_comments(
+            500000000000,
+            page_start(index),
+            PAGE_LENGTH,
+        )
+    ),
+    Endpoint.buddies: (
+        lambda client, index: client.get_user_buddies("user", page_start(index), PAGE_LENGTH)
+    ),
+    Endpoint.subscribers: (
+        lambda client, index: client.get_user_subscribers("user", page_start(index), PAGE_LENGTH)
+    ),
+    Endpoint.search: (
+        lambda client, index: client.search_assets(ViewType.newest, page_start(index), PAGE_LENGTH)
+    ),
+}
+
+PARSE_DOCUMENTS: Dict[str, Callable[[], str]] = {
+    "parse_stats": fixtures.stats_document,
+    "parse_creature": lambda: fixtures.creature_document(500000000000),
+    "parse_user": lambda: fixtures.user_document("user"),
+    "parse_assets": lambda: fixtures.assets_document(PAGE_LENGTH),
+    "parse_sporecasts": lambda: fixtures.sporecasts_document(10),
+    "parse_sporecast_assets": lambda: fixtures.sporecast_assets_document(PAGE_LENGTH),
+    "parse_achievements": lambda: fixtures.achievements_document(PAGE_LENGTH),
+    "parse_full_asset": lambda: fixtures.full_asset_document(500000000000),
+    "parse_asset_comments": lambda: fixtures.comments_document(PAGE_LENGTH),
+    "parse_buddies": lambda: fixtures.buddies_document(PAGE_LENGTH),
+}
+
+# Run in a fresh interpreter for every length, since the peak RSS only grows.
+# The RSS of small documents is hidden by the interpreter itself,
+# so the peak of Python allocations is traced too
+RSS_SCRIPT = """
+import json, resource, sys, tracemalloc
+from benchmarks.fixtures import assets_document
+from spore_api import {backend}
+
+text = assets_document({length})
+before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+{backend}.parse_assets(text)
+after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+tracemalloc.start()
+{backend}.parse_assets(text)
+traced_peak = tracemalloc.get_traced_memory()[1]
+
+scale = 1 if sys.platform == "darwin" else 1024
+print(json.dumps({{
+    "peak_rss": after * scale,
+    "parse_rss_growth": (after - before) * scale,
+    "traced_peak": traced_peak,
+}}))
+"""
+
+
+def percentile(ordered: List[float], share: float) -> float:
+    return ordered[min(len(ordered) - 1, int(share * len(ordered)))]
+
+
+async def measure_endpoint(
+    client: SporeClient,
+    request: Callable[[SporeClient, int], Awaitable[Any]],
+    count: int,
+    concurrency: int,
+) -> Dict[str, Any]:
+    indexes = iter(range(count))
+    latencies: List[float] = []
+    errors = 0
+
+    async def work() -> None:
+        nonlocal errors
+
+        for index in indexes:
+            started_at = time.perf_counter()
+            try:
+                await request(client, index)
+            except Exception:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(work() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started_at
+
+    latencies.sort()
+    return {
+        "requests_per_second": count / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000 if latencies else None,
+        "p99_ms": percentile(latencies, 0.99) * 1000 if latencies else None,
+        "errors": errors,
+    }
+
+
+async def measure_client(
+    server: MockSporeServer,
+    count: int,
+    concurrency: int,
+) -> Dict[str, Dict[str, Any]]:
+    base_url = await server.start()
+    try:
+        async with SporeClient(base_url=base_url) as client:
+            return {
+                endpoint.value: await measure_endpoint(client, request, count, concurrency)
+                for endpoint, request in REQUESTS.items()
+            }
+    finally:
+        await server.close()
+
+
+def measure_parse_time(parse: Callable[[str], object], text: str, repeat: int) -> float:
+    timer = timeit.Timer(lambda: parse(text))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure_parsers(repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, make_document in PARSE_DOCUMENTS.items():
+        text = make_document()
+        results[name] = {
+            f"{module.__name__.rsplit('.', 1)[-1]}_ms": (
+                measure_parse_time(getattr(module, name), text, repeat) * 1000
+            )
+            for module in (parsers, iterparsers)
+        }
+    return results
+
+
+def measure_rss(lengths: List[int]) -> Optional[Dict[str, Dict[str, Any]]]:
+    try:
+        import resource  # noqa: F401
+    except ImportError:
+        return None
+
+    results: Dict[str, Dict[str, Any]] = {}
+    for backend in ("parsers", "iterparsers"):
+        results[backend] = {}
+        for length in lengths:
+            process = subprocess.run(
+                [sys.executable, "-c", RSS_SCRIPT.format(backend=backend, length=length)],
+                stdout=subprocess.PIPE,
+                universal_newlines=True,
+                check=True,
+                cwd=Path(__file__).parent.parent,
+            )
+            results[backend][str(length)] = json.loads(process.stdout)
+    return results
+
+
+def main(
+    count: int,
+    concurrency: int,
+    latency: float,
+    error_rate: float,
+    lengths: List[int],
+    repeat: int,
+    output: str,
+) -> None:
+    server = MockSporeServer(latency=latency, error_rate=error_rate, seed=0)
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "requests": count,
+            "concurrency": concurrency,
+            "latency": latency,
+            "error_rate": error_rate,
+        },
+        "client": asyncio.run(measure_client(server, count, concurrency)),
+        "parse": measure_parsers(repeat),
+        "rss": measure_rss(lengths),
+    }
+
+    print(f"{'endpoint':<18}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for name, result in results["client"].items():  # type: ignore
+        print(
+            f"{name:<18}{result['requests_per_second']:>10.0f}"
+            f"{result['p50_ms'] or 0:>10.2f}{result['p99_ms'] or 0:>10.2f}{result['errors']:>8}"
+        )
+
+    print(f"\n{'parser':<24}{'xmltodict ms':>14}{'iterparse ms':>14}")
+    for name, result in results["parse"].items():  # type: ignore
+        print(f"{name:<24}{result['parsers_ms']:>14.3f}{result['iterparsers_ms']:>14.3f}")
+
+    if results["rss"] is not None:
+        print(
+            f"\n{'parse_assets length':<22}{'xmltodict':>26}{'iterparse':>26}"
+            f"\n{'':<22}{'peak RSS MiB':>14}{'traced KiB':>12}"
+            f"{'peak RSS MiB':>14}{'traced KiB':>12}"
+        )
+        for length in lengths:
+            print(
+                f"{length:<22}"
+                + "".join(
+                    f"{memory['peak_rss'] / 2 ** 20:>14.1f}{memory['traced_peak'] / 1024:>12.0f}"
+                    for memory in (
+                        results["rss"][backend][str(length)]  # type: ignore
+                        for backend in ("parsers", "iterparsers")
+                    )
+                )
+            )
+
+    if output:
+        with open(output, "w") as fp:
+            json.dump(results, fp, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500, help="Requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds added by the server")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[10, 100, 1000, 10_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="", help="JSON file for the results")
+    arguments = parser.parse_args()
+
+    main(
+        arguments.requests,
+        arguments.concurrency,
+        arguments.latency,
+        arguments.error_rate,
+        arguments.lengths,
+        arguments.repeat,
+        arguments.output,
+    )
@@ -0,0 +1,48 @@
+"""
+Compare `datatime_from_string` with `datetime.strptime`:
+
+    python -m benchmarks.bench_datetime
+"""
+
+import argparse
+import timeit
+from datetime import datetime
+from typing import Callable, List
+
+from spore_api.utils import DATETIME_FORMAT, datatime_from_string
+
+
+def measure(parse: Callable[[str], datetime], strings: List[str], repeat: int) -> float:
+    """Seconds per string"""
+    timer = timeit.Timer(lambda: [parse(string) for string in strings])
+    return min(timer.repeat(repeat=repeat, number=1)) / len(strings)
+
+
+def main(count: int, repeat: int) -> None:
+    # Unique timestamps with fractions of 1 to 6 digits, as they come from the API
+    unique_strings = [
+        f"20{index % 20:02d}-06-13 10:{index % 60:02d}:{index // 60 % 60:02d}"
+        f".{index % 999_999 + 1}"
+        for index in range(count)
+    ]
+
+    results = {
+        "strptime": measure(
+            lambda string: datetime.strptime(string, DATETIME_FORMAT),
+            unique_strings,
+            repeat,
+        ),
+        "fast": measure(datatime_from_string, unique_strings, repeat),
+    }
+
+    for name, seconds in results.items():
+        print(f"{name:<16}{seconds * 1e9:>10.0f} ns{results['strptime'] / seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    arguments = parser.parse_args()
+
+    main(arguments.count, arguments.repeat)
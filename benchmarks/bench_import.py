@@ -0,0 +1,93 @@
+"""
+Measure the import time of the package and the CLI startup with `-X importtime`:
+
+    python -m benchmarks.bench_import --output import_time.json
+
+Keep the JSON files of releases to compare them.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Any, Dict, List, Tuple
+
+
+TARGETS: Dict[str, List[str]] = {
+    "import spore_api": ["-c", "import spore_api"],
+    "import spore_api.client": ["-c", "import spore_api.client"],
+    "spore_cli --help": ["-m", "spore_api", "--help"],
+}
+
+
+def measure_once(arguments: List[str]) -> Dict[str, int]:
+    """Self import time of every module in microseconds"""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *arguments],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    times: Dict[str, int] = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_time, _, module = line[len("import time:"):].split("|")
+        if self_time.strip().isdigit():
+            times[module.strip()] = int(self_time)
+
+    return times
+
+
+def measure(arguments: List[str], repeat: int) -> Dict[str, Any]:
+    runs = [measure_once(arguments) for _ in range(repeat)]
+    totals = [sum(times.values()) for times in runs]
+
+    # The run with the median total, modules sorted by self time
+    median_run = runs[totals.index(sorted(totals)[len(totals) // 2])]
+    heaviest: List[Tuple[str, int]] = sorted(
+        median_run.items(),
+        key=lambda item: item[1],
+        reverse=True,
+    )
+
+    return {
+        "total_us": statistics.median(totals),
+        "min_total_us": min(totals),
+        "modules": len(median_run),
+        "heaviest": dict(heaviest[:10]),
+    }
+
+
+def main(repeat: int, output: str) -> None:
+    results = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeat": repeat,
+        "targets": {
+            name: measure(arguments, repeat)
+            for name, arguments in TARGETS.items()
+        },
+    }
+
+    for name, result in results["targets"].items():  # type: ignore
+        print(f"{name:<26}{result['total_us'] / 1000:>8.1f} ms{result['modules']:>6} modules")
+        for module, self_time in list(result["heaviest"].items())[:3]:
+            print(f"    {module:<30}{self_time / 1000:>8.1f} ms")
+
+    if output:
+        with open(output, "w") as fp:
+            json.dump(results, fp, indent=2)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", default="", help="JSON file for the results")
+    arguments = parser.parse_args()
+
+    main(arguments.repeat, arguments.output)
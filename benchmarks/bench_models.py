@@ -0,0 +1,87 @@
+"""
+Memory of the regular and the compact models, per million instances:
+
+    python -m benchmarks.bench_models
+"""
+
+import argparse
+import gc
+import tracemalloc
+from typing import Any, Callable, List
+
+from spore_api import (
+    Asset,
+    Buddy,
+    Comment,
+    CompactAsset,
+    CompactBuddy,
+    CompactComment,
+    CompactCreature,
+    Creature,
+    parsers,
+)
+
+from .fixtures import assets_document
+
+
+def measure_instances(build: Callable[[int], Any], count: int) -> int:
+    """Bytes allocated for `count` instances, excluding their values"""
+    # The first calls allocate caches (e.g. of `dataclasses.fields`),
+    # and the list of the instances is not counted
+    for index in range(100):
+        build(index)
+    instances: List[Any] = [None] * count
+
+    tracemalloc.start()
+    try:
+        for index in range(count):
+            instances[index] = build(index)
+        # Garbage cycles left by building are not part of the instances
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+        del instances
+        return size
+    finally:
+        tracemalloc.stop()
+
+
+def main(count: int) -> None:
+    # Field values are shared between instances to measure the objects only
+    asset = parsers.parse_assets(assets_document(1)).assets[0]
+    creature_values = [0] + [1.0] * 23
+
+    models = {
+        "Asset": (
+            lambda _: Asset(**asset.__dict__),
+            lambda _: CompactAsset.from_model(asset),
+        ),
+        "Creature": (
+            lambda _: Creature(*creature_values),
+            lambda _: CompactCreature(*creature_values),
+        ),
+        "Comment": (
+            lambda _: Comment("message", "sender"),
+            lambda _: CompactComment("message", "sender"),
+        ),
+        "Buddy": (
+            lambda _: Buddy(0, "name"),
+            lambda _: CompactBuddy(0, "name"),
+        ),
+    }
+
+    print(f"{'model':<10}{'regular MiB/1M':>16}{'compact MiB/1M':>16}{'saved':>8}")
+    for name, (build_regular, build_compact) in models.items():
+        regular = measure_instances(build_regular, count) * 1_000_000 / count
+        compact = measure_instances(build_compact, count) * 1_000_000 / count
+        print(
+            f"{name:<10}{regular / 2 ** 20:>16.1f}{compact / 2 ** 20:>16.1f}"
+            f"{1 - compact / regular:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    arguments = parser.parse_args()
+
+    main(arguments.count)
@@ -0,0 +1,66 @@
+"""
+Compare parser backends on large pages:
+
+    python -m benchmarks.bench_parsers --lengths 100 1000 10000
+"""
+
+import argparse
+import timeit
+import tracemalloc
+from typing import Callable, List
+
+from spore_api import iterparsers, parsers
+
+from .fixtures import assets_document, buddies_document, comments_document
+
+
+DOCUMENTS = {
+    "parse_assets": assets_document,
+    "parse_buddies": buddies_document,
+    "parse_asset_comments": comments_document,
+}
+
+
+def measure_time(parse: Callable[[str], object], text: str, repeat: int) -> float:
+    timer = timeit.Timer(lambda: parse(text))
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def measure_peak_memory(parse: Callable[[str], object], text: str) -> int:
+    tracemalloc.start()
+    try:
+        parse(text)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main(lengths: List[int], repeat: int) -> None:
+    print(f"{'parser':<22}{'length':>8}{'xmltodict ms':>15}{'iterparse ms':>15}{'speedup':>9}"
+          f"{'xmltodict KiB':>15}{'iterparse KiB':>15}")
+
+    for name, make_document in DOCUMENTS.items():
+        for length in lengths:
+            text = make_document(length)
+            baseline, candidate = getattr(parsers, name), getattr(iterparsers, name)
+
+            baseline_time = measure_time(baseline, text, repeat)
+            candidate_time = measure_time(candidate, text, repeat)
+
+            print(
+                f"{name:<22}{length:>8}"
+                f"{baseline_time * 1000:>15.3f}{candidate_time * 1000:>15.3f}"
+                f"{baseline_time / candidate_time:>8.2f}x"
+                f"{measure_peak_memory(baseline, text) / 1024:>15.0f}"
+                f"{measure_peak_memory(candidate, text) / 1024:>15.0f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[10, 100, 1000, 10000])
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    main(arguments.lengths, arguments.repeat)
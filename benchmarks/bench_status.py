@@ -0,0 +1,53 @@
+"""
+CPU time of the separate regex status check, which is no longer
+run before parsing:
+
+    python -m benchmarks.bench_status
+"""
+
+import argparse
+import timeit
+from typing import List
+
+from spore_api import SporeClient, parsers
+
+from .fixtures import assets_document
+
+
+def measure(statement: str, namespace: dict, repeat: int) -> float:
+    timer = timeit.Timer(statement, globals=namespace)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def main(lengths: List[int], repeat: int) -> None:
+    client = SporeClient()
+    print(f"{'length':>8}{'regex check us':>16}{'no status us':>14}{'parse us':>12}{'saved':>8}")
+
+    for length in lengths:
+        text = assets_document(length)
+        namespace = {
+            "check": client.check_status_spore_api,
+            "parse": parsers.parse_assets,
+            "text": text,
+            # Worst case for the regex: the whole text is scanned
+            "text_without_status": text.replace("<status>1</status>", ""),
+        }
+
+        check_time = measure("check(text)", namespace, repeat)
+        scan_time = measure("check(text_without_status)", namespace, repeat)
+        parse_time = measure("parse(text)", namespace, repeat)
+
+        print(
+            f"{length:>8}{check_time * 1e6:>16.2f}{scan_time * 1e6:>14.2f}"
+            f"{parse_time * 1e6:>12.0f}{check_time / (check_time + parse_time):>8.2%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--lengths", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--repeat", type=int, default=5)
+    arguments = parser.parse_args()
+
+    main(arguments.lengths, arguments.repeat)
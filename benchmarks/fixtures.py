@@ -0,0 +1,138 @@
+"""
+Synthetic Spore REST API responses.
+Items of paged documents are numbered from `start`, so pages differ.
+"""
+
+
+def asset_xml(index: int, tags: str = "tag, other tag") -> str:
+    return (
+        "<asset>"
+        f"<id>{500000000000 + index}</id>"
+        f"<name>Asset {index}</name>"
+        f"<thumb>http://www.spore.com/static/thumb/500/{index}.png</thumb>"
+        f"<image>http://www.spore.com/static/image/500/{index}_lrg.png</image>"
+        "<author>MaxisCactus</author>"
+        f"<created>2015-06-13 10:11:{index % 60:02d}.{index % 1000:03d}</created>"
+        "<description>NULL</description>"
+        f"<tags>{tags}</tags>"
+        "<type>CREATURE</type>"
+        "<subtype>0x9ea3031a</subtype>"
+        "<rating>1.5</rating>"
+        "<parent>NULL</parent>"
+        "</asset>"
+    )
+
+
+def assets_document(length: int, start: int = 0) -> str:
+    items = "".join(asset_xml(index) for index in range(start, start + length))
+    return f"<assets><status>1</status><input>MaxisCactus</input>{items}</assets>"
+
+
+def buddies_document(length: int, start: int = 0) -> str:
+    items = "".join(
+        f"<buddy><name>user{index}</name><id>{index}</id></buddy>"
+        for index in range(start, start + length)
+    )
+    return (
+        "<users><status>1</status><input>MaxisCactus</input>"
+        f"<count>{length}</count>{items}</users>"
+    )
+
+
+def comments_document(length: int, start: int = 0) -> str:
+    items = "".join(
+        f"<comment><message>Comment number {index}</message>"
+        f"<sender>user{index}</sender></comment>"
+        for index in range(start, start + length)
+    )
+    return (
+        "<comments><status>1</status><input>500000000000</input>"
+        f"<name>Asset</name>{items}</comments>"
+    )
+
+
+def stats_document() -> str:
+    return (
+        "<stats><status>1</status>"
+        "<totalUploads>191408154</totalUploads><dayUploads>1472</dayUploads>"
+        "<totalUsers>4521360</totalUsers><dayUsers>103</dayUsers>"
+        "</stats>"
+    )
+
+
+def creature_document(asset_id: int) -> str:
+    stats = "".join(
+        f"<{name}>{index + asset_id % 7}.5</{name}>"
+        for index, name in enumerate((
+            "health", "height", "meanness", "cuteness", "sense", "bonecount",
+            "footcount", "graspercount", "basegear", "carnivore", "herbivore",
+            "glide", "sprint", "stealth", "bite", "charge", "strike", "spit",
+            "sing", "dance", "gesture", "posture",
+        ))
+    )
+    return (
+        f"<creature><status>1</status><input>{asset_id}</input>"
+        f"<cost>{asset_id % 5000}</cost>{stats}</creature>"
+    )
+
+
+def user_document(username: str) -> str:
+    return (
+        f"<user><status>1</status><input>{username}</input><id>2262951765</id>"
+        "<image>http://www.spore.com/static/avatar/226/2262951765.png</image>"
+        "<tagline>Creating things</tagline><creation>2008-06-17 19:34:53.0</creation>"
+        "</user>"
+    )
+
+
+def sporecasts_document(length: int) -> str:
+    items = "".join(
+        "<sporecast>"
+        f"<id>{500190457259 + index}</id><title>Sporecast {index}</title>"
+        "<subtitle>Creatures</subtitle><author>MaxisCactus</author>"
+        f"<updated>2012-02-02 02:02:{index % 60:02d}.2</updated><rating>2.0</rating>"
+        f"<subscriptioncount>{index * 3}</subscriptioncount><tags>cute, creepy</tags>"
+        f"<count>{index}</count>"
+        "</sporecast>"
+        for index in range(length)
+    )
+    return f"<sporecasts><status>1</status><input>MaxisCactus</input>{items}</sporecasts>"
+
+
+def sporecast_assets_document(length: int, start: int = 0) -> str:
+    items = "".join(
+        asset_xml(index, tags="tag,other tag")
+        for index in range(start, start + length)
+    )
+    return (
+        "<assets><status>1</status><input>500190457259</input>"
+        f"<name>Sporecast</name>{items}</assets>"
+    )
+
+
+def achievements_document(length: int, start: int = 0) -> str:
+    items = "".join(
+        "<achievement><guid>0x0cc8b2c9!0x7e1737dc</guid>"
+        f"<date>2010-01-01 00:00:{index % 60:02d}.0</date></achievement>"
+        for index in range(start, start + length)
+    )
+    return f"<achievements><status>1</status><input>MaxisCactus</input>{items}</achievements>"
+
+
+def full_asset_document(asset_id: int, comments: int = 10) -> str:
+    items = "".join(
+        f"<comment><message>Comment number {index}</message><sender>user{index}</sender>"
+        "<date>2015-06-13 10:11:12.5</date></comment>"
+        for index in range(comments)
+    )
+    return (
+        f"<asset><status>1</status><input>{asset_id}</input><name>Asset</name>"
+        "<author>MaxisCactus</author><authorid>2262951765</authorid>"
+        "<created>2015-06-13 10:11:12.5</created><description>NULL</description>"
+        "<tags>tag,other tag</tags><type>CREATURE</type><subtype>0x9ea3031a</subtype>"
+        f"<rating>1.5</rating><parent>NULL</parent><comments>{items}</comments></asset>"
+    )
+
+
+def status_error_document(root_tag: str) -> str:
+    return f"<{root_tag}><status>0</status></{root_tag}>"
@@ -0,0 +1,235 @@
+"""
+Local stand-in for the Spore REST API, serving the documents of `fixtures`
+or recorded responses, with injected latency and errors:
+
+    python -m benchmarks.mock_server --port 8080 --latency 0.05 --error-rate 0.01
+
+Recorded responses are read from `<fixtures-dir>/<endpoint>.xml`
+(e.g. `creature.xml`) and replayed for every request of the endpoint.
+No recordings are shipped, see benchmarks/README.md.
+"""
+
+import argparse
+import asyncio
+import random
+from functools import lru_cache
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, Optional, Tuple, Union
+
+from aiohttp import web
+
+from spore_api.enums import Endpoint
+
+from . import fixtures
+
+
+# Root tags of the documents, for injected Spore API status errors
+ROOT_TAGS = {
+    Endpoint.stats: "stats",
+    Endpoint.creature: "creature",
+    Endpoint.user: "user",
+    Endpoint.user_assets: "assets",
+    Endpoint.sporecasts: "sporecasts",
+    Endpoint.sporecast_assets: "assets",
+    Endpoint.achievements: "achievements",
+    Endpoint.asset: "asset",
+    Endpoint.comments: "comments",
+    Endpoint.buddies: "users",
+    Endpoint.subscribers: "users",
+    Endpoint.search: "assets",
+}
+
+
+class MockSporeServer():
+    """
+    Every response is delayed by `latency` plus up to `jitter` seconds.
+    A share of `error_rate` of requests get a 503 response, and a share
+    of `status_error_rate` a document with the Spore API status 0.
+    Paged endpoints have `total_items` distinct items, served by `start` and `length`.
+    """
+    def __init__(
+        self,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        status_error_rate: float = 0.0,
+        total_items: int = 10_000,
+        fixtures_dir: Optional[Union[str, Path]] = None,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.status_error_rate = status_error_rate
+        self.total_items = total_items
+        self.requests = 0
+        self.injected_errors = 0
+        self._random = random.Random(seed)
+        self._recorded: Dict[Endpoint, str] = {}
+        self._runner: Optional[web.AppRunner] = None
+
+        if fixtures_dir is not None:
+            for endpoint in Endpoint:
+                path = Path(fixtures_dir, f"{endpoint.value}.xml")
+                if path.exists():
+                    self._recorded[endpoint] = path.read_text(encoding="utf-8")
+
+    def make_app(self) -> web.Application:
+        page = self._page
+        routes = {
+            "/rest/stats": (Endpoint.stats, lambda info: fixtures.stats_document()),
+            "/rest/creature/{asset_id}": (
+                Endpoint.creature,
+                lambda info: _creature_document(int(info["asset_id"])),
+            ),
+            "/rest/user/{username}": (
+                Endpoint.user,
+                lambda info: fixtures.user_document(info["username"]),
+            ),
+            "/rest/assets/user/{username}/{start}/{length}": (
+                Endpoint.user_assets,
+                lambda info: _assets_document(*page(info)),
+            ),
+            "/rest/sporecasts/{username}": (
+                Endpoint.sporecasts,
+                lambda info: _sporecasts_document(10),
+            ),
+            "/rest/assets/sporecast/{sporecast_id}/{start}/{length}": (
+                Endpoint.sporecast_assets,
+                lambda info: _sporecast_assets_document(*page(info)),
+            ),
+            "/rest/achievements/{username}/{start}/{length}": (
+                Endpoint.achievements,
+                lambda info: _achievements_document(*page(info)),
+            ),
+            "/rest/asset/{asset_id}": (
+                Endpoint.asset,
+                lambda info: _full_asset_document(int(info["asset_id"])),
+            ),
+            "/rest/comments/{asset_id}/{start}/{length}": (
+                Endpoint.comments,
+                lambda info: _comments_document(*page(info)),
+            ),
+            "/rest/users/buddies/{username}/{start}/{length}": (
+                Endpoint.buddies,
+                lambda info: _buddies_document(*page(info)),
+            ),
+            "/rest/users/subscribers/{username}/{start}/{length}": (
+                Endpoint.subscribers,
+                lambda info: _buddies_document(*page(info)),
+            ),
+            "/rest/assets/search/{view_type}/{start}/{length}": (
+                Endpoint.search,
+                lambda info: _assets_document(*page(info)),
+            ),
+            "/rest/assets/search/{view_type}/{start}/{length}/{asset_type}": (
+                Endpoint.search,
+                lambda info: _assets_document(*page(info)),
+            ),
+        }
+
+        app = web.Application()
+        for path, (endpoint, make_document) in routes.items():
+            app.router.add_get(path, self._make_handler(endpoint, make_document))
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Start serving, return the base url for `SporeClient(base_url=...)`"""
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+        address = self._runner.addresses[0]
+        return f"http://{address[0]}:{address[1]}"
+
+    async def close(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def _make_handler(
+        self,
+        endpoint: Endpoint,
+        make_document: Callable[[Dict[str, str]], str],
+    ) -> Callable[[web.Request], Awaitable[web.Response]]:
+        async def handle(request: web.Request) -> web.Response:
+            self.requests += 1
+
+            delay = self.latency + self._random.uniform(0, self.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            roll = self._random.random()
+            if roll < self.error_rate:
+                self.injected_errors += 1
+                return web.Response(status=503)
+            if roll < self.error_rate + self.status_error_rate:
+                self.injected_errors += 1
+                text = fixtures.status_error_document(ROOT_TAGS[endpoint])
+            else:
+                text = self._recorded.get(endpoint) or make_document(dict(request.match_info))
+
+            return web.Response(text=text, content_type="text/xml")
+
+        return handle
+
+    def _page(self, info: Dict[str, str]) -> Tuple[int, int]:
+        """
+        Count and start of the items of a page, of `total_items` items.
+        Pages are short at the end and empty past it
+        """
+        start = max(0, int(info["start"]))
+        return max(0, min(int(info["length"]), self.total_items - start)), start
+
+
+# Documents are cached, so the server doesn't spend its time building them.
+# Paged documents are cached by start too
+
+_assets_document = lru_cache(1024)(fixtures.assets_document)
+_sporecasts_document = lru_cache(64)(fixtures.sporecasts_document)
+_sporecast_assets_document = lru_cache(1024)(fixtures.sporecast_assets_document)
+_achievements_document = lru_cache(1024)(fixtures.achievements_document)
+_comments_document = lru_cache(1024)(fixtures.comments_document)
+_buddies_document = lru_cache(1024)(fixtures.buddies_document)
+_creature_document = lru_cache(4096)(fixtures.creature_document)
+_full_asset_document = lru_cache(4096)(fixtures.full_asset_document)
+
+
+async def serve(server: MockSporeServer, host: str, port: int) -> None:
+    print(f"Serving on {await server.start(host, port)}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--status-error-rate", type=float, default=0.0)
+    parser.add_argument("--total-items", type=int, default=10_000)
+    parser.add_argument("--fixtures-dir")
+    arguments = parser.parse_args()
+
+    try:
+        asyncio.run(serve(
+            MockSporeServer(
+                latency=arguments.latency,
+                jitter=arguments.jitter,
+                error_rate=arguments.error_rate,
+                status_error_rate=arguments.status_error_rate,
+                total_items=arguments.total_items,
+                fixtures_dir=arguments.fixtures_dir,
+            ),
+            arguments.host,
+            arguments.port,
+        ))
+    except KeyboardInterrupt:
+        pass
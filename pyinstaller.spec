@@ -8,7 +8,7 @@ a = Analysis(
     ["spore_api/__main__.py"],
     pathex=[],
     binaries=[],
-    datas=[],
+    datas=[("spore_api/static", "spore_api/static")],
     hiddenimports=[],
     hookspath=[],
     hooksconfig={},
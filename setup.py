@@ -14,7 +14,15 @@ setup(
     version="1.1.1",
     description="Spore REST API client",
     install_requires=requirements,
+    extras_require={
+        "fast": ["orjson"],
+        "numpy": ["numpy"],
+        "parquet": ["numpy", "pyarrow"],
+        "prometheus": ["prometheus_client"],
+        "opentelemetry": ["opentelemetry-api"],
+    },
     packages=["spore_api"],
+    package_data={"spore_api": ["static/*.json"]},
     license="MIT",
     long_description=long_description,
     long_description_content_type="text/markdown",
@@ -1,47 +1,204 @@
-from spore_api.client import (
-    SporeClient,
-)
-from spore_api.constants import (
-    BASE_URL,
-)
-from spore_api.enums import (
-    AssetSubtype,
-    AssetType,
-    ViewType,
-)
-from spore_api.errors import (
-    SporeApiStatusError,
-)
-from .parsers import (
-    parse_stats,
-    parse_creature,
-    parse_user,
-    parse_assets,
-    parse_sporecasts,
-    parse_sporecast_assets,
-    parse_achievements,
-    parse_full_asset,
-    parse_asset_comments,
-    parse_buddies,
-)
-from spore_api.models import (
-    Achievement,
-    Achievements,
-    Asset,
-    AssetComments,
-    Assets,
-    Buddies,
-    Buddy,
-    Comment,
-    Comments,
-    Creature,
-    FullAsset,
-    Sporecast,
-    SporecastAssets,
-    Sporecasts,
-    Stats,
-    User,
-)
-from spore_api.utils import (
-    datatime_from_string,
-)
+import importlib
+from typing import TYPE_CHECKING, Any, Dict, List
+
+
+# Names are imported from their modules on first access,
+# so `import spore_api` and the CLI don't load aiohttp, xmltodict
+# and dataclasses_json until they are used
+_EXPORTS: Dict[str, str] = {
+    "get_achievement_catalog": "achievements",
+    "reload_achievement_catalog": "achievements",
+    "CacheBackend": "cache",
+    "CacheEntry": "cache",
+    "MemoryCache": "cache",
+    "SQLiteCache": "cache",
+    "SporeClient": "client",
+    "create_connector": "client",
+    "BASE_URL": "constants",
+    "BloomFilter": "crawler",
+    "BuddyGraph": "crawler",
+    "BuddyGraphCrawler": "crawler",
+    "CSRGraph": "crawler",
+    "IdSet": "crawler",
+    "AssetSubtype": "enums",
+    "AssetType": "enums",
+    "CacheOutcome": "enums",
+    "Endpoint": "enums",
+    "ParserBackend": "enums",
+    "ViewType": "enums",
+    "SporeApiStatusError": "errors",
+    "NewAssetsFeed": "feed",
+    "Observer": "instrumentation",
+    "OpenTelemetryObserver": "instrumentation",
+    "PrometheusObserver": "instrumentation",
+    "RequestMetrics": "instrumentation",
+    "create_trace_config": "instrumentation",
+    "SporeMirror": "mirror",
+    "parse_stats": "parsers",
+    "parse_creature": "parsers",
+    "parse_user": "parsers",
+    "parse_assets": "parsers",
+    "parse_sporecasts": "parsers",
+    "parse_sporecast_assets": "parsers",
+    "parse_achievements": "parsers",
+    "parse_full_asset": "parsers",
+    "parse_asset_comments": "parsers",
+    "parse_buddies": "parsers",
+    "Achievement": "models",
+    "Achievements": "models",
+    "Asset": "models",
+    "AssetComments": "models",
+    "Assets": "models",
+    "BatchResult": "models",
+    "Buddies": "models",
+    "Buddy": "models",
+    "Comment": "models",
+    "Comments": "models",
+    "CompactAsset": "models",
+    "CompactBuddy": "models",
+    "CompactComment": "models",
+    "CompactCreature": "models",
+    "CompactModel": "models",
+    "Creature": "models",
+    "FullAsset": "models",
+    "Sporecast": "models",
+    "SporecastAssets": "models",
+    "Sporecasts": "models",
+    "Stats": "models",
+    "User": "models",
+    "dumps": "serialization",
+    "get_encoder": "serialization",
+    "to_jsonable": "serialization",
+    "write_json_array": "serialization",
+    "write_json_lines": "serialization",
+    "HedgePolicy": "retry",
+    "RetryPolicy": "retry",
+    "AdaptiveConcurrency": "throttling",
+    "RateLimiter": "throttling",
+    "TokenBucket": "throttling",
+    "datatime_from_string": "utils",
+    "endpoint_from_url": "utils",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_EXPORTS))
+
+
+if TYPE_CHECKING:
+    from spore_api.achievements import (
+        get_achievement_catalog,
+        reload_achievement_catalog,
+    )
+    from spore_api.cache import (
+        CacheBackend,
+        CacheEntry,
+        MemoryCache,
+        SQLiteCache,
+    )
+    from spore_api.client import (
+        SporeClient,
+        create_connector,
+    )
+    from spore_api.constants import (
+        BASE_URL,
+    )
+    from spore_api.crawler import (
+        BloomFilter,
+        BuddyGraph,
+        BuddyGraphCrawler,
+        CSRGraph,
+        IdSet,
+    )
+    from spore_api.enums import (
+        AssetSubtype,
+        AssetType,
+        CacheOutcome,
+        Endpoint,
+        ParserBackend,
+        ViewType,
+    )
+    from spore_api.errors import (
+        SporeApiStatusError,
+    )
+    from spore_api.feed import (
+        NewAssetsFeed,
+    )
+    from spore_api.instrumentation import (
+        Observer,
+        OpenTelemetryObserver,
+        PrometheusObserver,
+        RequestMetrics,
+        create_trace_config,
+    )
+    from spore_api.mirror import (
+        SporeMirror,
+    )
+    from spore_api.parsers import (
+        parse_stats,
+        parse_creature,
+        parse_user,
+        parse_assets,
+        parse_sporecasts,
+        parse_sporecast_assets,
+        parse_achievements,
+        parse_full_asset,
+        parse_asset_comments,
+        parse_buddies,
+    )
+    from spore_api.models import (
+        Achievement,
+        Achievements,
+        Asset,
+        AssetComments,
+        Assets,
+        BatchResult,
+        Buddies,
+        Buddy,
+        Comment,
+        Comments,
+        CompactAsset,
+        CompactBuddy,
+        CompactComment,
+        CompactCreature,
+        CompactModel,
+        Creature,
+        FullAsset,
+        Sporecast,
+        SporecastAssets,
+        Sporecasts,
+        Stats,
+        User,
+    )
+    from spore_api.serialization import (
+        dumps,
+        get_encoder,
+        to_jsonable,
+        write_json_array,
+        write_json_lines,
+    )
+    from spore_api.retry import (
+        HedgePolicy,
+        RetryPolicy,
+    )
+    from spore_api.throttling import (
+        AdaptiveConcurrency,
+        RateLimiter,
+        TokenBucket,
+    )
+    from spore_api.utils import (
+        datatime_from_string,
+        endpoint_from_url,
+    )
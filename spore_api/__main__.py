@@ -1,13 +1,22 @@
 #!/usr/bin/env python
 
-from typing import Optional
+import json
+import shlex
+import asyncio
+import functools
+from typing import IO, TYPE_CHECKING, Any, Awaitable, Callable, Optional
 import asyncclick as click
 
-from spore_api import SporeClient
-from spore_api import AssetType, ViewType
+# The client and the models are imported when a command runs,
+# so `--help` and argument errors don't wait for aiohttp and dataclasses_json
+from spore_api.enums import AssetType, ViewType
+from spore_api.constants import DEFAULT_CONCURRENCY
 
+if TYPE_CHECKING:
+    from spore_api.client import SporeClient
 
-_client = SporeClient()
+
+_Request = Callable[..., Awaitable[Any]]
 
 
 @click.group()
@@ -15,135 +24,248 @@ async def cli():
     """CLI for Spore REST API"""
 
 
+def _request(request: _Request) -> Callable[..., Awaitable[None]]:
+    """
+    Make a command callback from a request with a client,
+    the request is kept to be reused by `batch`
+    """
+    @functools.wraps(request)
+    async def command(**params: Any) -> None:
+        from spore_api.client import SporeClient
+        from spore_api.serialization import dumps
+
+        async with SporeClient() as client:
+            click.echo(dumps(await request(client, **params)))
+
+    command.request = request  # type: ignore
+    return command
+
+
+@cli.command()
+@click.argument("file", type=click.File("r"), default="-")
+@click.option(
+    "--command",
+    "command_name",
+    help="Run this command with the arguments from each line, e.g. IDs",
+)
+@click.option("--concurrency", type=int, default=DEFAULT_CONCURRENCY, show_default=True)
+@click.pass_context
+async def batch(
+    context: click.Context,
+    file: IO[str],
+    command_name: Optional[str],
+    concurrency: int,
+):
+    """
+    Run commands from a file or stdin concurrently over one session.
+
+    Each line is a command with its arguments (`get-creature 500267423060`),
+    or the arguments of `--command`. Results are printed as JSON Lines
+    in the order of completion: `{"input": <line>, "result": <model>}`,
+    or `{"input": <line>, "error": <message>}` if the command failed.
+    """
+    if concurrency < 1:
+        raise click.BadParameter("must be positive", param_hint="--concurrency")
+
+    from spore_api.client import SporeClient
+    from spore_api.serialization import dumps
+
+    loop = asyncio.get_running_loop()
+    lines: "asyncio.Queue[Optional[str]]" = asyncio.Queue(maxsize=concurrency * 2)
+    failed = False
+
+    async def read_lines() -> None:
+        # The input may be a pipe that is written slowly, don't block the loop
+        try:
+            while True:
+                line = await loop.run_in_executor(None, file.readline)
+                if not line:
+                    break
+                line = line.strip()
+                if line and not line.startswith("#"):
+                    await lines.put(line)
+        finally:
+            for _ in range(concurrency):
+                await lines.put(None)
+
+    async def run(client: "SporeClient", line: str) -> Any:
+        args = shlex.split(line)
+        if command_name is not None:
+            args.insert(0, command_name)
+
+        command = cli.get_command(context, args[0]) if args else None
+        request = getattr(getattr(command, "callback", None), "request", None)
+        if request is None:
+            raise click.UsageError(f"No such command: {args[0] if args else line!r}")
+
+        command_context = await command.make_context(  # type: ignore
+            args[0],
+            args[1:],
+            parent=context,
+        )
+        return await request(client, **command_context.params)
+
+    async def work(client: "SporeClient") -> None:
+        nonlocal failed
+
+        while True:
+            line = await lines.get()
+            if line is None:
+                return
+
+            try:
+                result = await run(client, line)
+            except Exception as error:
+                failed = True
+                click.echo(json.dumps({"input": line, "error": _format_error(error)}))
+            else:
+                click.echo(f'{{"input": {json.dumps(line)}, "result": {dumps(result)}}}')
+
+    async with SporeClient(limit=concurrency) as client:
+        reader = asyncio.ensure_future(read_lines())
+        try:
+            await asyncio.gather(*(work(client) for _ in range(concurrency)))
+        finally:
+            reader.cancel()
+
+    if failed:
+        raise click.exceptions.Exit(1)
+
+
+def _format_error(error: Exception) -> str:
+    if isinstance(error, click.ClickException):
+        return error.format_message()
+    return f"{type(error).__name__}: {error}"
+
+
 @cli.command(help="Get stats")
-async def get_stats():
-    async with _client as client:
-        result = await client.get_stats()
-        click.echo(result.to_json())
+@_request
+async def get_stats(client: "SporeClient"):
+    return await client.get_stats()
 
 
 @cli.command(help="Get creature")
 @click.argument("asset_id", type=int)
-async def get_creature(asset_id: int):
-    async with _client as client:
-        result = await client.get_creature(
-            asset_id=asset_id
-        )
-        click.echo(result.to_json())
+@_request
+async def get_creature(client: "SporeClient", asset_id: int):
+    return await client.get_creature(
+        asset_id=asset_id
+    )
 
 
 @cli.command(help="Get user information")
 @click.argument("username", type=str)
-async def get_user_info(username: str):
-    async with _client as client:
-        result = await client.get_user_info(
-            username=username
-        )
-        click.echo(result.to_json())
+@_request
+async def get_user_info(client: "SporeClient", username: str):
+    return await client.get_user_info(
+        username=username
+    )
 
 
 @cli.command(help="Get creature of the user")
 @click.argument("username", type=str)
 @click.argument("start_index", type=int, default=1)
 @click.argument("length", type=int, default=10)
-async def get_user_assets(username: str, start_index: int, length: int):
-    async with _client as client:
-        result = await client.get_user_assets(
-            username=username,
-            start_index=start_index,
-            length=length
-        )
-        click.echo(result.to_json())
+@_request
+async def get_user_assets(client: "SporeClient", username: str, start_index: int, length: int):
+    return await client.get_user_assets(
+        username=username,
+        start_index=start_index,
+        length=length
+    )
 
 
 @cli.command(help="Get sporecasts of the user")
 @click.argument("username", type=str)
-async def get_user_sporecasts(username: str):
-    async with _client as client:
-        result = await client.get_user_sporecasts(
-            username=username
-        )
-        click.echo(result.to_json())
+@_request
+async def get_user_sporecasts(client: "SporeClient", username: str):
+    return await client.get_user_sporecasts(
+        username=username
+    )
 
 
 @cli.command(help="Get achievements of the user")
 @click.argument("username", type=str)
 @click.argument("start_index", type=int, default=1)
 @click.argument("length", type=int, default=10)
-async def get_user_achievements(username: str, start_index: int, length: int):
-    async with _client as client:
-        result = await client.get_user_achievements(
-            username=username,
-            start_index=start_index,
-            length=length
-        )
-        click.echo(result.to_json())
+@_request
+async def get_user_achievements(
+    client: "SporeClient",
+    username: str,
+    start_index: int,
+    length: int,
+):
+    return await client.get_user_achievements(
+        username=username,
+        start_index=start_index,
+        length=length
+    )
 
 
 @cli.command(help="Get buddies of the user")
 @click.argument("username", type=str)
 @click.argument("start_index", type=int, default=1)
 @click.argument("length", type=int, default=10)
-async def get_user_buddies(username: str, start_index: int, length: int):
-    async with _client as client:
-        result = await client.get_user_buddies(
-            username=username,
-            start_index=start_index,
-            length=length
-        )
-        click.echo(result.to_json())
+@_request
+async def get_user_buddies(client: "SporeClient", username: str, start_index: int, length: int):
+    return await client.get_user_buddies(
+        username=username,
+        start_index=start_index,
+        length=length
+    )
 
 
 @cli.command(help="Get subscribers of the user")
 @click.argument("username", type=str)
 @click.argument("start_index", type=int, default=1)
 @click.argument("length", type=int, default=10)
-async def get_user_subscribers(username: str, start_index: int, length: int):
-    async with _client as client:
-        result = await client.get_user_subscribers(
-            username=username,
-            start_index=start_index,
-            length=length
-        )
-        click.echo(result.to_json())
+@_request
+async def get_user_subscribers(client: "SporeClient", username: str, start_index: int, length: int):
+    return await client.get_user_subscribers(
+        username=username,
+        start_index=start_index,
+        length=length
+    )
 
 
 @cli.command(help="Get asset information")
 @click.argument("asset_id", type=int)
-async def get_asset_info(asset_id: int):
-    async with _client as client:
-        result = await client.get_asset_info(
-            asset_id=asset_id
-        )
-        click.echo(result.to_json())
+@_request
+async def get_asset_info(client: "SporeClient", asset_id: int):
+    return await client.get_asset_info(
+        asset_id=asset_id
+    )
 
 
 @cli.command(help="Get comments of the asset")
 @click.argument("asset_id", type=int)
 @click.argument("start_index", type=int, default=1)
 @click.argument("length", type=int, default=10)
-async def get_asset_comments(asset_id: int, start_index: int, length: int):
-    async with _client as client:
-        result = await client.get_asset_comments(
-            asset_id=asset_id,
-            start_index=start_index,
-            length=length
-        )
-        click.echo(result.to_json())
+@_request
+async def get_asset_comments(client: "SporeClient", asset_id: int, start_index: int, length: int):
+    return await client.get_asset_comments(
+        asset_id=asset_id,
+        start_index=start_index,
+        length=length
+    )
 
 
 @cli.command(help="Get assets of the sporecast")
 @click.argument("sporecast_id", type=int)
 @click.argument("start_index", type=int, default=1)
 @click.argument("length", type=int, default=10)
-async def get_sporecast_assets(sporecast_id: int, start_index: int, length: int):
-    async with _client as client:
-        result = await client.get_sporecast_assets(
-            sporecast_id=sporecast_id,
-            start_index=start_index,
-            length=length
-        )
-        click.echo(result.to_json())
+@_request
+async def get_sporecast_assets(
+    client: "SporeClient",
+    sporecast_id: int,
+    start_index: int,
+    length: int,
+):
+    return await client.get_sporecast_assets(
+        sporecast_id=sporecast_id,
+        start_index=start_index,
+        length=length
+    )
 
 
 @cli.command(help="Search assets")
@@ -158,19 +280,24 @@ async def get_sporecast_assets(sporecast_id: int, start_index: int, length: int)
     type=click.Choice(AssetType._member_names_, case_sensitive=False),
     required=False
 )
-async def search_assets(view_type: str, start_index: int, length: int, asset_type: Optional[str]):
-    async with _client as client:
-        result = await client.search_assets(
-            view_type=ViewType[view_type],
-            start_index=start_index,
-            length=length,
-            asset_type=(
-                asset_type
-                if asset_type is None else
-                AssetType[asset_type]
-            )
+@_request
+async def search_assets(
+    client: "SporeClient",
+    view_type: str,
+    start_index: int,
+    length: int,
+    asset_type: Optional[str],
+):
+    return await client.search_assets(
+        view_type=ViewType[view_type],
+        start_index=start_index,
+        length=length,
+        asset_type=(
+            asset_type
+            if asset_type is None else
+            AssetType[asset_type]
         )
-        click.echo(result.to_json())
+    )
 
 
 if __name__ == "__main__":
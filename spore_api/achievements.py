@@ -0,0 +1,36 @@
+import json
+import pkgutil
+from typing import Any, Dict, Optional
+
+
+_catalog: Optional[Dict[str, Dict[str, Any]]] = None
+
+
+def get_achievement_catalog() -> Dict[str, Dict[str, Any]]:
+    """
+    Achievements data from `static/achievements.json` by guid.
+    Loaded once from package resources on first use.
+    """
+    global _catalog
+
+    if _catalog is None:
+        _catalog = _load_achievement_catalog()
+    return _catalog
+
+
+def reload_achievement_catalog() -> Dict[str, Dict[str, Any]]:
+    global _catalog
+
+    _catalog = _load_achievement_catalog()
+    return _catalog
+
+
+def _load_achievement_catalog() -> Dict[str, Dict[str, Any]]:
+    raw_data = pkgutil.get_data(__package__, "static/achievements.json")
+    if raw_data is None:
+        raise FileNotFoundError("Achievements data is not found")
+
+    return {
+        achievement["id"]: achievement
+        for achievement in json.loads(raw_data)
+    }
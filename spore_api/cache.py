@@ -0,0 +1,178 @@
+import time
+import sqlite3
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Union
+
+
+@dataclass
+class CacheEntry():
+    text: str
+    expires_at: Optional[float]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    @property
+    def revalidatable(self) -> bool:
+        """The entry can be revalidated with a conditional request"""
+        return self.etag is not None or self.last_modified is not None
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and self.expires_at <= time.time()
+
+
+class CacheBackend(ABC):
+    """
+    Storage of response texts by url.
+    Expired entries are kept to be revalidated, the client
+    counts hits (fresh or revalidated entries), misses and revalidations.
+    """
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        """Get the entry, fresh or expired"""
+        return self.load(key)
+
+    def set(
+        self,
+        key: str,
+        text: str,
+        ttl: Optional[float],
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> CacheEntry:
+        entry = CacheEntry(
+            text=text,
+            expires_at=None if ttl is None else time.time() + ttl,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self.store(key, entry)
+        return entry
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[CacheEntry]:
+        ...
+
+    @abstractmethod
+    def store(self, key: str, entry: CacheEntry) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class MemoryCache(CacheBackend):
+    """LRU cache bounded by the total size of the stored texts"""
+    def __init__(
+        self,
+        max_bytes: int = 64 * 1024 * 1024,
+        max_entries: Optional[int] = None,
+    ) -> None:
+        super().__init__()
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.size = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def store(self, key: str, entry: CacheEntry) -> None:
+        # The old entry is stale even if the new one is too large to keep
+        self.delete(key)
+        size = len(entry.text.encode())
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self._sizes[key] = size
+        self.size += size
+
+        while (
+            self.size > self.max_bytes
+            or (self.max_entries is not None and len(self._entries) > self.max_entries)
+        ):
+            self.delete(next(iter(self._entries)))
+
+    def delete(self, key: str) -> None:
+        if self._entries.pop(key, None) is not None:
+            self.size -= self._sizes.pop(key)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._sizes.clear()
+        self.size = 0
+
+
+class SQLiteCache(CacheBackend):
+    """Persistent cache in a SQLite database file"""
+    def __init__(self, path: Union[str, Path]) -> None:
+        super().__init__()
+        self._connection = sqlite3.connect(str(path))
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, text TEXT NOT NULL, expires_at REAL, "
+            "etag TEXT, last_modified TEXT)"
+        )
+        self._connection.commit()
+
+    def load(self, key: str) -> Optional[CacheEntry]:
+        row = self._connection.execute(
+            "SELECT text, expires_at, etag, last_modified FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        return CacheEntry(*row)
+
+    def store(self, key: str, entry: CacheEntry) -> None:
+        self._connection.execute(
+            "INSERT OR REPLACE INTO responses "
+            "(key, text, expires_at, etag, last_modified) VALUES (?, ?, ?, ?, ?)",
+            (key, entry.text, entry.expires_at, entry.etag, entry.last_modified),
+        )
+        self._connection.commit()
+
+    def delete(self, key: str) -> None:
+        self._connection.execute("DELETE FROM responses WHERE key = ?", (key,))
+        self._connection.commit()
+
+    def clear(self) -> None:
+        self._connection.execute("DELETE FROM responses")
+        self._connection.commit()
+
+    def purge_expired(self) -> None:
+        """Delete expired entries, including the ones that could be revalidated"""
+        self._connection.execute(
+            "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        )
+        self._connection.commit()
+
+    def close(self) -> None:
+        self._connection.close()
@@ -1,29 +1,60 @@
 import re
+import time
+import asyncio
+from collections import OrderedDict, deque
+from concurrent.futures import Executor
+from contextlib import asynccontextmanager
+from functools import partial
 from types import TracebackType
 from typing import (
     TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
     Optional,
+    Sequence,
+    Tuple,
     Type,
+    TypeVar,
     Union,
 )
 
 import aiohttp
 
 from .errors import SporeApiStatusError
-from .constants import BASE_URL
-from .enums import AssetType, ViewType
-from .parsers import (
-    parse_stats,
-    parse_creature,
-    parse_user,
-    parse_assets,
-    parse_sporecasts,
-    parse_sporecast_assets,
-    parse_achievements,
-    parse_full_asset,
-    parse_asset_comments,
-    parse_buddies,
+from .cache import CacheBackend
+from .throttling import AdaptiveConcurrency, RateLimiter
+from .retry import HedgePolicy, RetryPolicy
+from .constants import (
+    ACCEPT_ENCODING,
+    BASE_URL,
+    DEFAULT_CACHE_TTLS,
+    DEFAULT_COALESCED_ENDPOINTS,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_LIMIT,
+    DEFAULT_PAGE_SIZE,
+    DEFAULT_PARSE_OFFLOAD_THRESHOLD,
+    DEFAULT_READ_AHEAD,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_TOTAL_TIMEOUT,
 )
+from .enums import AssetType, CacheOutcome, Endpoint, ParserBackend, ViewType
+from .instrumentation import Observer, RequestMetrics, create_trace_config, current_metrics
+from .models import BatchResult
+from .utils import endpoint_from_url
+from .iterparsers import ElementStream
+from .parsers import build_asset, build_achievement, build_buddy, build_comment
+from . import iterparsers, parsers
 
 if TYPE_CHECKING:
     from .models import (
@@ -37,21 +68,193 @@ if TYPE_CHECKING:
         SporecastAssets,
         FullAsset,
         Sporecasts,
+        Asset,
+        Achievement,
+        Comment,
+        Buddy,
+    )
+
+
+_PageT = TypeVar("_PageT")
+_ItemT = TypeVar("_ItemT")
+_ResultT = TypeVar("_ResultT")
+
+
+class _Response(NamedTuple):
+    status: int
+    text: str
+    headers: Mapping[str, str]
+
+
+_PARSER_BACKENDS = {
+    ParserBackend.xmltodict: parsers,
+    ParserBackend.iterparse: iterparsers,
+}
+
+
+def create_connector(
+    *,
+    limit: int = DEFAULT_LIMIT,
+    limit_per_host: int = 0,
+    keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+    dns_cache_ttl: Optional[float] = DEFAULT_DNS_CACHE_TTL,
+) -> aiohttp.TCPConnector:
+    """
+    Connection pool with the client defaults, it can be shared
+    by several clients with `SporeClient(connector=...)`.
+    `dns_cache_ttl` None caches resolved hosts forever, 0 disables the cache.
+    Must be created in a running event loop.
+    """
+    return aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        keepalive_timeout=keepalive_timeout,
+        use_dns_cache=dns_cache_ttl != 0,
+        ttl_dns_cache=dns_cache_ttl,
     )
 
 
 class SporeClient():
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        limit: int = DEFAULT_LIMIT,
+        limit_per_host: int = 0,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        dns_cache_ttl: Optional[float] = DEFAULT_DNS_CACHE_TTL,
+        connector: Optional[aiohttp.BaseConnector] = None,
+        total_timeout: Optional[float] = DEFAULT_TOTAL_TIMEOUT,
+        connect_timeout: Optional[float] = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: Optional[float] = DEFAULT_READ_TIMEOUT,
+        compress: bool = True,
+        base_url: str = BASE_URL,
+        observer: Optional[Observer] = None,
+        cache: Optional[CacheBackend] = None,
+        cache_ttls: Optional[Mapping[Endpoint, Optional[float]]] = None,
+        revalidate: bool = True,
+        parsed_cache_size: int = 256,
+        parser_backend: ParserBackend = ParserBackend.xmltodict,
+        parse_executor: Optional[Executor] = None,
+        parse_offload_threshold: int = DEFAULT_PARSE_OFFLOAD_THRESHOLD,
+        coalesced_endpoints: Iterable[Endpoint] = DEFAULT_COALESCED_ENDPOINTS,
+        rate_limiter: Optional[RateLimiter] = None,
+        concurrency_controller: Optional[AdaptiveConcurrency] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge_policy: Optional[HedgePolicy] = None,
+    ) -> None:
+        """
+        `limit`, `limit_per_host` (0 means unlimited), `keepalive_timeout`
+        and `dns_cache_ttl` configure the connection pool of the session
+        created by `create`, see `create_connector`. A shared `connector`
+        is used instead if it is set, and is not closed with the client.
+
+        `total_timeout` limits a whole request, `connect_timeout` opening
+        a connection and `read_timeout` waiting for the next chunk
+        of the response (None means no limit).
+        With `compress`, gzip and deflate responses are accepted.
+
+        Requests are sent to `base_url`, e.g. a mirror or a local test server.
+
+        `observer` gets the `RequestMetrics` of every call, network timings
+        need the session created by `create` or one with the trace config
+        of `spore_api.instrumentation.create_trace_config`.
+
+        Responses are stored in `cache` if it is set, for the time
+        in seconds from `cache_ttls` by endpoint (None means forever).
+        Endpoints missing in `cache_ttls` are not cached.
+
+        With `revalidate`, expired entries that have an ETag or Last-Modified
+        header are revalidated with a conditional request. The last
+        `parsed_cache_size` parsed results of cached endpoints are kept,
+        so a cache hit or a 304 response returns the same object
+        without parsing the text again.
+
+        `parser_backend` selects the module with the parsers, see
+        `spore_api.parsers` and `spore_api.iterparsers`.
+
+        Responses of at least `parse_offload_threshold` characters are parsed
+        in `parse_executor` if it is set (a `ThreadPoolExecutor` or
+        a `ProcessPoolExecutor`), so they don't block the event loop.
+        The client doesn't shut the executor down.
+
+        Concurrent requests of the same url of `coalesced_endpoints`
+        (none by default) share one HTTP request and its parsed result
+        (or its error).
+
+        Every HTTP request waits for `rate_limiter` and for a slot
+        of `concurrency_controller`, which is told about overloads:
+        5xx and 429 responses, timeouts and `SporeApiStatusError`.
+
+        Failed requests are retried by `retry_policy`, and slow ones
+        are duplicated by `hedge_policy`. Streamed responses are neither
+        retried nor hedged, since their items are already yielded.
+        """
         self._session = None
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_cache_ttl = dns_cache_ttl
+        self._connector = connector
+        self._timeout = aiohttp.ClientTimeout(
+            total=total_timeout,
+            sock_connect=connect_timeout,
+            sock_read=read_timeout,
+        )
+        self._compress = compress
+        self._base_url = base_url.rstrip("/")
+        self.observer = observer
+        self.cache = cache
+        self._cache_ttls = (
+            DEFAULT_CACHE_TTLS
+            if cache_ttls is None else
+            cache_ttls
+        )
+        self._revalidate = revalidate
+        self._parsed_cache_size = parsed_cache_size
+        self._parsed: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._parsers = _PARSER_BACKENDS[parser_backend]
+        self._parse_executor = parse_executor
+        self._parse_offload_threshold = parse_offload_threshold
+        self._coalesced_endpoints = frozenset(coalesced_endpoints)
+        self._in_flight: Dict[str, "asyncio.Future[Any]"] = {}
+        self.rate_limiter = rate_limiter
+        self.concurrency_controller = concurrency_controller
+        self.retry_policy = retry_policy
+        self.hedge_policy = hedge_policy
 
     async def create(
         self,
         session: Optional[aiohttp.ClientSession] = None,
     ) -> None:
-        self._session = (
-            aiohttp.ClientSession()
-            if session is None else
-            session
+        if session is not None:
+            self._session = session
+            return
+
+        self._session = aiohttp.ClientSession(
+            connector=(
+                create_connector(
+                    limit=self._limit,
+                    limit_per_host=self._limit_per_host,
+                    keepalive_timeout=self._keepalive_timeout,
+                    dns_cache_ttl=self._dns_cache_ttl,
+                )
+                if self._connector is None else
+                self._connector
+            ),
+            connector_owner=self._connector is None,
+            timeout=self._timeout,
+            trace_configs=(
+                None
+                if self.observer is None else
+                [create_trace_config()]
+            ),
+            headers={
+                aiohttp.hdrs.ACCEPT_ENCODING: (
+                    ACCEPT_ENCODING
+                    if self._compress else
+                    "identity"
+                ),
+            },
         )
 
     async def __aenter__(
@@ -62,31 +265,25 @@ class SporeClient():
         return self
 
     async def get_stats(self) -> "Stats":
-        url = f"{BASE_URL}/rest/stats"
+        url = f"{self._base_url}/rest/stats"
 
-        return parse_stats(
-            await self.get_response_text(url)
-        )
+        return await self._request(url, self._parsers.parse_stats)
 
     async def get_creature(
         self,
         asset_id: Union[int, str],
     ) -> "Creature":
-        url = f"{BASE_URL}/rest/creature/{asset_id}"
+        url = f"{self._base_url}/rest/creature/{asset_id}"
 
-        return parse_creature(
-            await self.get_response_text(url)
-        )
+        return await self._request(url, self._parsers.parse_creature)
 
     async def get_user_info(
         self,
         username: str,
     ) -> "User":
-        url = f"{BASE_URL}/rest/user/{username}"
+        url = f"{self._base_url}/rest/user/{username}"
 
-        return parse_user(
-            await self.get_response_text(url)
-        )
+        return await self._request(url, self._parsers.parse_user)
 
     async def get_user_assets(
         self,
@@ -94,21 +291,17 @@ class SporeClient():
         start_index: Union[int, str],
         length: Union[int, str],
     ) -> "Assets":
-        url = f"{BASE_URL}/rest/assets/user/{username}/{start_index}/{length}"
+        url = f"{self._base_url}/rest/assets/user/{username}/{start_index}/{length}"
 
-        return parse_assets(
-            await self.get_response_text(url)
-        )
+        return await self._request(url, self._parsers.parse_assets)
 
     async def get_user_sporecasts(
         self,
         username: str,
     ) -> "Sporecasts":
-        url = f"{BASE_URL}/rest/sporecasts/{username}"
+        url = f"{self._base_url}/rest/sporecasts/{username}"
 
-        return parse_sporecasts(
-            await self.get_response_text(url)
-        )
+        return await self._request(url, self._parsers.parse_sporecasts)
 
     async def get_sporecast_assets(
         self,
@@ -116,11 +309,9 @@ class SporeClient():
         start_index: Union[int, str],
         length: Union[int, str],
     ) -> "SporecastAssets":
-        url = f"{BASE_URL}/rest/assets/sporecast/{sporecast_id}/{start_index}/{length}"
+        url = f"{self._base_url}/rest/assets/sporecast/{sporecast_id}/{start_index}/{length}"
 
-        return parse_sporecast_assets(
-            await self.get_response_text(url)
-        )
+        return await self._request(url, self._parsers.parse_sporecast_assets)
 
     async def get_user_achievements(
         self,
@@ -128,21 +319,17 @@ class SporeClient():
         start_index: Union[int, str],
         length: Union[int, str],
     ) -> "Achievements":
-        url = f"{BASE_URL}/rest/achievements/{username}/{start_index}/{length}"
+        url = f"{self._base_url}/rest/achievements/{username}/{start_index}/{length}"
 
-        return parse_achievements(
-            await self.get_response_text(url)
-        )
+        return await self._request(url, self._parsers.parse_achievements)
 
     async def get_asset_info(
         self,
         asset_id: Union[int, str],
     ) -> "FullAsset":
-        url = f"{BASE_URL}/rest/asset/{asset_id}"
+        url = f"{self._base_url}/rest/asset/{asset_id}"
 
-        return parse_full_asset(
-            await self.get_response_text(url)
-        )
+        return await self._request(url, self._parsers.parse_full_asset)
 
     async def get_asset_comments(
         self,
@@ -150,11 +337,9 @@ class SporeClient():
         start_index: Union[int, str],
         length: Union[int, str],
     ) -> "AssetComments":
-        url = f"{BASE_URL}/rest/comments/{asset_id}/{start_index}/{length}"
+        url = f"{self._base_url}/rest/comments/{asset_id}/{start_index}/{length}"
 
-        return parse_asset_comments(
-            await self.get_response_text(url)
-        )
+        return await self._request(url, self._parsers.parse_asset_comments)
 
     async def get_user_buddies(
         self,
@@ -162,11 +347,9 @@ class SporeClient():
         start_index: Union[int, str],
         length: Union[int, str],
     ) -> "Buddies":
-        url = f"{BASE_URL}/rest/users/buddies/{username}/{start_index}/{length}"
+        url = f"{self._base_url}/rest/users/buddies/{username}/{start_index}/{length}"
 
-        return parse_buddies(
-            await self.get_response_text(url)
-        )
+        return await self._request(url, self._parsers.parse_buddies)
 
     async def get_user_subscribers(
         self,
@@ -174,11 +357,9 @@ class SporeClient():
         start_index: Union[int, str],
         length: Union[int, str],
     ) -> "Buddies":
-        url = f"{BASE_URL}/rest/users/subscribers/{username}/{start_index}/{length}"
+        url = f"{self._base_url}/rest/users/subscribers/{username}/{start_index}/{length}"
 
-        return parse_buddies(
-            await self.get_response_text(url)
-        )
+        return await self._request(url, self._parsers.parse_buddies)
 
     async def search_assets(
         self,
@@ -188,21 +369,545 @@ class SporeClient():
         asset_type: Optional[AssetType] = None,
     ) -> "Assets":
         url = (
-            f"{BASE_URL}/rest/assets/search/{view_type}/{start_index}/{length}"
+            f"{self._base_url}/rest/assets/search/{view_type}/{start_index}/{length}"
             if asset_type is None else
-            f"{BASE_URL}/rest/assets/search/{view_type}/{start_index}/{length}/{asset_type}"
+            f"{self._base_url}/rest/assets/search/{view_type}/{start_index}/{length}/{asset_type}"
+        )
+
+        return await self._request(url, self._parsers.parse_assets)
+
+    def iter_user_assets(
+        self,
+        username: str,
+        start_index: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> AsyncIterator["Asset"]:
+        return self._iter_pages(
+            lambda index, length: self.get_user_assets(username, index, length),
+            lambda page: page.assets,
+            start_index=start_index,
+            page_size=page_size,
+            read_ahead=read_ahead,
+        )
+
+    def iter_sporecast_assets(
+        self,
+        sporecast_id: Union[int, str],
+        start_index: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> AsyncIterator["Asset"]:
+        return self._iter_pages(
+            lambda index, length: self.get_sporecast_assets(sporecast_id, index, length),
+            lambda page: page.assets,
+            start_index=start_index,
+            page_size=page_size,
+            read_ahead=read_ahead,
+        )
+
+    def iter_user_achievements(
+        self,
+        username: str,
+        start_index: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> AsyncIterator["Achievement"]:
+        return self._iter_pages(
+            lambda index, length: self.get_user_achievements(username, index, length),
+            lambda page: page.achievements,
+            start_index=start_index,
+            page_size=page_size,
+            read_ahead=read_ahead,
+        )
+
+    def iter_asset_comments(
+        self,
+        asset_id: Union[int, str],
+        start_index: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> AsyncIterator["Comment"]:
+        return self._iter_pages(
+            lambda index, length: self.get_asset_comments(asset_id, index, length),
+            lambda page: page.comments,
+            start_index=start_index,
+            page_size=page_size,
+            read_ahead=read_ahead,
+        )
+
+    def iter_user_buddies(
+        self,
+        username: str,
+        start_index: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> AsyncIterator["Buddy"]:
+        return self._iter_pages(
+            lambda index, length: self.get_user_buddies(username, index, length),
+            lambda page: page.buddies,
+            start_index=start_index,
+            page_size=page_size,
+            read_ahead=read_ahead,
+        )
+
+    def iter_user_subscribers(
+        self,
+        username: str,
+        start_index: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+    ) -> AsyncIterator["Buddy"]:
+        return self._iter_pages(
+            lambda index, length: self.get_user_subscribers(username, index, length),
+            lambda page: page.buddies,
+            start_index=start_index,
+            page_size=page_size,
+            read_ahead=read_ahead,
+        )
+
+    def iter_search_assets(
+        self,
+        view_type: ViewType,
+        start_index: int = 0,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        read_ahead: int = DEFAULT_READ_AHEAD,
+        *,
+        asset_type: Optional[AssetType] = None,
+    ) -> AsyncIterator["Asset"]:
+        return self._iter_pages(
+            lambda index, length: self.search_assets(view_type, index, length, asset_type),
+            lambda page: page.assets,
+            start_index=start_index,
+            page_size=page_size,
+            read_ahead=read_ahead,
+        )
+
+    def stream_user_assets(
+        self,
+        username: str,
+        start_index: Union[int, str],
+        length: Union[int, str],
+    ) -> AsyncIterator["Asset"]:
+        return self._stream_items(
+            f"{self._base_url}/rest/assets/user/{username}/{start_index}/{length}",
+            "asset",
+            build_asset,
+        )
+
+    def stream_sporecast_assets(
+        self,
+        sporecast_id: Union[int, str],
+        start_index: Union[int, str],
+        length: Union[int, str],
+    ) -> AsyncIterator["Asset"]:
+        return self._stream_items(
+            f"{self._base_url}/rest/assets/sporecast/{sporecast_id}/{start_index}/{length}",
+            "asset",
+            lambda raw_asser: build_asset(raw_asser, tags_separator=","),
+        )
+
+    def stream_user_achievements(
+        self,
+        username: str,
+        start_index: Union[int, str],
+        length: Union[int, str],
+    ) -> AsyncIterator["Achievement"]:
+        return self._stream_items(
+            f"{self._base_url}/rest/achievements/{username}/{start_index}/{length}",
+            "achievement",
+            build_achievement,
+        )
+
+    def stream_asset_comments(
+        self,
+        asset_id: Union[int, str],
+        start_index: Union[int, str],
+        length: Union[int, str],
+    ) -> AsyncIterator["Comment"]:
+        return self._stream_items(
+            f"{self._base_url}/rest/comments/{asset_id}/{start_index}/{length}",
+            "comment",
+            build_comment,
+        )
+
+    def stream_user_buddies(
+        self,
+        username: str,
+        start_index: Union[int, str],
+        length: Union[int, str],
+    ) -> AsyncIterator["Buddy"]:
+        return self._stream_items(
+            f"{self._base_url}/rest/users/buddies/{username}/{start_index}/{length}",
+            "buddy",
+            build_buddy,
+        )
+
+    def stream_user_subscribers(
+        self,
+        username: str,
+        start_index: Union[int, str],
+        length: Union[int, str],
+    ) -> AsyncIterator["Buddy"]:
+        return self._stream_items(
+            f"{self._base_url}/rest/users/subscribers/{username}/{start_index}/{length}",
+            "buddy",
+            build_buddy,
+        )
+
+    def stream_search_assets(
+        self,
+        view_type: ViewType,
+        start_index: Union[int, str],
+        length: Union[int, str],
+        asset_type: Optional[AssetType] = None,
+    ) -> AsyncIterator["Asset"]:
+        return self._stream_items(
+            (
+                f"{self._base_url}/rest/assets/search/{view_type}/{start_index}/{length}"
+                if asset_type is None else
+                f"{self._base_url}/rest/assets/search/{view_type}/{start_index}/{length}"
+                f"/{asset_type}"
+            ),
+            "asset",
+            build_asset,
+        )
+
+    async def _stream_items(
+        self,
+        url: str,
+        item_tag: str,
+        build: Callable[[Dict[str, Optional[str]]], _ItemT],
+    ) -> AsyncIterator[_ItemT]:
+        """
+        Parse the response while it is downloaded and yield models
+        as soon as their elements are received. The cache is not used.
+        With an observer, the body size and the time of parsing are measured.
+        """
+        observer = self.observer
+        metrics: Optional[RequestMetrics] = None
+        if observer is not None:
+            metrics = RequestMetrics(endpoint_from_url(url), url, time.time())
+            started_at = time.monotonic()
+        parse_duration = 0.0
+        stream = ElementStream(item_tag)
+
+        try:
+            async with self._open(url, metrics=metrics) as response:
+                if metrics is not None:
+                    metrics.http_status = response.status
+                response.raise_for_status()
+
+                received = 0
+                try:
+                    async for chunk in response.content.iter_any():
+                        if metrics is None:
+                            models = _build_stream_items(stream, build, chunk)
+                        else:
+                            received += len(chunk)
+                            parse_started_at = time.monotonic()
+                            models = _build_stream_items(stream, build, chunk)
+                            parse_duration += time.monotonic() - parse_started_at
+                        for model in models:
+                            yield model
+                finally:
+                    if metrics is not None:
+                        metrics.body_size = _get_body_size(response, received)
+
+            if metrics is None:
+                models = _build_stream_items(stream, build)
+            else:
+                parse_started_at = time.monotonic()
+                models = _build_stream_items(stream, build)
+                parse_duration += time.monotonic() - parse_started_at
+                metrics.api_status = 1
+            for model in models:
+                yield model
+        except BaseException as error:
+            if metrics is not None:
+                metrics.error = error
+                if isinstance(error, SporeApiStatusError):
+                    metrics.api_status = error.status
+            raise
+        finally:
+            if observer is not None:
+                metrics.duration = time.monotonic() - started_at  # type: ignore
+                metrics.parse_duration = parse_duration  # type: ignore
+                observer.on_request(metrics)  # type: ignore
+
+    async def _iter_pages(
+        self,
+        fetch_page: Callable[[int, int], Awaitable[_PageT]],
+        get_items: Callable[[_PageT], Sequence[_ItemT]],
+        start_index: int,
+        page_size: int,
+        read_ahead: int,
+    ) -> AsyncIterator[_ItemT]:
+        """
+        Yield items page by page, keeping up to `read_ahead` next pages
+        in flight while the current one is consumed.
+        Stops on the first page shorter than `page_size`.
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be positive")
+        if read_ahead < 0:
+            raise ValueError("read_ahead must not be negative")
+
+        pending: Deque["asyncio.Future[_PageT]"] = deque()
+        next_index = start_index
+
+        try:
+            while True:
+                while len(pending) <= read_ahead:
+                    pending.append(
+                        asyncio.ensure_future(fetch_page(next_index, page_size))
+                    )
+                    next_index += page_size
+
+                items = get_items(await pending.popleft())
+                for item in items:
+                    yield item
+
+                if len(items) < page_size:
+                    return
+        finally:
+            for future in pending:
+                _discard_future(future)
+
+    def get_creatures_many(
+        self,
+        asset_ids: Iterable[Union[int, str]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = False,
+    ) -> AsyncIterator["BatchResult[Creature]"]:
+        return self._fetch_many(
+            self.get_creature,
+            asset_ids,
+            concurrency=concurrency,
+            ordered=ordered,
         )
 
-        return parse_assets(
-            await self.get_response_text(url)
+    def get_assets_info_many(
+        self,
+        asset_ids: Iterable[Union[int, str]],
+        concurrency: int = DEFAULT_CONCURRENCY,
+        ordered: bool = False,
+    ) -> AsyncIterator["BatchResult[FullAsset]"]:
+        return self._fetch_many(
+            self.get_asset_info,
+            asset_ids,
+            concurrency=concurrency,
+            ordered=ordered,
         )
 
+    async def _fetch_many(
+        self,
+        fetch: Callable[[Any], Awaitable[_ResultT]],
+        keys: Iterable[Any],
+        concurrency: int,
+        ordered: bool,
+    ) -> AsyncIterator["BatchResult[_ResultT]"]:
+        """
+        Run `fetch` for every key with at most `concurrency` requests
+        in flight. Results are yielded as they complete, or in input order
+        if `ordered` is set. Errors are returned in `BatchResult.error`,
+        an error of iterating `keys` is raised after the fetched results.
+
+        A key takes a slot until its result is yielded, of `concurrency` slots,
+        or `2 * concurrency` if `ordered`, so a slow key stops the fetching
+        once the results after it fill the slots.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+
+        indexed_keys = enumerate(keys)
+        # Items are `(index, result)`, or `(None, error)` when a worker ends.
+        # The queue is not bounded, so a worker always gets its end through
+        results: "asyncio.Queue[Tuple[Optional[int], Any]]" = asyncio.Queue()
+        slots = asyncio.Semaphore(2 * concurrency if ordered else concurrency)
+
+        async def worker() -> None:
+            worker_error: Optional[BaseException] = None
+            try:
+                while True:
+                    await slots.acquire()
+                    # Workers share one iterator, so the keys are consumed lazily
+                    indexed_key = next(indexed_keys, None)
+                    if indexed_key is None:
+                        slots.release()
+                        return
+                    index, key = indexed_key
+                    try:
+                        result = BatchResult(key=key, result=await fetch(key), error=None)
+                    except Exception as error:
+                        result = BatchResult(key=key, result=None, error=error)
+                    results.put_nowait((index, result))
+            except BaseException as error:
+                # Errors of `keys` and cancellation
+                worker_error = error
+                raise
+            finally:
+                results.put_nowait((None, worker_error))
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(concurrency)]
+        running = len(workers)
+        buffer: Dict[int, "BatchResult[_ResultT]"] = {}
+        next_index = 0
+        first_error: Optional[BaseException] = None
+
+        try:
+            while running:
+                index, item = await results.get()
+                if index is None:
+                    running -= 1
+                    if item is not None and first_error is None:
+                        first_error = item
+                    continue
+
+                if not ordered:
+                    slots.release()
+                    yield item
+                    continue
+
+                buffer[index] = item
+                while next_index in buffer:
+                    slots.release()
+                    yield buffer.pop(next_index)
+                    next_index += 1
+
+            # Results fetched before the error are yielded first
+            if first_error is not None:
+                raise first_error
+        finally:
+            for future in workers:
+                _discard_future(future)
+
+    async def _request(
+        self,
+        url: str,
+        parser: Callable[[str], _ResultT],
+    ) -> _ResultT:
+        if self.observer is None:
+            return await self._coalesce(url, parser)
+
+        metrics = RequestMetrics(endpoint_from_url(url), url, time.time())
+        started_at = time.monotonic()
+        token = current_metrics.set(metrics)
+        try:
+            result = await self._coalesce(url, parser)
+            metrics.api_status = 1
+            return result
+        except BaseException as error:
+            metrics.error = error
+            if isinstance(error, SporeApiStatusError):
+                metrics.api_status = error.status
+            raise
+        finally:
+            current_metrics.reset(token)
+            metrics.duration = time.monotonic() - started_at
+            self.observer.on_request(metrics)
+
+    async def _coalesce(
+        self,
+        url: str,
+        parser: Callable[[str], _ResultT],
+    ) -> _ResultT:
+        if endpoint_from_url(url) not in self._coalesced_endpoints:
+            return await self._fetch_and_parse(url, parser)
+
+        # Concurrent callers of the same url share one request,
+        # shielded so that a cancelled caller doesn't cancel the others.
+        # The metrics of the request are filled in the context of the first one
+        future = self._in_flight.get(url)
+        if future is not None:
+            metrics = current_metrics.get()
+            if metrics is not None:
+                metrics.coalesced = True
+        else:
+            future = asyncio.ensure_future(self._fetch_and_parse(url, parser))
+            self._in_flight[url] = future
+            future.add_done_callback(
+                lambda done_future: self._finish_in_flight(url, done_future)
+            )
+
+        return await asyncio.shield(future)
+
+    def _finish_in_flight(self, url: str, future: "asyncio.Future[Any]") -> None:
+        if self._in_flight.get(url) is future:
+            del self._in_flight[url]
+        if not future.cancelled():
+            future.exception()
+
+    async def _fetch_and_parse(
+        self,
+        url: str,
+        parser: Callable[[str], _ResultT],
+    ) -> _ResultT:
+        try:
+            text, store = await self._get_response_text(url)
+            result = await self._parse(url, parser, text)
+        except SporeApiStatusError:
+            if self.concurrency_controller is not None:
+                self.concurrency_controller.on_overload()
+            raise
+
+        if store is not None:
+            store()
+        return result
+
+    async def _parse(
+        self,
+        url: str,
+        parser: Callable[[str], _ResultT],
+        text: str,
+    ) -> _ResultT:
+        parsed = self._parsed.get(url)
+        if parsed is not None and parsed[0] == text:
+            self._parsed.move_to_end(url)
+            return parsed[1]
+
+        metrics = current_metrics.get()
+        if metrics is not None:
+            metrics.parse_duration = None
+            parse_started_at = time.monotonic()
+
+        # Parsers check the status of the response themselves
+        if (
+            self._parse_executor is not None
+            and len(text) >= self._parse_offload_threshold
+        ):
+            result = await asyncio.get_running_loop().run_in_executor(
+                self._parse_executor,
+                parser,
+                text,
+            )
+        else:
+            result = parser(text)
+
+        if metrics is not None:
+            metrics.parse_duration = time.monotonic() - parse_started_at
+
+        if self._parsed_cache_size > 0 and self._get_cache(url) is not None:
+            self._parsed[url] = (text, result)
+            if len(self._parsed) > self._parsed_cache_size:
+                self._parsed.popitem(last=False)
+
+        return result
+
+    def _get_cache(self, url: str) -> Optional[CacheBackend]:
+        if self.cache is None or endpoint_from_url(url) not in self._cache_ttls:
+            return None
+        return self.cache
+
     async def get_response_text(self, url: str) -> str:
-        text = await self._get_response_text(url)
+        text, store = await self._get_response_text(url)
         self.check_status_spore_api(text)
+        if store is not None:
+            store()
         return text
 
     def check_status_spore_api(self, text: str) -> None:
+        """Check the status of a raw response, parsers do it on their own"""
         api_status_parse = re.search(r"<status>(\d+)</status>", text)
         if api_status_parse is not None:
             api_status = int(api_status_parse.group(1))
@@ -210,13 +915,216 @@ class SporeClient():
             if api_status != 1:
                 raise SporeApiStatusError(api_status)
 
-    async def _get_response_text(self, url: str) -> str:
+    @asynccontextmanager
+    async def _open(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+        metrics: Optional[RequestMetrics] = None,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """
+        Send a GET request through the rate limiter and the concurrency controller,
+        network timings are written to `metrics`
+        """
         if self._session is None:
             raise ValueError("The session does not exist")
 
-        async with self._session.get(url) as response:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(endpoint_from_url(url))
+
+        controller = self.concurrency_controller
+        if controller is None:
+            async with self._session.get(
+                url,
+                headers=headers,
+                trace_request_ctx=metrics,
+            ) as response:
+                yield response
+            return
+
+        await controller.acquire()
+        started_at = time.monotonic()
+        latency: Optional[float] = None
+        overloaded = False
+        try:
+            async with self._session.get(
+                url,
+                headers=headers,
+                trace_request_ctx=metrics,
+            ) as response:
+                overloaded = response.status >= 500 or response.status == 429
+                yield response
+            latency = time.monotonic() - started_at
+        except (asyncio.TimeoutError, SporeApiStatusError):
+            overloaded = True
+            raise
+        finally:
+            controller.release(latency, overloaded)
+
+    async def _get_response_text(self, url: str) -> Tuple[str, Optional[Callable[[], object]]]:
+        """
+        Get the text from the cache or the server, and the function storing
+        a new response in the cache. It is called once the status of the
+        response is checked, so Spore API errors are not cached.
+        """
+        cache = self._get_cache(url)
+        if cache is None:
+            return (await self._send(url)).text, None
+
+        ttl = self._cache_ttls[endpoint_from_url(url)]  # type: ignore
+        entry = cache.get(url)
+        metrics = current_metrics.get()
+        if entry is not None and not entry.expired:
+            cache.hits += 1
+            if metrics is not None:
+                metrics.cache = CacheOutcome.hit
+            return entry.text, None
+
+        # Expired entries with validators are revalidated with a conditional request
+        headers: Dict[str, str] = {}
+        if entry is not None and entry.revalidatable and self._revalidate:
+            if entry.etag is not None:
+                headers[aiohttp.hdrs.IF_NONE_MATCH] = entry.etag
+            if entry.last_modified is not None:
+                headers[aiohttp.hdrs.IF_MODIFIED_SINCE] = entry.last_modified
+
+        response = await self._send(url, headers)
+        if response.status == 304 and entry is not None and headers:
+            cache.hits += 1
+            cache.revalidations += 1
+            if metrics is not None:
+                metrics.cache = CacheOutcome.revalidated
+            return cache.set(
+                url,
+                entry.text,
+                ttl,
+                etag=response.headers.get(aiohttp.hdrs.ETAG, entry.etag),
+                last_modified=response.headers.get(
+                    aiohttp.hdrs.LAST_MODIFIED,
+                    entry.last_modified,
+                ),
+            ).text, None
+
+        cache.misses += 1
+        if metrics is not None:
+            metrics.cache = CacheOutcome.miss
+        return response.text, partial(
+            cache.set,
+            url,
+            response.text,
+            ttl,
+            etag=response.headers.get(aiohttp.hdrs.ETAG),
+            last_modified=response.headers.get(aiohttp.hdrs.LAST_MODIFIED),
+        )
+
+    async def _send(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> _Response:
+        """Send a GET request with the retries of `retry_policy`"""
+        retry_policy = self.retry_policy
+        if retry_policy is None:
+            return await self._send_hedged(url, headers)
+
+        retry_policy.on_request()
+        attempt = 0
+        while True:
+            try:
+                return await self._send_hedged(url, headers)
+            except Exception as error:
+                if not retry_policy.should_retry("GET", attempt, error):
+                    raise
+                metrics = current_metrics.get()
+                if metrics is not None:
+                    metrics.retries += 1
+                await asyncio.sleep(retry_policy.get_delay(attempt, error))
+                attempt += 1
+
+    async def _send_hedged(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+    ) -> _Response:
+        """Send a GET request, duplicating it if it is slow per `hedge_policy`"""
+        hedge_policy = self.hedge_policy
+        if hedge_policy is None:
+            return await self._send_once(url, headers)
+
+        endpoint = endpoint_from_url(url)
+        delay = hedge_policy.get_delay(endpoint)
+        started_at: Dict["asyncio.Future[_Response]", float] = {}
+
+        def send() -> "asyncio.Future[_Response]":
+            future = asyncio.ensure_future(self._send_once(url, headers))
+            started_at[future] = time.monotonic()
+            return future
+
+        pending = {send()}
+        hedges = 0
+        error: Optional[BaseException] = None
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=(
+                        delay
+                        if delay is not None and hedges < hedge_policy.max_hedges else
+                        None
+                    ),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    hedges += 1
+                    hedge_policy.hedges += 1
+                    metrics = current_metrics.get()
+                    if metrics is not None:
+                        metrics.hedges += 1
+                    pending.add(send())
+                    continue
+
+                for future in done:
+                    error = future.exception()
+                    if error is None:
+                        now = time.monotonic()
+                        hedge_policy.record(endpoint, now - started_at[future])
+                        # Slower attempts are cancelled, their elapsed times are lower
+                        # bounds of their latencies. Without them the quantile
+                        # would only see the winners and drift down
+                        for slower in pending:
+                            hedge_policy.record(endpoint, now - started_at[slower])
+                        return future.result()
+
+            raise error  # type: ignore
+        finally:
+            for future in pending:
+                _discard_future(future)
+
+    async def _send_once(
+        self,
+        url: str,
+        headers: Optional[Mapping[str, str]],
+    ) -> _Response:
+        metrics = current_metrics.get()
+        if metrics is None:
+            async with self._open(url, headers) as response:
+                if response.status == 304:
+                    return _Response(response.status, "", response.headers)
+
+                response.raise_for_status()
+                return _Response(response.status, await response.text(), response.headers)
+
+        async with self._open(url, headers, metrics) as response:
+            metrics.http_status = response.status
+            if response.status == 304:
+                return _Response(response.status, "", response.headers)
+
             response.raise_for_status()
-            return await response.text()
+            download_started_at = time.monotonic()
+            body = await response.read()
+            metrics.download = time.monotonic() - download_started_at
+            metrics.body_size = _get_body_size(response, len(body))
+            return _Response(response.status, await response.text(), response.headers)
 
     async def close(self) -> None:
         if self._session is None:
@@ -231,3 +1139,36 @@ class SporeClient():
         _traceback: TracebackType
     ) -> None:
         await self.close()
+
+
+def _build_stream_items(
+    stream: ElementStream,
+    build: Callable[[Dict[str, Optional[str]]], _ItemT],
+    chunk: Optional[bytes] = None,
+) -> List[_ItemT]:
+    """Models of the items completed by `chunk`, or of the rest of the stream if it is None"""
+    items = stream.close() if chunk is None else stream.feed(chunk)
+    stream.check_status()
+    return [build(item) for item in items]
+
+
+def _get_body_size(response: aiohttp.ClientResponse, received: int) -> int:
+    """
+    Bytes of the body as they were sent, before decompression.
+    `received` is the count of read bytes, used if aiohttp doesn't count them
+    (before 3.12) and the response has no `Content-Length`
+    """
+    raw_size = getattr(response.content, "total_raw_bytes", None)
+    if raw_size is not None:
+        return raw_size
+    if response.content_length is not None:
+        return response.content_length
+    return received
+
+
+def _discard_future(future: "asyncio.Future[Any]") -> None:
+    """Cancel a read-ahead future, silencing its result if it already finished"""
+    if not future.done():
+        future.cancel()
+    elif not future.cancelled():
+        future.exception()
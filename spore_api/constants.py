@@ -1 +1,49 @@
+from typing import Dict, FrozenSet, Optional
+
+from .enums import Endpoint
+
+
 BASE_URL = "http://www.spore.com"
+
+# Connection pool and timeouts in seconds, None means no timeout
+DEFAULT_LIMIT = 100
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+DEFAULT_DNS_CACHE_TTL = 5 * 60
+DEFAULT_TOTAL_TIMEOUT = 60.0
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 30.0
+ACCEPT_ENCODING = "gzip, deflate"
+
+DEFAULT_PAGE_SIZE = 100
+DEFAULT_READ_AHEAD = 2
+DEFAULT_CONCURRENCY = 10
+DEFAULT_PARSE_OFFLOAD_THRESHOLD = 64 * 1024
+DEFAULT_SYNC_OVERLAP = 5
+
+# Seconds
+DEFAULT_FEED_MIN_INTERVAL = 60.0
+DEFAULT_FEED_MAX_INTERVAL = 30 * 60.0
+DEFAULT_FEED_STATS_INTERVAL = 60 * 60.0
+DEFAULT_FEED_MAX_ASSETS = 1000
+
+DEFAULT_CRAWL_CHECKPOINT_INTERVAL = 100
+DEFAULT_CRAWL_BLOOM_ERROR_RATE = 0.01
+
+# Seconds, None means that the response never expires.
+# Endpoints missing here are not cached
+DEFAULT_CACHE_TTLS: Dict[Endpoint, Optional[float]] = {
+    Endpoint.stats: 5 * 60,
+    Endpoint.creature: None,
+    Endpoint.user: 60 * 60,
+    Endpoint.user_assets: 5 * 60,
+    Endpoint.sporecasts: 60 * 60,
+    Endpoint.sporecast_assets: 5 * 60,
+    Endpoint.achievements: 60 * 60,
+    Endpoint.asset: 60 * 60,
+    Endpoint.comments: 5 * 60,
+    Endpoint.buddies: 60 * 60,
+    Endpoint.subscribers: 60 * 60,
+    Endpoint.search: 60,
+}
+
+DEFAULT_COALESCED_ENDPOINTS: FrozenSet[Endpoint] = frozenset()
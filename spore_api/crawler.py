@@ -0,0 +1,503 @@
+"""
+Breadth-first crawler of the buddy graph:
+
+    async with SporeClient() as client:
+        crawler = BuddyGraphCrawler(client, max_depth=2, checkpoint_path="crawl.json")
+        graph = await crawler.crawl(["MaxisCactus"])
+
+    with open("edges.txt", "w") as fp:
+        graph.write_edge_list(fp)
+
+Users are nodes keyed by their IDs. A user has an edge to each buddy,
+and each subscriber has an edge to the user.
+"""
+
+import os
+import sys
+import json
+import math
+import array
+import asyncio
+import base64
+import hashlib
+from collections import deque
+from pathlib import Path
+from typing import (
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
+
+from .client import SporeClient
+from .constants import (
+    DEFAULT_CONCURRENCY,
+    DEFAULT_CRAWL_BLOOM_ERROR_RATE,
+    DEFAULT_CRAWL_CHECKPOINT_INTERVAL,
+    DEFAULT_PAGE_SIZE,
+)
+from .models import Buddy
+
+
+RELATION_BUDDY = 0
+RELATION_SUBSCRIBER = 1
+
+# (username, user ID, depth)
+_Task = Tuple[str, int, int]
+
+
+class IdSet():
+    """Exact set of user IDs"""
+    def __init__(self) -> None:
+        self._ids: Set[int] = set()
+
+    def add(self, user_id: int) -> bool:
+        """Add the ID, return False if it was already in the set"""
+        if user_id in self._ids:
+            return False
+        self._ids.add(user_id)
+        return True
+
+    def __contains__(self, user_id: int) -> bool:
+        return user_id in self._ids
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def to_dict(self) -> dict:
+        return {"type": "set", "ids": _encode_array(array.array("q", sorted(self._ids)))}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "IdSet":
+        ids = cls()
+        ids._ids.update(_decode_array("q", data["ids"]))
+        return ids
+
+
+class BloomFilter():
+    """
+    Set of user IDs in about 10 bits per ID for a 1% error rate.
+    Once it holds `capacity` IDs, a share of `error_rate` of the IDs
+    not in it are reported as already added, and the crawler skips them.
+    """
+    def __init__(self, capacity: int, error_rate: float = DEFAULT_CRAWL_BLOOM_ERROR_RATE) -> None:
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._count = 0
+
+    def add(self, user_id: int) -> bool:
+        """Add the ID, return False if it was (probably) already in the set"""
+        added = False
+        for position in self._get_positions(user_id):
+            mask = 1 << (position & 7)
+            if not self._bits[position >> 3] & mask:
+                self._bits[position >> 3] |= mask
+                added = True
+        if added:
+            self._count += 1
+        return added
+
+    def __contains__(self, user_id: int) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._get_positions(user_id)
+        )
+
+    def __len__(self) -> int:
+        """Count of added IDs"""
+        return self._count
+
+    def to_dict(self) -> dict:
+        return {
+            "type": "bloom",
+            "capacity": self.capacity,
+            "error_rate": self.error_rate,
+            "count": self._count,
+            "bits": base64.b64encode(bytes(self._bits)).decode("ascii"),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BloomFilter":
+        bloom_filter = cls(data["capacity"], data["error_rate"])
+        bloom_filter._bits[:] = base64.b64decode(data["bits"])
+        bloom_filter._count = data["count"]
+        return bloom_filter
+
+    def _get_positions(self, user_id: int) -> Iterator[int]:
+        # Double hashing of one digest instead of `hash_count` hash functions
+        digest = hashlib.blake2b(
+            user_id.to_bytes(8, "little", signed=True),
+            digest_size=16,
+        ).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        for index in range(self.hash_count):
+            yield (first + index * second) % self.size
+
+
+class CSRGraph(NamedTuple):
+    """
+    Compressed sparse rows: the targets of the node `node_ids[i]` are the
+    node indexes `targets[offsets[i]:offsets[i + 1]]`.
+    The arrays can be wrapped without copying with `numpy.frombuffer`.
+    """
+    node_ids: array.array
+    offsets: array.array
+    targets: array.array
+
+
+class BuddyGraph():
+    """Edges between user IDs in compact arrays, with the names of the users"""
+    def __init__(self) -> None:
+        self.names: Dict[int, str] = {}
+        self.sources = array.array("q")
+        self.targets = array.array("q")
+        self.relations = array.array("b")
+
+    def add_edges(
+        self,
+        user: Buddy,
+        buddies: Sequence[Buddy],
+        subscribers: Sequence[Buddy],
+    ) -> None:
+        self.names[user.id] = user.name
+        for buddy in buddies:
+            self.names[buddy.id] = buddy.name
+            self.sources.append(user.id)
+            self.targets.append(buddy.id)
+            self.relations.append(RELATION_BUDDY)
+        for subscriber in subscribers:
+            self.names[subscriber.id] = subscriber.name
+            self.sources.append(subscriber.id)
+            self.targets.append(user.id)
+            self.relations.append(RELATION_SUBSCRIBER)
+
+    def __len__(self) -> int:
+        """Count of edges"""
+        return len(self.sources)
+
+    def iter_edges(self, relation: Optional[int] = None) -> Iterator[Tuple[int, int]]:
+        for source, target, edge_relation in zip(self.sources, self.targets, self.relations):
+            if relation is None or edge_relation == relation:
+                yield source, target
+
+    def write_edge_list(
+        self,
+        fp: TextIO,
+        relation: Optional[int] = None,
+        names: bool = False,
+    ) -> None:
+        """Write a `<source> <target>` line per edge, with user names instead of IDs if `names`"""
+        for source, target in self.iter_edges(relation):
+            if names:
+                fp.write(f"{self.names.get(source, source)} {self.names.get(target, target)}\n")
+            else:
+                fp.write(f"{source} {target}\n")
+
+    def to_csr(self, relation: Optional[int] = None) -> CSRGraph:
+        """Graph as CSR arrays, nodes sorted by ID, duplicate edges merged"""
+        edges = sorted(set(self.iter_edges(relation)))
+        node_ids = array.array("q", sorted(
+            {source for source, _ in edges} | {target for _, target in edges}
+        ))
+        indexes = {node_id: index for index, node_id in enumerate(node_ids)}
+
+        offsets = array.array("q", [0] * (len(node_ids) + 1))
+        targets = array.array("q", bytes(8 * len(edges)))
+        for position, (source, target) in enumerate(edges):
+            offsets[indexes[source] + 1] += 1
+            targets[position] = indexes[target]
+        for index in range(len(node_ids)):
+            offsets[index + 1] += offsets[index]
+
+        return CSRGraph(node_ids, offsets, targets)
+
+    def to_dict(self) -> dict:
+        return {
+            "names": {str(user_id): name for user_id, name in self.names.items()},
+            "sources": _encode_array(self.sources),
+            "targets": _encode_array(self.targets),
+            "relations": _encode_array(self.relations),
+        }
+
+    def dump_edges(self, start: int = 0) -> bytes:
+        """
+        Edges from the index `start` with the names of their users,
+        as a JSON line that `load_edges` appends to a graph
+        """
+        sources = self.sources[start:]
+        targets = self.targets[start:]
+        names = {
+            str(user_id): self.names[user_id]
+            for user_id in {*sources, *targets}
+            if user_id in self.names
+        }
+        chunk = {
+            "names": names,
+            "sources": _encode_array(sources),
+            "targets": _encode_array(targets),
+            "relations": _encode_array(self.relations[start:]),
+        }
+        return json.dumps(chunk).encode("utf-8") + b"\n"
+
+    def load_edges(self, line: bytes) -> None:
+        chunk = json.loads(line)
+        self.names.update((int(user_id), name) for user_id, name in chunk["names"].items())
+        self.sources.extend(_decode_array("q", chunk["sources"]))
+        self.targets.extend(_decode_array("q", chunk["targets"]))
+        self.relations.extend(_decode_array("b", chunk["relations"]))
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BuddyGraph":
+        graph = cls()
+        graph.names = {int(user_id): name for user_id, name in data["names"].items()}
+        graph.sources = _decode_array("q", data["sources"])
+        graph.targets = _decode_array("q", data["targets"])
+        graph.relations = _decode_array("b", data["relations"])
+        return graph
+
+
+class BuddyGraphCrawler():
+    """
+    Crawls buddies and subscribers breadth first with `concurrency` users in flight.
+    Users further than `max_depth` from the seeds are nodes of the graph,
+    but their buddies are not fetched, and at most `max_users` users are crawled.
+
+    Visited users are kept in an `IdSet`, or in a `BloomFilter`
+    for `bloom_capacity` users if it is set, which takes far less memory
+    on huge graphs but skips a share of users.
+
+    With `checkpoint_path` the state is saved every `checkpoint_interval`
+    crawled users and when the crawl ends or is cancelled, and a new crawler
+    with the same path resumes it. Edges are appended to the file
+    `<checkpoint_path>.edges`, so a checkpoint writes only the edges
+    added since the previous one. Errors of users whose requests failed
+    are kept in `failed`, the next crawl retries them.
+    """
+    def __init__(
+        self,
+        client: SporeClient,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        max_depth: Optional[int] = None,
+        max_users: Optional[int] = None,
+        buddies: bool = True,
+        subscribers: bool = True,
+        bloom_capacity: Optional[int] = None,
+        checkpoint_path: Optional[Union[str, Path]] = None,
+        checkpoint_interval: int = DEFAULT_CRAWL_CHECKPOINT_INTERVAL,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> None:
+        if concurrency < 1:
+            raise ValueError("concurrency must be positive")
+
+        self.client = client
+        self.concurrency = concurrency
+        self.max_depth = max_depth
+        self.max_users = max_users
+        self.buddies = buddies
+        self.subscribers = subscribers
+        self.checkpoint_path = None if checkpoint_path is None else Path(checkpoint_path)
+        self.checkpoint_interval = checkpoint_interval
+        self.page_size = page_size
+
+        self.graph = BuddyGraph()
+        self.visited: Union[IdSet, BloomFilter] = (
+            IdSet() if bloom_capacity is None else BloomFilter(bloom_capacity)
+        )
+        self.crawled = 0
+        self.failed: Dict[str, str] = {}
+        self._queue: Deque[_Task] = deque()
+        self._failed_tasks: List[_Task] = []
+        self._failed_seeds: Set[str] = set()
+        self._in_progress: Dict["asyncio.Future[None]", _Task] = {}
+        # Edges and bytes of the edges file saved by the last checkpoint
+        self._checkpointed_edges = 0
+        self._checkpointed_edges_size = 0
+
+        if self.checkpoint_path is not None and self.checkpoint_path.exists():
+            self._load_checkpoint()
+
+    async def crawl(self, seeds: Sequence[str] = ()) -> BuddyGraph:
+        """
+        Crawl from `seeds` and the users left by the checkpoint or the last crawl,
+        return the graph. Seeds that were already crawled are skipped.
+        """
+        failed_seeds = list(self._failed_seeds)
+        self._queue.extend(self._failed_tasks)
+        self._failed_tasks = []
+        self._failed_seeds = set()
+        self.failed = {}
+
+        users = await asyncio.gather(
+            *(self.client.get_user_info(username) for username in (*failed_seeds, *seeds)),
+            return_exceptions=True,
+        )
+        for username, user in zip((*failed_seeds, *seeds), users):
+            if isinstance(user, Exception):
+                self.failed[username] = repr(user)
+                self._failed_seeds.add(username)
+            elif isinstance(user, BaseException):
+                raise user
+            elif self.visited.add(user.id):
+                self._queue.append((user.name, user.id, 0))
+
+        checkpointed = self.crawled
+        try:
+            while self._queue or self._in_progress:
+                while (
+                    self._queue
+                    and len(self._in_progress) < self.concurrency
+                    and (
+                        self.max_users is None
+                        or self.crawled + len(self._in_progress) < self.max_users
+                    )
+                ):
+                    task = self._queue.popleft()
+                    future = asyncio.ensure_future(self._crawl_user(task))
+                    self._in_progress[future] = task
+
+                if not self._in_progress:
+                    break  # `max_users` are crawled
+                done, _ = await asyncio.wait(self._in_progress, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    del self._in_progress[future]
+                    future.result()
+
+                if (
+                    self.checkpoint_interval > 0
+                    and self.crawled - checkpointed >= self.checkpoint_interval
+                ):
+                    self.save_checkpoint()
+                    checkpointed = self.crawled
+        finally:
+            # Users in flight when the crawl was cancelled are crawled next time
+            for future, task in self._in_progress.items():
+                if not future.done():
+                    future.cancel()
+                    self._queue.appendleft(task)
+            if self._in_progress:
+                await asyncio.gather(*self._in_progress, return_exceptions=True)
+                self._in_progress.clear()
+            self.save_checkpoint()
+
+        return self.graph
+
+    def save_checkpoint(self) -> None:
+        if self.checkpoint_path is None:
+            return
+
+        # Anything after the last checkpoint is dropped, e.g. a chunk
+        # of a crashed crawl or a file of another crawl
+        edges_path = _get_edges_path(self.checkpoint_path)
+        with open(edges_path, "a+b") as fp:
+            fp.truncate(self._checkpointed_edges_size)
+            if len(self.graph) > self._checkpointed_edges:
+                fp.write(self.graph.dump_edges(self._checkpointed_edges))
+            edges_size = fp.seek(0, os.SEEK_END)
+
+        state = {
+            "crawled": self.crawled,
+            "failed": self.failed,
+            "failed_tasks": self._failed_tasks,
+            "failed_seeds": sorted(self._failed_seeds),
+            "queue": [*self._in_progress.values(), *self._queue],
+            "visited": self.visited.to_dict(),
+            "edges": len(self.graph),
+            "edges_size": edges_size,
+        }
+        # Replaced at once, so a crash never leaves a broken file
+        temporary_path = self.checkpoint_path.with_name(self.checkpoint_path.name + ".tmp")
+        with open(temporary_path, "w", encoding="utf-8") as fp:
+            json.dump(state, fp)
+        os.replace(temporary_path, self.checkpoint_path)
+        self._checkpointed_edges = len(self.graph)
+        self._checkpointed_edges_size = edges_size
+
+    async def _crawl_user(self, task: _Task) -> None:
+        username, user_id, depth = task
+        try:
+            buddies = (
+                await self._collect(self.client.iter_user_buddies, username)
+                if self.buddies else []
+            )
+            subscribers = (
+                await self._collect(self.client.iter_user_subscribers, username)
+                if self.subscribers else []
+            )
+        except Exception as error:
+            self.failed[username] = repr(error)
+            self._failed_tasks.append(task)
+            return
+
+        self.graph.add_edges(Buddy(id=user_id, name=username), buddies, subscribers)
+        self.crawled += 1
+
+        if self.max_depth is None or depth < self.max_depth:
+            for buddy in (*buddies, *subscribers):
+                if self.visited.add(buddy.id):
+                    self._queue.append((buddy.name, buddy.id, depth + 1))
+
+    async def _collect(
+        self,
+        iter_users: Callable[..., AsyncIterator[Buddy]],
+        username: str,
+    ) -> List[Buddy]:
+        users = iter_users(username, page_size=self.page_size, read_ahead=0)
+        return [buddy async for buddy in users]
+
+    def _load_checkpoint(self) -> None:
+        with open(self.checkpoint_path, encoding="utf-8") as fp:  # type: ignore
+            state = json.load(fp)
+
+        self.crawled = state["crawled"]
+        self.failed = state["failed"]
+        self._failed_tasks = [tuple(task) for task in state["failed_tasks"]]  # type: ignore
+        self._failed_seeds = set(state["failed_seeds"])
+        self._queue = deque(tuple(task) for task in state["queue"])  # type: ignore
+        self.visited = (
+            IdSet.from_dict(state["visited"])
+            if state["visited"]["type"] == "set" else
+            BloomFilter.from_dict(state["visited"])
+        )
+
+        self.graph = BuddyGraph()
+        with open(_get_edges_path(self.checkpoint_path), "rb") as fp:  # type: ignore
+            for line in fp.read(state["edges_size"]).splitlines():
+                self.graph.load_edges(line)
+        self._checkpointed_edges = state["edges"]
+        self._checkpointed_edges_size = state["edges_size"]
+
+
+def _get_edges_path(checkpoint_path: Path) -> Path:
+    return checkpoint_path.with_name(checkpoint_path.name + ".edges")
+
+
+def _encode_array(values: array.array) -> str:
+    """Encode with little endian items"""
+    if values.itemsize > 1 and sys.byteorder == "big":
+        values = array.array(values.typecode, values)
+        values.byteswap()
+    return base64.b64encode(values.tobytes()).decode("ascii")
+
+
+def _decode_array(typecode: str, text: str) -> array.array:
+    values = array.array(typecode)
+    values.frombytes(base64.b64decode(text))
+    if values.itemsize > 1 and sys.byteorder == "big":
+        values.byteswap()
+    return values
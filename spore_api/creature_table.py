@@ -0,0 +1,235 @@
+"""
+Columnar storage of creature stats for vectorized analytics.
+Requires numpy (`pip install spore.py[numpy]`), Parquet files also need pyarrow.
+"""
+
+import re
+from dataclasses import fields
+from operator import itemgetter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Union, overload
+
+import numpy as np
+
+from .models import Creature
+from .parsers import check_status
+
+
+CREATURE_COLUMNS = tuple(field.name for field in fields(Creature))
+CREATURE_STATS = CREATURE_COLUMNS[2:]
+CREATURE_DTYPE = np.dtype(
+    [("asset_id", np.int64), ("cost", np.int64)]
+    + [(name, np.float64) for name in CREATURE_STATS]
+)
+
+Index = Union[slice, Sequence[int], np.ndarray]
+
+# Creature documents are flat, so the fields are read with one regex pass
+# and picked in the column order by one precompiled getter.
+# Elements may have attributes, and texts surrounding whitespace
+_CREATURE_ELEMENT_RE = re.compile(r"<(\w+)(?:\s[^>]*)?>\s*([^<]*?)\s*</\1\s*>")
+_get_creature_values = itemgetter("input", *CREATURE_COLUMNS[1:])
+# Exact conversions of the texts, so IDs are not rounded through float64
+_CREATURE_CONVERTERS = tuple(
+    int if CREATURE_DTYPE[name].kind == "i" else float
+    for name in CREATURE_COLUMNS
+)
+
+
+class CreatureTable():
+    """
+    Creatures stored as one contiguous numpy array per field of `Creature`.
+    Rows are appended to preallocated buffers which grow twice when full.
+    """
+    def __init__(self, capacity: int = 1024) -> None:
+        self._size = 0
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.empty(capacity, dtype=CREATURE_DTYPE[name])
+            for name in CREATURE_COLUMNS
+        }
+
+    @classmethod
+    def from_creatures(cls, creatures: Iterable[Creature]) -> "CreatureTable":
+        table = cls()
+        table.extend(creatures)
+        return table
+
+    @classmethod
+    def from_xml(cls, texts: Iterable[str]) -> "CreatureTable":
+        table = cls()
+        table.extend_from_xml(texts)
+        return table
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "CreatureTable":
+        """Build from a structured array with `CREATURE_DTYPE` fields"""
+        table = cls(capacity=len(array))
+        table._size = len(array)
+        for name in CREATURE_COLUMNS:
+            table._columns[name][:] = array[name]
+        return table
+
+    @property
+    def capacity(self) -> int:
+        return len(self._columns["asset_id"])
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Creature]:
+        for index in range(self._size):
+            yield self._get_creature(index)
+
+    @overload
+    def __getitem__(self, key: int) -> Creature:
+        ...
+
+    @overload
+    def __getitem__(self, key: str) -> np.ndarray:
+        ...
+
+    @overload
+    def __getitem__(self, key: Index) -> "CreatureTable":
+        ...
+
+    def __getitem__(self, key):  # type: ignore
+        if isinstance(key, str):
+            return self.column(key)
+        if isinstance(key, (int, np.integer)):
+            if key < 0:
+                key += self._size
+            if not 0 <= key < self._size:
+                raise IndexError("creature index out of range")
+            return self._get_creature(int(key))
+        return self.filter(key)
+
+    def column(self, name: str) -> np.ndarray:
+        """View of the filled part of the column"""
+        return self._columns[name][:self._size]
+
+    def append(self, creature: Creature) -> None:
+        index = self._reserve(1)
+        for name in CREATURE_COLUMNS:
+            self._columns[name][index] = getattr(creature, name)
+
+    def extend(self, creatures: Iterable[Creature]) -> None:
+        for creature in creatures:
+            self.append(creature)
+
+    def extend_from_xml(self, texts: Iterable[str]) -> None:
+        """
+        Append creatures from the XML of `/rest/creature/<id>` responses,
+        without building models. Rows are reserved for all the documents
+        at once, and each value is written straight to its column buffer.
+        Nothing is appended if a document has a bad status.
+        """
+        if not isinstance(texts, Sequence):
+            texts = list(texts)
+
+        index = self._reserve(len(texts))
+        columns = [self._columns[name] for name in CREATURE_COLUMNS]
+        try:
+            for row, text in enumerate(texts, index):
+                elements = dict(_CREATURE_ELEMENT_RE.findall(text))
+                check_status(elements.get("status"))
+                for column, convert, value in zip(
+                    columns,
+                    _CREATURE_CONVERTERS,
+                    _get_creature_values(elements),
+                ):
+                    column[row] = convert(value)
+        except BaseException:
+            self._size = index
+            raise
+
+    def filter(self, key: Index) -> "CreatureTable":
+        """New table with the rows selected by a slice, indexes or a boolean mask"""
+        columns = {name: self.column(name)[key] for name in CREATURE_COLUMNS}
+
+        table = CreatureTable(capacity=len(columns["asset_id"]))
+        table._size = len(columns["asset_id"])
+        for name, column in columns.items():
+            table._columns[name][:table._size] = column
+        return table
+
+    def to_array(self) -> np.ndarray:
+        """Copy rows to a structured array with `CREATURE_DTYPE` fields"""
+        array = np.empty(self._size, dtype=CREATURE_DTYPE)
+        for name in CREATURE_COLUMNS:
+            array[name] = self.column(name)
+        return array
+
+    def stats_matrix(self, stats: Optional[Sequence[str]] = None) -> np.ndarray:
+        """2d array of stats, a row per creature"""
+        return np.column_stack([
+            self.column(name)
+            for name in (CREATURE_STATS if stats is None else stats)
+        ])
+
+    def rank(self, stat: str, descending: bool = True) -> np.ndarray:
+        """Row indexes sorted by the stat"""
+        order = np.argsort(self.column(stat), kind="stable")
+        return order[::-1] if descending else order
+
+    def top(self, stat: str, count: int) -> "CreatureTable":
+        return self.filter(self.rank(stat)[:count])
+
+    def zscores(self, stats: Optional[Sequence[str]] = None) -> np.ndarray:
+        """Standard scores of stats, constant stats get 0"""
+        matrix = self.stats_matrix(stats)
+        deviation = matrix.std(axis=0)
+        return np.divide(
+            matrix - matrix.mean(axis=0),
+            deviation,
+            out=np.zeros_like(matrix),
+            where=deviation != 0,
+        )
+
+    def save(self, path: Union[str, Path]) -> None:
+        """Save to `.npy`, or to Parquet if the suffix is `.parquet`"""
+        path = Path(path)
+        if path.suffix == ".parquet":
+            import pyarrow
+            import pyarrow.parquet
+
+            pyarrow.parquet.write_table(
+                pyarrow.table({name: self.column(name) for name in CREATURE_COLUMNS}),
+                str(path),
+            )
+        else:
+            np.save(path, self.to_array(), allow_pickle=False)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "CreatureTable":
+        path = Path(path)
+        if path.suffix == ".parquet":
+            import pyarrow.parquet
+
+            parquet_table = pyarrow.parquet.read_table(str(path))
+            array = np.empty(parquet_table.num_rows, dtype=CREATURE_DTYPE)
+            for name in CREATURE_COLUMNS:
+                array[name] = parquet_table.column(name).to_numpy()
+            return cls.from_array(array)
+
+        return cls.from_array(np.load(path, allow_pickle=False))
+
+    def _get_creature(self, index: int) -> Creature:
+        return Creature(**{
+            name: self._columns[name][index].item()
+            for name in CREATURE_COLUMNS
+        })
+
+    def _reserve(self, count: int) -> int:
+        """Make room for `count` rows, return the index of the first one"""
+        index = self._size
+        required = index + count
+
+        if required > self.capacity:
+            capacity = max(self.capacity * 2, required)
+            for name, column in self._columns.items():
+                grown = np.empty(capacity, dtype=column.dtype)
+                grown[:index] = column[:index]
+                self._columns[name] = grown
+
+        self._size = required
+        return index
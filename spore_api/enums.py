@@ -19,6 +19,26 @@ class ViewType(str, Enum):
     cute_and_creepy = "CUTE_AND_CREEPY"
 
 
+class Endpoint(str, Enum):
+    stats            = "stats"
+    creature         = "creature"
+    user             = "user"
+    user_assets      = "user_assets"
+    sporecasts       = "sporecasts"
+    sporecast_assets = "sporecast_assets"
+    achievements     = "achievements"
+    asset            = "asset"
+    comments         = "comments"
+    buddies          = "buddies"
+    subscribers      = "subscribers"
+    search           = "search"
+
+
+class ParserBackend(str, Enum):
+    xmltodict = "xmltodict"
+    iterparse = "iterparse"
+
+
 class AssetSubtype(int, Enum):
     # CREATURE
     сreature   = 0x9ea3031a  # animal
@@ -59,3 +79,9 @@ class AssetSubtype(int, Enum):
     story     = 0xb4707f8f
     template  = 0x27818fe6
     no_genre  = 0x20790816
+
+
+class CacheOutcome(str, Enum):
+    hit         = "hit"
+    revalidated = "revalidated"
+    miss        = "miss"
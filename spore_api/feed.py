@@ -0,0 +1,184 @@
+"""
+Feed of new uploads, polling the newest assets:
+
+    async with SporeClient() as client:
+        async for asset in NewAssetsFeed(client, "feed.json"):
+            print(asset.id, asset.name)
+
+Each poll fetches newest pages only until it reaches the watermark,
+the newest asset seen so far, and the polls follow the upload rate.
+"""
+
+import os
+import json
+import time
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator, List, Optional, Set, Tuple, Union
+
+from .client import SporeClient
+from .constants import (
+    DEFAULT_FEED_MAX_ASSETS,
+    DEFAULT_FEED_MAX_INTERVAL,
+    DEFAULT_FEED_MIN_INTERVAL,
+    DEFAULT_FEED_STATS_INTERVAL,
+    DEFAULT_PAGE_SIZE,
+)
+from .enums import AssetType, ViewType
+from .models import Asset
+from .utils import timestamp_from_datetime
+
+
+_Watermark = Tuple[float, int]
+
+
+class NewAssetsFeed():
+    """
+    Yields assets uploaded after the watermark, oldest first, and polls forever.
+    The watermark is the `create_at` and ID of the newest yielded asset,
+    saved to the JSON file `state_path` if it is set, so a restarted feed
+    continues where it stopped. The first poll without a watermark
+    only sets it, assets uploaded before the feed started are not yielded.
+
+    The poll interval is the time `page_size / 2` assets are uploaded
+    at the rate of `get_stats().day_uploads` (refreshed every `stats_interval`
+    seconds) or of the last poll if it's higher, within `min_interval`
+    and `max_interval`. The first page of a poll is sized to the expected
+    count of new assets. A poll stops after `max_assets` new assets,
+    older ones are skipped then.
+
+    If the client has a cache, search responses are cached
+    for `cache_ttls[Endpoint.search]`, keep `min_interval` above it.
+    """
+    def __init__(
+        self,
+        client: SporeClient,
+        state_path: Optional[Union[str, Path]] = None,
+        asset_type: Optional[AssetType] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        min_interval: float = DEFAULT_FEED_MIN_INTERVAL,
+        max_interval: float = DEFAULT_FEED_MAX_INTERVAL,
+        stats_interval: float = DEFAULT_FEED_STATS_INTERVAL,
+        max_assets: int = DEFAULT_FEED_MAX_ASSETS,
+    ) -> None:
+        if not 0 < min_interval <= max_interval:
+            raise ValueError("min_interval must be positive and not above max_interval")
+
+        self.client = client
+        self.state_path = None if state_path is None else Path(state_path)
+        self.asset_type = asset_type
+        self.page_size = page_size
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.stats_interval = stats_interval
+        self.max_assets = max_assets
+        self.watermark: Optional[_Watermark] = self._load_watermark()
+        # Uploads per second
+        self.upload_rate: Optional[float] = None
+        self.polls = 0
+        self.requests = 0
+        self._stats_updated_at: Optional[float] = None
+        self._polled_at: Optional[float] = None
+
+    async def __aiter__(self) -> AsyncIterator[Asset]:
+        while True:
+            for asset in await self.poll():
+                yield asset
+                # Moved once the next asset is requested, so an asset
+                # the consumer stopped at is yielded again after a restart
+                self.watermark = _get_watermark(asset)
+                self._save_watermark()
+            await asyncio.sleep(await self.get_interval())
+
+    async def poll(self) -> List[Asset]:
+        """
+        New assets since the watermark, oldest first.
+        The watermark is not moved, `__aiter__` moves it as assets are yielded.
+        """
+        polled_at = time.monotonic()
+        new_assets: List[Asset] = []
+        seen: Set[int] = set()
+        start_index = 0
+        length = self._get_first_page_length()
+
+        while len(new_assets) < self.max_assets:
+            page = (await self.client.search_assets(
+                ViewType.newest,
+                start_index,
+                length,
+                self.asset_type,
+            )).assets
+            self.requests += 1
+
+            reached = False
+            for asset in page:
+                if self.watermark is not None and _get_watermark(asset) <= self.watermark:
+                    reached = True
+                # Uploads between requests shift the pages
+                elif asset.id not in seen:
+                    seen.add(asset.id)
+                    new_assets.append(asset)
+
+            if reached or self.watermark is None or len(page) < length:
+                break
+            start_index += length
+            length = self.page_size
+
+        if self.watermark is None and new_assets:
+            self.watermark = max(_get_watermark(asset) for asset in new_assets)
+            self._save_watermark()
+            new_assets = []
+
+        if self._polled_at is not None and polled_at > self._polled_at:
+            observed_rate = len(new_assets) / (polled_at - self._polled_at)
+            if self.upload_rate is None or observed_rate > self.upload_rate:
+                self.upload_rate = observed_rate
+        self._polled_at = polled_at
+        self.polls += 1
+
+        new_assets.sort(key=_get_watermark)
+        return new_assets[-self.max_assets:]
+
+    async def get_interval(self) -> float:
+        """Seconds until the next poll"""
+        now = time.monotonic()
+        if self._stats_updated_at is None or now - self._stats_updated_at >= self.stats_interval:
+            stats = await self.client.get_stats()
+            self.requests += 1
+            self.upload_rate = stats.day_uploads / (24 * 60 * 60)
+            self._stats_updated_at = now
+
+        if not self.upload_rate:
+            return self.max_interval
+        return min(self.max_interval, max(self.min_interval, self.page_size / 2 / self.upload_rate))
+
+    def _get_first_page_length(self) -> int:
+        if self.watermark is None or self._polled_at is None or not self.upload_rate:
+            return self.page_size
+
+        expected = self.upload_rate * (time.monotonic() - self._polled_at)
+        # With a margin, since one more request costs more than a longer page
+        return max(1, min(self.page_size, int(expected * 1.5) + 5))
+
+    def _load_watermark(self) -> Optional[_Watermark]:
+        if self.state_path is None or not self.state_path.exists():
+            return None
+
+        state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        return (state["create_at"], state["id"])
+
+    def _save_watermark(self) -> None:
+        if self.state_path is None or self.watermark is None:
+            return
+
+        # Replaced at once, so a crash never leaves a broken file
+        temporary_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        temporary_path.write_text(
+            json.dumps({"create_at": self.watermark[0], "id": self.watermark[1]}),
+            encoding="utf-8",
+        )
+        os.replace(temporary_path, self.state_path)
+
+
+def _get_watermark(asset: Asset) -> _Watermark:
+    return (timestamp_from_datetime(asset.create_at), asset.id)
@@ -0,0 +1,305 @@
+"""
+Per-request metrics of `SporeClient`, reported to an observer:
+
+    class PrintObserver(Observer):
+        def on_request(self, metrics: RequestMetrics) -> None:
+            print(metrics.endpoint, metrics.duration, metrics.cache)
+
+    SporeClient(observer=PrintObserver())
+
+Nothing is measured if the client has no observer.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from types import SimpleNamespace
+from typing import Any, Optional
+
+import aiohttp
+
+from .enums import CacheOutcome, Endpoint
+
+
+@dataclass
+class RequestMetrics():
+    """
+    Metrics of one client call, times are in seconds.
+    Network timings are of the last HTTP attempt and are None if it
+    didn't reach that stage (e.g. the response was taken from the cache).
+    `ttfb` is from sending the request to receiving the response headers,
+    it includes `dns` and `connect`.
+    """
+    endpoint: Optional[Endpoint]
+    url: str
+    started_at: float
+    duration: Optional[float] = None
+    dns: Optional[float] = None
+    connect: Optional[float] = None
+    ttfb: Optional[float] = None
+    download: Optional[float] = None
+    body_size: Optional[int] = None
+    parse_duration: Optional[float] = None
+    cache: Optional[CacheOutcome] = None
+    retries: int = 0
+    hedges: int = 0
+    coalesced: bool = False
+    http_status: Optional[int] = None
+    api_status: Optional[int] = None
+    error: Optional[BaseException] = None
+
+
+class Observer():
+    """Base of observers, `on_request` is called when a call of the client ends"""
+    def on_request(self, metrics: RequestMetrics) -> None:
+        pass
+
+
+class PrometheusObserver(Observer):
+    """
+    Exports metrics with prometheus_client (`pip install spore.py[prometheus]`):
+    `<namespace>_requests_total`, `<namespace>_request_duration_seconds`,
+    `<namespace>_ttfb_seconds`, `<namespace>_parse_duration_seconds`,
+    `<namespace>_response_size_bytes` and `<namespace>_retries_total`
+    """
+    def __init__(self, namespace: str = "spore_api", registry: Any = None) -> None:
+        import prometheus_client
+
+        if registry is None:
+            registry = prometheus_client.REGISTRY
+
+        self.requests = prometheus_client.Counter(
+            "requests",
+            "Calls of the client",
+            ["endpoint", "outcome", "cache"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.duration = prometheus_client.Histogram(
+            "request_duration_seconds",
+            "Duration of calls of the client",
+            ["endpoint"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.ttfb = prometheus_client.Histogram(
+            "ttfb_seconds",
+            "Time to the first byte of responses",
+            ["endpoint"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.parse_duration = prometheus_client.Histogram(
+            "parse_duration_seconds",
+            "Duration of parsing responses",
+            ["endpoint"],
+            namespace=namespace,
+            registry=registry,
+        )
+        self.body_size = prometheus_client.Histogram(
+            "response_size_bytes",
+            "Size of response bodies",
+            ["endpoint"],
+            namespace=namespace,
+            registry=registry,
+            buckets=(1024, 4096, 16384, 65536, 262144, 1048576, 4194304),
+        )
+        self.retries = prometheus_client.Counter(
+            "retries",
+            "Retried HTTP requests",
+            ["endpoint"],
+            namespace=namespace,
+            registry=registry,
+        )
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        endpoint = "" if metrics.endpoint is None else metrics.endpoint.value
+
+        self.requests.labels(
+            endpoint,
+            _get_outcome(metrics),
+            "" if metrics.cache is None else metrics.cache.value,
+        ).inc()
+        if metrics.duration is not None:
+            self.duration.labels(endpoint).observe(metrics.duration)
+        if metrics.ttfb is not None:
+            self.ttfb.labels(endpoint).observe(metrics.ttfb)
+        if metrics.parse_duration is not None:
+            self.parse_duration.labels(endpoint).observe(metrics.parse_duration)
+        if metrics.body_size is not None:
+            self.body_size.labels(endpoint).observe(metrics.body_size)
+        if metrics.retries:
+            self.retries.labels(endpoint).inc(metrics.retries)
+
+
+class OpenTelemetryObserver(Observer):
+    """
+    Records a span per call and a duration histogram with
+    the OpenTelemetry API (`pip install spore.py[opentelemetry]`),
+    using the global providers if `tracer` or `meter` is not set
+    """
+    def __init__(self, tracer: Any = None, meter: Any = None) -> None:
+        from opentelemetry import metrics, trace
+
+        self._status_error = trace.StatusCode.ERROR
+        self.tracer = trace.get_tracer(__name__) if tracer is None else tracer
+        self.meter = metrics.get_meter(__name__) if meter is None else meter
+        self.duration = self.meter.create_histogram(
+            "spore_api.request.duration",
+            unit="s",
+            description="Duration of calls of the client",
+        )
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        attributes = {
+            "spore_api.endpoint": "" if metrics.endpoint is None else metrics.endpoint.value,
+            "spore_api.outcome": _get_outcome(metrics),
+            "http.url": metrics.url,
+            "spore_api.retries": metrics.retries,
+            "spore_api.coalesced": metrics.coalesced,
+        }
+        for name, value in (
+            ("http.status_code", metrics.http_status),
+            ("spore_api.status", metrics.api_status),
+            ("spore_api.cache", None if metrics.cache is None else metrics.cache.value),
+            ("spore_api.body_size", metrics.body_size),
+            ("spore_api.dns", metrics.dns),
+            ("spore_api.connect", metrics.connect),
+            ("spore_api.ttfb", metrics.ttfb),
+            ("spore_api.download", metrics.download),
+            ("spore_api.parse_duration", metrics.parse_duration),
+        ):
+            if value is not None:
+                attributes[name] = value
+
+        start_time = int(metrics.started_at * 1e9)
+        span = self.tracer.start_span(
+            f"spore_api {attributes['spore_api.endpoint']}",
+            start_time=start_time,
+            attributes=attributes,
+        )
+        if metrics.error is not None:
+            span.record_exception(metrics.error)
+            span.set_status(self._status_error)
+        span.end(end_time=start_time + int((metrics.duration or 0) * 1e9))
+
+        if metrics.duration is not None:
+            self.duration.record(
+                metrics.duration,
+                {
+                    "spore_api.endpoint": attributes["spore_api.endpoint"],
+                    "spore_api.outcome": attributes["spore_api.outcome"],
+                },
+            )
+
+
+# Metrics of the call running in the current task,
+# inherited by the tasks of hedged and coalesced requests
+current_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar(
+    "current_metrics",
+    default=None,
+)
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """
+    Trace config filling the network timings of `RequestMetrics`
+    passed as `trace_request_ctx`. Add it to your own session
+    to get them, sessions created by the client have it.
+    """
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_dns_resolvehost_start.append(_on_dns_resolvehost_start)
+    trace_config.on_dns_resolvehost_end.append(_on_dns_resolvehost_end)
+    trace_config.on_dns_cache_hit.append(_on_dns_cache_hit)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
+
+
+def _get_outcome(metrics: RequestMetrics) -> str:
+    return "ok" if metrics.error is None else type(metrics.error).__name__
+
+
+async def _on_request_start(
+    _session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    _params: Any,
+) -> None:
+    metrics: Optional[RequestMetrics] = context.trace_request_ctx
+    if metrics is not None:
+        context.request_started_at = time.monotonic()
+        context.dns_started_at = None
+        context.connection_started_at = None
+        metrics.dns = metrics.connect = metrics.ttfb = metrics.download = None
+
+
+async def _on_dns_resolvehost_start(
+    _session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    _params: Any,
+) -> None:
+    if context.trace_request_ctx is not None:
+        context.dns_started_at = time.monotonic()
+
+
+async def _on_dns_resolvehost_end(
+    _session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    _params: Any,
+) -> None:
+    metrics: Optional[RequestMetrics] = context.trace_request_ctx
+    if metrics is not None and context.dns_started_at is not None:
+        metrics.dns = time.monotonic() - context.dns_started_at
+
+
+async def _on_dns_cache_hit(
+    _session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    _params: Any,
+) -> None:
+    metrics: Optional[RequestMetrics] = context.trace_request_ctx
+    if metrics is not None:
+        metrics.dns = 0.0
+
+
+async def _on_connection_create_start(
+    _session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    _params: Any,
+) -> None:
+    if context.trace_request_ctx is not None:
+        context.connection_started_at = time.monotonic()
+
+
+async def _on_connection_create_end(
+    _session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    _params: Any,
+) -> None:
+    metrics: Optional[RequestMetrics] = context.trace_request_ctx
+    if metrics is not None and context.connection_started_at is not None:
+        # Resolving the host is a part of creating the connection
+        metrics.connect = time.monotonic() - context.connection_started_at - (metrics.dns or 0.0)
+
+
+async def _on_connection_reuseconn(
+    _session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    _params: Any,
+) -> None:
+    metrics: Optional[RequestMetrics] = context.trace_request_ctx
+    if metrics is not None:
+        metrics.dns = metrics.connect = 0.0
+
+
+async def _on_request_end(
+    _session: aiohttp.ClientSession,
+    context: SimpleNamespace,
+    _params: Any,
+) -> None:
+    metrics: Optional[RequestMetrics] = context.trace_request_ctx
+    if metrics is not None:
+        metrics.ttfb = time.monotonic() - context.request_started_at
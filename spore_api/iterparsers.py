@@ -0,0 +1,241 @@
+"""
+Parsers built on the incremental `xml.etree.ElementTree.XMLPullParser`.
+They have the same interface as `spore_api.parsers`, but don't build the
+whole document: items are turned into models as soon as their element closes.
+"""
+
+from typing import (
+    AnyStr,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+from xml.etree import ElementTree
+
+from .models import (
+    Achievements,
+    Asset,
+    AssetComments,
+    Assets,
+    Buddies,
+    Buddy,
+    Comment,
+    FullAsset,
+    SporecastAssets,
+    Sporecasts,
+    Stats,
+    Creature,
+    User,
+)
+from .parsers import (
+    check_status,
+    build_achievement,
+    build_asset,
+    build_buddy,
+    build_comment,
+    build_creature,
+    build_full_asset,
+    build_sporecast,
+    build_stats,
+    build_user,
+)
+
+
+T = TypeVar("T")
+
+CHUNK_SIZE = 64 * 1024
+
+
+class ElementStream():
+    """
+    Incremental reader of a Spore API document.
+
+    Elements with `item_tag` are returned from `feed` and `close` as dicts
+    of their children texts as soon as they close, and are dropped from the
+    tree. Texts of other children of the root are collected in `fields`.
+    """
+    def __init__(self, item_tag: Optional[str] = None) -> None:
+        self.item_tag = item_tag
+        self.root_tag: Optional[str] = None
+        self.fields: Dict[str, Optional[str]] = {}
+        self._parser = ElementTree.XMLPullParser(events=("start", "end"))
+        self._stack: List[ElementTree.Element] = []
+
+    def check_status(self) -> None:
+        """Raise `SporeApiStatusError` once a bad `<status>` is read"""
+        check_status(self.fields.get("status"))
+
+    def feed(self, data: AnyStr) -> List[Dict[str, Optional[str]]]:
+        self._parser.feed(data)
+        return self._read_items()
+
+    def close(self) -> List[Dict[str, Optional[str]]]:
+        self._parser.close()
+        return self._read_items()
+
+    def _read_items(self) -> List[Dict[str, Optional[str]]]:
+        items = []
+        stack = self._stack
+        item_tag = self.item_tag
+
+        for event, element in self._parser.read_events():
+            if event == "start":
+                if not stack:
+                    self.root_tag = element.tag  # type: ignore
+                stack.append(element)  # type: ignore
+                continue
+
+            stack.pop()
+            if element.tag == item_tag:  # type: ignore
+                items.append({
+                    child.tag: _get_text(child)
+                    for child in element  # type: ignore
+                })
+            elif len(stack) == 1:
+                self.fields[element.tag] = _get_text(element)  # type: ignore
+            else:
+                continue
+
+            stack[-1].remove(element)  # type: ignore
+
+        return items
+
+
+def _get_text(element: ElementTree.Element) -> Optional[str]:
+    """Stripped text, None if it's empty, as xmltodict gives"""
+    text = (element.text or "").strip()
+    return text or None
+
+
+def iter_chunks(text: AnyStr, chunk_size: int = CHUNK_SIZE) -> Iterator[AnyStr]:
+    for index in range(0, len(text), chunk_size):
+        yield text[index:index + chunk_size]
+
+
+def iter_items(
+    chunks: Iterable[AnyStr],
+    item_tag: str,
+    build: Callable[[Dict[str, Optional[str]]], T],
+) -> Iterator[T]:
+    """Yield models built from the `item_tag` elements as the chunks are parsed"""
+    stream = ElementStream(item_tag)
+
+    for chunk in chunks:
+        items = stream.feed(chunk)
+        stream.check_status()
+        for item in items:
+            yield build(item)
+
+    items = stream.close()
+    stream.check_status()
+    for item in items:
+        yield build(item)
+
+
+def iter_assets(chunks: Iterable[AnyStr], tags_separator: str = ", ") -> Iterator[Asset]:
+    return iter_items(
+        chunks,
+        "asset",
+        lambda raw_asser: build_asset(raw_asser, tags_separator=tags_separator),
+    )
+
+
+def iter_comments(chunks: Iterable[AnyStr]) -> Iterator[Comment]:
+    return iter_items(chunks, "comment", build_comment)
+
+
+def iter_buddies(chunks: Iterable[AnyStr]) -> Iterator[Buddy]:
+    return iter_items(chunks, "buddy", build_buddy)
+
+
+def _parse_items(
+    text: str,
+    item_tag: Optional[str],
+    build: Callable[[Dict[str, Optional[str]]], T],
+) -> Tuple[List[T], Dict[str, Optional[str]]]:
+    stream = ElementStream(item_tag)
+    items: List[T] = []
+
+    for chunk in iter_chunks(text):
+        raw_items = stream.feed(chunk)
+        stream.check_status()
+        items.extend(map(build, raw_items))
+
+    raw_items = stream.close()
+    stream.check_status()
+    items.extend(map(build, raw_items))
+
+    return items, stream.fields
+
+
+def parse_stats(text: str) -> Stats:
+    _, fields = _parse_items(text, None, build_stats)
+    return build_stats(fields)
+
+
+def parse_creature(text: str) -> Creature:
+    _, fields = _parse_items(text, None, build_creature)
+    return build_creature(fields)
+
+
+def parse_user(text: str) -> User:
+    _, fields = _parse_items(text, None, build_user)
+    return build_user(fields)
+
+
+def parse_assets(text: str) -> Assets:
+    assets, _ = _parse_items(text, "asset", build_asset)
+    return Assets(assets=assets)
+
+
+def parse_sporecasts(text: str) -> Sporecasts:
+    sporecasts, fields = _parse_items(text, "sporecast", build_sporecast)
+    return Sporecasts(
+        username=fields["input"],  # type: ignore
+        sporecasts=sporecasts,
+    )
+
+
+def parse_sporecast_assets(text: str) -> SporecastAssets:
+    assets, fields = _parse_items(
+        text,
+        "asset",
+        lambda raw_asser: build_asset(raw_asser, tags_separator=","),
+    )
+    return SporecastAssets(
+        id=int(fields["input"]),  # type: ignore
+        name=fields["name"],  # type: ignore
+        assets=assets,
+    )
+
+
+def parse_achievements(text: str) -> Achievements:
+    achievements, fields = _parse_items(text, "achievement", build_achievement)
+    return Achievements(
+        username=fields["input"],  # type: ignore
+        achievements=achievements,
+    )
+
+
+def parse_full_asset(text: str) -> FullAsset:
+    comments, fields = _parse_items(text, "comment", build_comment)
+    return build_full_asset(fields, comments)
+
+
+def parse_asset_comments(text: str) -> AssetComments:
+    comments, fields = _parse_items(text, "comment", build_comment)
+    return AssetComments(
+        id=int(fields["input"]),  # type: ignore
+        name=fields["name"],  # type: ignore
+        comments=comments,
+    )
+
+
+def parse_buddies(text: str) -> Buddies:
+    buddies, _ = _parse_items(text, "buddy", build_buddy)
+    return Buddies(buddies=buddies)
@@ -0,0 +1,619 @@
+"""
+Local mirror of Spore data in a SQLite database.
+
+Syncs fetch asset lists newest first and stop once they reach
+the assets of the last sync, so repeated syncs only download
+the new uploads. Queries are answered from the database.
+"""
+
+import json
+import time
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import (
+    AsyncIterator,
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from .client import SporeClient
+from .constants import DEFAULT_PAGE_SIZE, DEFAULT_SYNC_OVERLAP
+from .enums import AssetSubtype, AssetType, ViewType
+from .models import Asset, Buddy, Comment, Sporecast, User
+from .utils import datetime_from_timestamp, timestamp_from_datetime
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS assets (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    author_name TEXT NOT NULL,
+    create_at REAL NOT NULL,
+    rating REAL NOT NULL,
+    type TEXT NOT NULL,
+    subtype INTEGER NOT NULL,
+    parent_id INTEGER,
+    description TEXT,
+    tags TEXT,
+    thumbnail_url TEXT NOT NULL,
+    image_url TEXT NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS assets_author_name ON assets (author_name, create_at);
+CREATE INDEX IF NOT EXISTS assets_create_at ON assets (create_at);
+CREATE INDEX IF NOT EXISTS assets_type ON assets (type, create_at);
+
+CREATE TABLE IF NOT EXISTS scope_assets (
+    scope TEXT NOT NULL,
+    asset_id INTEGER NOT NULL,
+    PRIMARY KEY (scope, asset_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    scope TEXT PRIMARY KEY,
+    newest_create_at REAL,
+    pending_create_at REAL,
+    resume_index INTEGER NOT NULL,
+    synced_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS users (
+    name TEXT PRIMARY KEY COLLATE NOCASE,
+    id INTEGER NOT NULL,
+    image_url TEXT NOT NULL,
+    tagline TEXT NOT NULL,
+    create_at REAL NOT NULL,
+    synced_at REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS sporecasts (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    subtitle TEXT NOT NULL,
+    author_name TEXT NOT NULL,
+    update_at REAL NOT NULL,
+    rating REAL NOT NULL,
+    subscription_count INTEGER NOT NULL,
+    tags TEXT NOT NULL,
+    assets_count INTEGER NOT NULL,
+    synced_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sporecasts_author_name ON sporecasts (author_name);
+
+CREATE TABLE IF NOT EXISTS comments (
+    asset_id INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    message TEXT NOT NULL,
+    sender_name TEXT NOT NULL,
+    PRIMARY KEY (asset_id, position)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS comments_sender_name ON comments (sender_name);
+
+CREATE TABLE IF NOT EXISTS buddies (
+    username TEXT NOT NULL COLLATE NOCASE,
+    relation TEXT NOT NULL,
+    id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    PRIMARY KEY (username, relation, id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS buddies_id ON buddies (id, relation);
+"""
+
+_ItemT = TypeVar("_ItemT")
+
+_ASSET_COLUMNS = (
+    "id, name, author_name, create_at, rating, type, subtype, "
+    "parent_id, description, tags, thumbnail_url, image_url"
+)
+
+
+class SporeMirror():
+    """
+    Mirror in a SQLite database file. `client` is used by the `sync_*`
+    methods and must be created, queries don't need it.
+
+    Asset lists are synced incrementally: the newest `create_at` of the last
+    finished sync of a list is its watermark, and the next syncs stop after
+    `overlap` consecutive assets older than it (or as old and mirrored).
+    A failed sync keeps the watermark, so the next one fetches what it missed.
+
+    `limit` bounds the count of assets of one sync. A sync stopped by it
+    keeps the watermark too and saves where it stopped: the next sync
+    fetches the new uploads, then jumps over the assets already fetched
+    (`overlap` assets earlier, as deleted assets shift the list)
+    and continues down to the watermark.
+
+    Comments, sporecasts and buddies are small and are synced fully.
+    """
+    def __init__(
+        self,
+        path: Union[str, Path],
+        client: Optional[SporeClient] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        overlap: int = DEFAULT_SYNC_OVERLAP,
+    ) -> None:
+        if overlap < 1:
+            raise ValueError("overlap must be positive")
+
+        self.client = client
+        self.page_size = page_size
+        self.overlap = overlap
+        self._connection = sqlite3.connect(str(path))
+        self._connection.executescript(_SCHEMA)
+        self._connection.commit()
+
+    # Syncs
+
+    async def sync_user(self, username: str) -> int:
+        """
+        Sync the user, their assets, sporecasts, buddies and subscribers,
+        return the count of new assets
+        """
+        await self.sync_user_info(username)
+        new_assets = await self.sync_user_assets(username)
+        await self.sync_user_sporecasts(username)
+        await self.sync_user_buddies(username)
+        await self.sync_user_subscribers(username)
+        return new_assets
+
+    async def sync_user_info(self, username: str) -> User:
+        user = await self._get_client().get_user_info(username)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO users "
+            "(name, id, image_url, tagline, create_at, synced_at) VALUES (?, ?, ?, ?, ?, ?)",
+            (
+                user.name,
+                user.id,
+                user.image_url,
+                user.tagline,
+                timestamp_from_datetime(user.create_at),
+                time.time(),
+            ),
+        )
+        self._connection.commit()
+        return user
+
+    async def sync_user_assets(self, username: str, limit: Optional[int] = None) -> int:
+        """Return the count of new assets"""
+        return await self._sync_assets(
+            f"user:{username.lower()}",
+            lambda start_index: self._get_client().iter_user_assets(
+                username,
+                start_index=start_index,
+                page_size=self.page_size,
+                read_ahead=0,
+            ),
+            limit,
+        )
+
+    async def sync_sporecast_assets(
+        self,
+        sporecast_id: Union[int, str],
+        limit: Optional[int] = None,
+    ) -> int:
+        """Return the count of new assets"""
+        return await self._sync_assets(
+            f"sporecast:{sporecast_id}",
+            lambda start_index: self._get_client().iter_sporecast_assets(
+                sporecast_id,
+                start_index=start_index,
+                page_size=self.page_size,
+                read_ahead=0,
+            ),
+            limit,
+        )
+
+    async def sync_newest(
+        self,
+        asset_type: Optional[AssetType] = None,
+        limit: Optional[int] = DEFAULT_PAGE_SIZE * 10,
+    ) -> int:
+        """
+        Sync the newest uploads (`ViewType.newest`), return the count of new assets.
+        Without `limit` the first sync would page through every asset of Spore,
+        with it every sync goes `limit` assets further back.
+        """
+        return await self._sync_assets(
+            "newest" if asset_type is None else f"newest:{asset_type.value}",
+            lambda start_index: self._get_client().iter_search_assets(
+                ViewType.newest,
+                start_index=start_index,
+                page_size=self.page_size,
+                read_ahead=0,
+                asset_type=asset_type,
+            ),
+            limit,
+        )
+
+    async def sync_user_sporecasts(self, username: str) -> List[Sporecast]:
+        sporecasts = (await self._get_client().get_user_sporecasts(username)).sporecasts
+        synced_at = time.time()
+
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM sporecasts WHERE author_name = ? COLLATE NOCASE",
+                (username,),
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO sporecasts (id, title, subtitle, author_name, update_at, "
+                "rating, subscription_count, tags, assets_count, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        sporecast.id,
+                        sporecast.title,
+                        sporecast.subtitle,
+                        sporecast.author_name,
+                        timestamp_from_datetime(sporecast.update_at),
+                        sporecast.rating,
+                        sporecast.subscription_count,
+                        json.dumps(sporecast.tags),
+                        sporecast.assets_count,
+                        synced_at,
+                    )
+                    for sporecast in sporecasts
+                ],
+            )
+
+        return sporecasts
+
+    async def sync_asset_comments(self, asset_id: int) -> List[Comment]:
+        comments = await _collect(
+            self._get_client().iter_asset_comments(asset_id, page_size=self.page_size)
+        )
+
+        with self._connection:
+            self._connection.execute("DELETE FROM comments WHERE asset_id = ?", (asset_id,))
+            self._connection.executemany(
+                "INSERT INTO comments (asset_id, position, message, sender_name) "
+                "VALUES (?, ?, ?, ?)",
+                [
+                    (asset_id, position, comment.message, comment.sender_name)
+                    for position, comment in enumerate(comments)
+                ],
+            )
+
+        return comments
+
+    async def sync_user_buddies(self, username: str) -> List[Buddy]:
+        buddies = await _collect(
+            self._get_client().iter_user_buddies(username, page_size=self.page_size)
+        )
+        self._store_buddies(username, "buddy", buddies)
+        return buddies
+
+    async def sync_user_subscribers(self, username: str) -> List[Buddy]:
+        subscribers = await _collect(
+            self._get_client().iter_user_subscribers(username, page_size=self.page_size)
+        )
+        self._store_buddies(username, "subscriber", subscribers)
+        return subscribers
+
+    # Queries
+
+    def get_asset(self, asset_id: int) -> Optional[Asset]:
+        row = self._connection.execute(
+            f"SELECT {_ASSET_COLUMNS} FROM assets WHERE id = ?",
+            (asset_id,),
+        ).fetchone()
+        return None if row is None else _asset_from_row(row)
+
+    def get_user(self, username: str) -> Optional[User]:
+        row = self._connection.execute(
+            "SELECT id, name, image_url, tagline, create_at FROM users WHERE name = ?",
+            (username,),
+        ).fetchone()
+        if row is None:
+            return None
+
+        return User(
+            id=row[0],
+            name=row[1],
+            image_url=row[2],
+            tagline=row[3],
+            create_at=datetime_from_timestamp(row[4]),
+        )
+
+    def get_user_assets(self, username: str, limit: Optional[int] = None) -> List[Asset]:
+        """Assets of the user, newest first"""
+        return self.search_assets(author_name=username, limit=limit)
+
+    def get_sporecast_assets(
+        self,
+        sporecast_id: Union[int, str],
+        limit: Optional[int] = None,
+    ) -> List[Asset]:
+        """Assets of the sporecast, newest first"""
+        return self._query_assets(
+            "id IN (SELECT asset_id FROM scope_assets WHERE scope = ?)",
+            [f"sporecast:{sporecast_id}"],
+            limit,
+        )
+
+    def search_assets(
+        self,
+        author_name: Optional[str] = None,
+        asset_type: Optional[AssetType] = None,
+        name: Optional[str] = None,
+        tag: Optional[str] = None,
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+        limit: Optional[int] = None,
+    ) -> List[Asset]:
+        """
+        Mirrored assets matching all the given filters, newest first.
+        `name` is a substring of the name, `since` and `until` bound `create_at`
+        (naive datetimes are UTC, as `create_at`).
+        """
+        conditions: List[str] = []
+        parameters: List[object] = []
+
+        if author_name is not None:
+            conditions.append("author_name = ? COLLATE NOCASE")
+            parameters.append(author_name)
+        if asset_type is not None:
+            conditions.append("type = ?")
+            parameters.append(asset_type.value)
+        if name is not None:
+            conditions.append("name LIKE ?")
+            parameters.append(f"%{name}%")
+        if tag is not None:
+            conditions.append("EXISTS (SELECT 1 FROM json_each(assets.tags) WHERE value = ?)")
+            parameters.append(tag)
+        if since is not None:
+            conditions.append("create_at >= ?")
+            parameters.append(timestamp_from_datetime(since))
+        if until is not None:
+            conditions.append("create_at < ?")
+            parameters.append(timestamp_from_datetime(until))
+
+        return self._query_assets(" AND ".join(conditions) or "1", parameters, limit)
+
+    def get_user_sporecasts(self, username: str) -> List[Sporecast]:
+        rows = self._connection.execute(
+            "SELECT id, title, subtitle, author_name, update_at, rating, "
+            "subscription_count, tags, assets_count FROM sporecasts "
+            "WHERE author_name = ? COLLATE NOCASE ORDER BY id",
+            (username,),
+        )
+        return [
+            Sporecast(
+                id=row[0],
+                title=row[1],
+                subtitle=row[2],
+                author_name=row[3],
+                update_at=datetime_from_timestamp(row[4]),
+                rating=row[5],
+                subscription_count=row[6],
+                tags=json.loads(row[7]),
+                assets_count=row[8],
+            )
+            for row in rows
+        ]
+
+    def get_asset_comments(self, asset_id: int) -> List[Comment]:
+        rows = self._connection.execute(
+            "SELECT message, sender_name FROM comments WHERE asset_id = ? ORDER BY position",
+            (asset_id,),
+        )
+        return [Comment(message=row[0], sender_name=row[1]) for row in rows]
+
+    def get_user_buddies(self, username: str) -> List[Buddy]:
+        return self._query_buddies(username, "buddy")
+
+    def get_user_subscribers(self, username: str) -> List[Buddy]:
+        return self._query_buddies(username, "subscriber")
+
+    def count_assets(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM assets").fetchone()[0]
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def _get_client(self) -> SporeClient:
+        if self.client is None:
+            raise ValueError("The mirror has no client")
+        return self.client
+
+    async def _sync_assets(
+        self,
+        scope: str,
+        iter_assets: Callable[[int], AsyncIterator[Asset]],
+        limit: Optional[int],
+    ) -> int:
+        state = self._connection.execute(
+            "SELECT newest_create_at, pending_create_at, resume_index "
+            "FROM sync_state WHERE scope = ?",
+            (scope,),
+        ).fetchone()
+        # Every asset of the list older than the watermark is mirrored.
+        # A sync stopped by `limit` mirrored the assets from `pending`
+        # down to `resume_index` of the list, the rest is still to be fetched
+        watermark: Optional[float]
+        pending: Optional[float]
+        watermark, pending, resume_index = (None, None, 0) if state is None else state
+
+        newest = pending if pending is not None else watermark
+        stop_at = newest
+        resuming = pending is not None
+        start_index = 0
+        passed = 0
+        new_count = 0
+        count = 0
+        complete = False
+        batch: List[Asset] = []
+        # IDs of `batch`, not in the database yet
+        batch_ids: Set[int] = set()
+
+        try:
+            while True:
+                # A pass stops after `overlap` consecutive assets not newer than `stop_at`
+                passed = 0
+                old_streak = 0
+                reached = False
+                assets = iter_assets(start_index)
+                try:
+                    async for asset in assets:
+                        created = timestamp_from_datetime(asset.create_at)
+                        # The list moves while it is paged, so an asset can come twice
+                        known = asset.id in batch_ids or self._is_known(scope, asset.id)
+                        if not known:
+                            new_count += 1
+                        if newest is None or created > newest:
+                            newest = created
+
+                        # Known assets are stored too, to refresh their ratings
+                        batch.append(asset)
+                        batch_ids.add(asset.id)
+                        if len(batch) >= self.page_size:
+                            self._store_assets(scope, batch)
+                            batch.clear()
+                            batch_ids.clear()
+
+                        passed += 1
+                        count += 1
+                        if stop_at is not None and (
+                            created < stop_at
+                            or created == stop_at and known
+                        ):
+                            old_streak += 1
+                            if old_streak >= self.overlap:
+                                reached = True
+                                break
+                        else:
+                            old_streak = 0
+
+                        if limit is not None and count >= limit:
+                            break
+                    else:
+                        # The end of the list
+                        complete = True
+                finally:
+                    await assets.aclose()  # type: ignore
+
+                if complete or not reached:
+                    break
+                if not resuming:
+                    complete = True
+                    break
+
+                # Reached the assets of the stopped sync: jump over them,
+                # they moved down by the count of new uploads
+                start_index = max(0, resume_index + passed - old_streak - self.overlap)
+                stop_at = watermark
+                resuming = False
+        finally:
+            self._store_assets(scope, batch)
+
+        if complete:
+            state = (newest, None, 0)
+        else:
+            state = (watermark, newest, start_index + passed)
+        self._connection.execute(
+            "INSERT OR REPLACE INTO sync_state "
+            "(scope, newest_create_at, pending_create_at, resume_index, synced_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (scope, *state, time.time()),
+        )
+        self._connection.commit()
+
+        return new_count
+
+    def _is_known(self, scope: str, asset_id: int) -> bool:
+        return self._connection.execute(
+            "SELECT 1 FROM scope_assets WHERE scope = ? AND asset_id = ?",
+            (scope, asset_id),
+        ).fetchone() is not None
+
+    def _store_assets(self, scope: str, assets: Sequence[Asset]) -> None:
+        if not assets:
+            return
+
+        synced_at = time.time()
+        with self._connection:
+            self._connection.executemany(
+                f"INSERT OR REPLACE INTO assets ({_ASSET_COLUMNS}, synced_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(*_asset_to_row(asset), synced_at) for asset in assets],
+            )
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO scope_assets (scope, asset_id) VALUES (?, ?)",
+                [(scope, asset.id) for asset in assets],
+            )
+
+    def _store_buddies(self, username: str, relation: str, buddies: Iterable[Buddy]) -> None:
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM buddies WHERE username = ? AND relation = ?",
+                (username, relation),
+            )
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO buddies (username, relation, id, name) VALUES (?, ?, ?, ?)",
+                [(username, relation, buddy.id, buddy.name) for buddy in buddies],
+            )
+
+    def _query_assets(
+        self,
+        condition: str,
+        parameters: Sequence[object],
+        limit: Optional[int],
+    ) -> List[Asset]:
+        rows = self._connection.execute(
+            f"SELECT {_ASSET_COLUMNS} FROM assets WHERE {condition} "
+            "ORDER BY create_at DESC, id DESC LIMIT ?",
+            (*parameters, -1 if limit is None else limit),
+        )
+        return [_asset_from_row(row) for row in rows]
+
+    def _query_buddies(self, username: str, relation: str) -> List[Buddy]:
+        rows = self._connection.execute(
+            "SELECT id, name FROM buddies WHERE username = ? AND relation = ? ORDER BY name",
+            (username, relation),
+        )
+        return [Buddy(id=row[0], name=row[1]) for row in rows]
+
+
+async def _collect(items: AsyncIterator[_ItemT]) -> List[_ItemT]:
+    return [item async for item in items]
+
+
+def _asset_to_row(asset: Asset) -> Tuple[object, ...]:
+    return (
+        asset.id,
+        asset.name,
+        asset.author_name,
+        timestamp_from_datetime(asset.create_at),
+        asset.rating,
+        asset.type.value,
+        asset.subtype.value,
+        asset.parent_id,
+        asset.description,
+        None if asset.tags is None else json.dumps(asset.tags),
+        asset.thumbnail_url,
+        asset.image_url,
+    )
+
+
+def _asset_from_row(row: Sequence[object]) -> Asset:
+    return Asset(
+        id=row[0],  # type: ignore
+        name=row[1],  # type: ignore
+        author_name=row[2],  # type: ignore
+        create_at=datetime_from_timestamp(row[3]),  # type: ignore
+        rating=row[4],  # type: ignore
+        type=AssetType(row[5]),
+        subtype=AssetSubtype(row[6]),
+        parent_id=row[7],  # type: ignore
+        description=row[8],  # type: ignore
+        tags=None if row[9] is None else json.loads(row[9]),  # type: ignore
+        thumbnail_url=row[10],  # type: ignore
+        image_url=row[11],  # type: ignore
+    )
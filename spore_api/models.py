@@ -1,12 +1,16 @@
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, Any, Generic, List, Optional, Type, TypeVar
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 
 from dataclasses_json import DataClassJsonMixin
 
 from .enums import AssetType, AssetSubtype
 
 
+T = TypeVar("T")
+CompactModelT = TypeVar("CompactModelT", bound="CompactModel")
+
+
 @dataclass
 class Stats(DataClassJsonMixin):
     total_uploads: int
@@ -176,3 +180,114 @@ class Buddies(DataClassJsonMixin):
     @property
     def count(self) -> int:
         return len(self.buddies)
+
+
+@dataclass
+class BatchResult(Generic[T]):
+    """Result of one item of a bulk request"""
+    key: Any
+    result: Optional[T]
+    error: Optional[Exception]
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class CompactModel():
+    """
+    Base of the slotted models.
+    `DataClassJsonMixin` has no `__slots__`, so its methods are reused
+    directly to keep `to_dict`/`to_json` without an instance `__dict__`.
+    """
+    __slots__ = ()
+
+    dataclass_json_config = None
+
+    to_json = DataClassJsonMixin.to_json
+    to_dict = DataClassJsonMixin.to_dict
+    from_json = DataClassJsonMixin.__dict__["from_json"]
+    from_dict = DataClassJsonMixin.__dict__["from_dict"]
+    schema = DataClassJsonMixin.__dict__["schema"]
+
+    @classmethod
+    def from_model(cls: Type[CompactModelT], model: Any) -> CompactModelT:
+        """Build from the regular model with the same fields"""
+        return cls(*(getattr(model, field.name) for field in fields(cls)))  # type: ignore
+
+
+@dataclass
+class CompactCreature(CompactModel):
+    """`Creature` without an instance `__dict__`"""
+    __slots__ = (
+        "asset_id", "cost", "health", "height", "meanness", "cuteness",
+        "sense", "bonecount", "footcount", "graspercount", "basegear",
+        "carnivore", "herbivore", "glide", "sprint", "stealth", "bite",
+        "charge", "strike", "spit", "sing", "dance", "gesture", "posture",
+    )
+
+    asset_id: int
+
+    cost: int
+    health: float
+    height: float
+    meanness: float
+    cuteness: float
+    sense: float
+    bonecount: float
+    footcount: float
+    graspercount: float
+    basegear: float
+    carnivore: float
+    herbivore: float
+    glide: float
+    sprint: float
+    stealth: float
+    bite: float
+    charge: float
+    strike: float
+    spit: float
+    sing: float
+    dance: float
+    gesture: float
+    posture: float
+
+
+@dataclass
+class CompactAsset(CompactModel):
+    """`Asset` without an instance `__dict__`"""
+    __slots__ = (
+        "id", "name", "author_name", "create_at", "rating", "type", "subtype",
+        "parent_id", "description", "tags", "thumbnail_url", "image_url",
+    )
+
+    id: int
+    name: str
+    author_name: str
+    create_at: "datetime"
+    rating: float
+    type: "AssetType"
+    subtype: "AssetSubtype"
+    parent_id: Optional[int]
+    description: Optional[str]
+    tags: Optional[List[str]]
+    thumbnail_url: str
+    image_url: str
+
+
+@dataclass
+class CompactComment(CompactModel):
+    """`Comment` without an instance `__dict__`"""
+    __slots__ = ("message", "sender_name")
+
+    message: str
+    sender_name: str
+
+
+@dataclass
+class CompactBuddy(CompactModel):
+    """`Buddy` without an instance `__dict__`"""
+    __slots__ = ("id", "name")
+
+    id: int
+    name: str
@@ -1,13 +1,13 @@
 import re
-import json
-from typing import Any, Dict, List
-from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
 
 import xmltodict
 
 from spore_api.constants import BASE_URL
 
-from .utils import datatime_from_string, find_dict_by_value
+from .achievements import get_achievement_catalog
+from .errors import SporeApiStatusError
+from .utils import datatime_from_string
 from .enums import AssetType, AssetSubtype
 from .models import (
     Achievement,
@@ -35,15 +35,9 @@ def parse_stats(text: str) -> Stats:
     http://www.spore.com/rest/stats
     """
     raw_data: Dict[str, Any] = xmltodict.parse(text)  # type: ignore
+    check_document_status(raw_data)
 
-    data: Dict[str, str] = raw_data["stats"]
-
-    return Stats(
-        total_uploads=int(data["totalUploads"]),
-        day_uploads=int(data["dayUploads"]),
-        total_users=int(data["totalUsers"]),
-        day_users=int(data["dayUsers"])
-    )
+    return build_stats(raw_data["stats"])
 
 
 def parse_creature(text: str) -> Creature:
@@ -54,35 +48,9 @@ def parse_creature(text: str) -> Creature:
     http://www.spore.com/rest/creature/<CreatureAssetId>
     """
     raw_data: Dict[str, Any] = xmltodict.parse(text)  # type: ignore
+    check_document_status(raw_data)
 
-    data: Dict[str, str] = raw_data["creature"]
-
-    return Creature(
-        asset_id=int(data["input"]),
-        cost=int(data["cost"]),
-        health=float(data["health"]),
-        height=float(data["height"]),
-        meanness=float(data["meanness"]),
-        cuteness=float(data["cuteness"]),
-        sense=float(data["sense"]),
-        bonecount=float(data["bonecount"]),
-        footcount=float(data["footcount"]),
-        graspercount=float(data["graspercount"]),
-        basegear=float(data["basegear"]),
-        carnivore=float(data["carnivore"]),
-        herbivore=float(data["herbivore"]),
-        glide=float(data["glide"]),
-        sprint=float(data["sprint"]),
-        stealth=float(data["stealth"]),
-        bite=float(data["bite"]),
-        charge=float(data["charge"]),
-        strike=float(data["strike"]),
-        spit=float(data["spit"]),
-        sing=float(data["sing"]),
-        dance=float(data["dance"]),
-        gesture=float(data["gesture"]),
-        posture=float(data["posture"]),
-    )
+    return build_creature(raw_data["creature"])
 
 
 def parse_user(text: str) -> User:
@@ -93,16 +61,9 @@ def parse_user(text: str) -> User:
     http://www.spore.com/rest/user/<Username>
     """
     raw_data: Dict[str, Any] = xmltodict.parse(text)  # type: ignore
+    check_document_status(raw_data)
 
-    data: Dict[str, str] = raw_data["user"]
-
-    return User(
-        id=int(data["id"]),
-        name=data["input"],
-        image_url=data["image"],
-        tagline=data["tagline"],
-        create_at=datatime_from_string(data["creation"])
-    )
+    return build_user(raw_data["user"])
 
 
 def parse_assets(text: str) -> Assets:
@@ -119,38 +80,14 @@ def parse_assets(text: str) -> Assets:
         text,
         force_list=("asset",),
     )  # type: ignore
+    check_document_status(raw_data)
 
     data: Dict[str, Any] = raw_data["assets"]
-    raw_assets: List[Dict[str, str]] = data["asset"]
+    raw_assets: List[Dict[str, str]] = data.get("asset", [])
 
     return Assets(
         assets=[
-            Asset(
-                id=int(raw_asser["id"]),
-                name=raw_asser["name"],
-                thumbnail_url=raw_asser["thumb"],
-                image_url=raw_asser["image"],
-                author_name=raw_asser["author"],
-                create_at=datatime_from_string(raw_asser["created"]),
-                rating=float(raw_asser["rating"]),
-                type=AssetType(raw_asser["type"]),
-                subtype=AssetSubtype(int(raw_asser["subtype"], 16)),
-                parent_id=(
-                    None
-                    if raw_asser["parent"] == "NULL" else
-                    int(raw_asser["parent"])
-                ),
-                description=(
-                    None
-                    if raw_asser["description"] == "NULL" else
-                    raw_asser["description"]
-                ),
-                tags=(
-                    None
-                    if raw_asser["tags"] == "NULL" else
-                    raw_asser["tags"].split(", ")
-                ),
-            )
+            build_asset(raw_asser)
             for raw_asser in raw_assets
         ]
     )
@@ -167,6 +104,7 @@ def parse_sporecasts(text: str) -> Sporecasts:
         text,
         force_list=("sporecast",)
     )  # type: ignore
+    check_document_status(raw_data)
 
     data: Dict[str, Any] = raw_data["sporecasts"]
     raw_sporecast: List[Dict[str, str]] = data["sporecast"]
@@ -174,17 +112,7 @@ def parse_sporecasts(text: str) -> Sporecasts:
     return Sporecasts(
         username=data["input"],
         sporecasts=[
-            Sporecast(
-                id=int(raw_sporecast["id"]),
-                title=raw_sporecast["title"],
-                subtitle=raw_sporecast["subtitle"],
-                author_name=raw_sporecast["author"],
-                update_at=datatime_from_string(raw_sporecast["updated"]),
-                rating=float(raw_sporecast["rating"]),
-                subscription_count=int(raw_sporecast["subscriptioncount"]),
-                tags=re.sub(r"\W", " ", raw_sporecast["tags"]).split(),
-                assets_count=int(raw_sporecast["count"])
-            )
+            build_sporecast(raw_sporecast)
             for raw_sporecast in raw_sporecast
         ]
     )
@@ -201,40 +129,16 @@ def parse_sporecast_assets(text: str) -> SporecastAssets:
         text,
         force_list=("asset",),
     )  # type: ignore
+    check_document_status(raw_data)
 
     data: Dict[str, Any] = raw_data["assets"]
-    raw_assets: List[Dict[str, str]] = data["asset"]
+    raw_assets: List[Dict[str, str]] = data.get("asset", [])
 
     return SporecastAssets(
         id=int(data["input"]),
         name=data["name"],
         assets=[
-            Asset(
-                id=int(raw_asser["id"]),
-                name=raw_asser["name"],
-                thumbnail_url=raw_asser["thumb"],
-                image_url=raw_asser["image"],
-                author_name=raw_asser["author"],
-                create_at=datatime_from_string(raw_asser["created"]),
-                rating=float(raw_asser["rating"]),
-                type=AssetType(raw_asser["type"]),
-                subtype=AssetSubtype(int(raw_asser["subtype"], 16)),
-                parent_id=(
-                    None
-                    if raw_asser["parent"] == "NULL" else
-                    int(raw_asser["parent"])
-                ),
-                description=(
-                    None
-                    if raw_asser["description"] == "NULL" else
-                    raw_asser["description"]
-                ),
-                tags=(
-                    None
-                    if raw_asser["tags"] == "NULL" else
-                    raw_asser["tags"].split(",")
-                )
-            )
+            build_asset(raw_asser, tags_separator=",")
             for raw_asser in raw_assets
         ]
     )
@@ -251,51 +155,20 @@ def parse_achievements(text: str) -> Achievements:
         text,
         force_list=("achievement",),
     )  # type: ignore
+    check_document_status(raw_data)
 
     data: Dict[str, Any] = raw_data["achievements"]
-    raw_achievements: List[Dict[str, str]] = data["achievement"]
-
-    with open(Path("./spore_api/static/achievements.json")) as fp:
-        achievements_data = json.load(fp)
-
-    achievements: List["Achievement"] = []
-
-    for raw_achievement in raw_achievements:
-        achievement_data = find_dict_by_value(
-            achievements_data,
-            "id",
-            raw_achievement["guid"],
-        )
-        name = (
-            achievement_data.get("name")
-            if achievement_data is not None
-            else None
-        )
-        description = (
-            achievement_data.get("description")
-            if achievement_data is not None
-            else None
-        )
-
-        achievements.append(
-            Achievement(
-                name=name,
-                description=description,
-                guid=raw_achievement["guid"],
-                image_url=(
-                    f"{BASE_URL}/static/war/images/achievements/{raw_achievement['guid']}.png"
-                ),
-                date=datatime_from_string(raw_achievement["date"])
-            )
-        )
+    raw_achievements: List[Dict[str, str]] = data.get("achievement", [])
 
     return Achievements(
         username=data["input"],
-        achievements=achievements,
+        achievements=[
+            build_achievement(raw_achievement)
+            for raw_achievement in raw_achievements
+        ],
     )
 
 
-@staticmethod
 def parse_full_asset(text: str) -> FullAsset:
     """
     [Pages]
@@ -307,43 +180,17 @@ def parse_full_asset(text: str) -> FullAsset:
         text,
         force_list=("comment",),
     )  # type: ignore
+    check_document_status(raw_data)
 
     data: Dict[str, Any] = raw_data["asset"]
-    raw_comments: List[Dict[str, str]] = data["comments"]["comment"]
+    raw_comments: List[Dict[str, str]] = (data["comments"] or {}).get("comment", [])
 
-    return FullAsset(
-        id=int(data["input"]),
-        name=data["name"],
-        author_name=data["author"],
-        create_at=datatime_from_string(data["created"]),
-        rating=float(data["rating"]),
-        type=AssetType(data["type"]),
-        subtype=AssetSubtype(int(data["subtype"], 16)),
-        parent_id=(
-            None
-            if data["parent"] == "NULL" else
-            int(data["parent"])
-        ),
-        description=(
-            None
-            if data["description"] == "NULL" else
-            data["description"]
-        ),
-        tags=(
-            None
-            if data["tags"] == "NULL" else
-            data["tags"].split(",")
-        ),
-        author_id=data["authorid"],
-        comments=Comments(
-            comments=[
-                Comment(
-                    message=raw_comment["message"],
-                    sender_name=raw_comment["sender"]
-                )
-                for raw_comment in raw_comments
-            ]
-        )
+    return build_full_asset(
+        data,
+        [
+            build_comment(raw_comment)
+            for raw_comment in raw_comments
+        ],
     )
 
 
@@ -358,18 +205,16 @@ def parse_asset_comments(text: str) -> AssetComments:
         text,
         force_list=("comment",),
     )  # type: ignore
+    check_document_status(raw_data)
 
     data: Dict[str, Any] = raw_data["comments"]
-    raw_comments: List[Dict[str, str]] = data["comment"]
+    raw_comments: List[Dict[str, str]] = data.get("comment", [])
 
     return AssetComments(
         id=int(data["input"]),
         name=data["name"],
         comments=[
-            Comment(
-                message=raw_comment["message"],
-                sender_name=raw_comment["sender"]
-            )
+            build_comment(raw_comment)
             for raw_comment in raw_comments
         ]
     )
@@ -389,16 +234,188 @@ def parse_buddies(text: str) -> Buddies:
         text,
         force_list=("buddy",),
     )  # type: ignore
+    check_document_status(raw_data)
 
     data: Dict[str, Any] = raw_data["users"]
-    raw_buddy: List[Dict[str, str]] = data["buddy"]
+    raw_buddy: List[Dict[str, str]] = data.get("buddy", [])
 
     return Buddies(
         buddies=[
-            Buddy(
-                name=raw_buddy["name"],
-                id=int(raw_buddy["id"])
-            )
+            build_buddy(raw_buddy)
             for raw_buddy in raw_buddy
         ]
     )
+
+
+def check_status(status: Optional[str]) -> None:
+    """Raise `SporeApiStatusError` if the status of the response is not 1"""
+    if status is not None and status.isdigit() and int(status) != 1:
+        raise SporeApiStatusError(int(status))
+
+
+def check_document_status(raw_data: Mapping[str, Any]) -> None:
+    for data in raw_data.values():
+        if isinstance(data, dict):
+            check_status(data.get("status"))
+
+
+# Builders of models from the texts of XML element children,
+# shared by all parser backends
+
+
+def build_stats(data: Mapping[str, Any]) -> Stats:
+    return Stats(
+        total_uploads=int(data["totalUploads"]),
+        day_uploads=int(data["dayUploads"]),
+        total_users=int(data["totalUsers"]),
+        day_users=int(data["dayUsers"])
+    )
+
+
+def build_creature(data: Mapping[str, Any]) -> Creature:
+    return Creature(
+        asset_id=int(data["input"]),
+        cost=int(data["cost"]),
+        health=float(data["health"]),
+        height=float(data["height"]),
+        meanness=float(data["meanness"]),
+        cuteness=float(data["cuteness"]),
+        sense=float(data["sense"]),
+        bonecount=float(data["bonecount"]),
+        footcount=float(data["footcount"]),
+        graspercount=float(data["graspercount"]),
+        basegear=float(data["basegear"]),
+        carnivore=float(data["carnivore"]),
+        herbivore=float(data["herbivore"]),
+        glide=float(data["glide"]),
+        sprint=float(data["sprint"]),
+        stealth=float(data["stealth"]),
+        bite=float(data["bite"]),
+        charge=float(data["charge"]),
+        strike=float(data["strike"]),
+        spit=float(data["spit"]),
+        sing=float(data["sing"]),
+        dance=float(data["dance"]),
+        gesture=float(data["gesture"]),
+        posture=float(data["posture"]),
+    )
+
+
+def build_user(data: Mapping[str, Any]) -> User:
+    return User(
+        id=int(data["id"]),
+        name=data["input"],
+        image_url=data["image"],
+        tagline=data["tagline"],
+        create_at=datatime_from_string(data["creation"])
+    )
+
+
+def build_asset(raw_asser: Mapping[str, Any], tags_separator: str = ", ") -> Asset:
+    return Asset(
+        id=int(raw_asser["id"]),
+        name=raw_asser["name"],
+        thumbnail_url=raw_asser["thumb"],
+        image_url=raw_asser["image"],
+        author_name=raw_asser["author"],
+        create_at=datatime_from_string(raw_asser["created"]),
+        rating=float(raw_asser["rating"]),
+        type=AssetType(raw_asser["type"]),
+        subtype=AssetSubtype(int(raw_asser["subtype"], 16)),
+        parent_id=(
+            None
+            if raw_asser["parent"] == "NULL" else
+            int(raw_asser["parent"])
+        ),
+        description=(
+            None
+            if raw_asser["description"] == "NULL" else
+            raw_asser["description"]
+        ),
+        tags=(
+            None
+            if raw_asser["tags"] == "NULL" else
+            raw_asser["tags"].split(tags_separator)
+        ),
+    )
+
+
+def build_sporecast(raw_sporecast: Mapping[str, Any]) -> Sporecast:
+    return Sporecast(
+        id=int(raw_sporecast["id"]),
+        title=raw_sporecast["title"],
+        subtitle=raw_sporecast["subtitle"],
+        author_name=raw_sporecast["author"],
+        update_at=datatime_from_string(raw_sporecast["updated"]),
+        rating=float(raw_sporecast["rating"]),
+        subscription_count=int(raw_sporecast["subscriptioncount"]),
+        tags=re.sub(r"\W", " ", raw_sporecast["tags"]).split(),
+        assets_count=int(raw_sporecast["count"])
+    )
+
+
+def build_achievement(raw_achievement: Mapping[str, Any]) -> Achievement:
+    achievement_data: Optional[Dict[str, Any]] = (
+        get_achievement_catalog().get(raw_achievement["guid"])
+    )
+
+    return Achievement(
+        name=(
+            achievement_data.get("name")
+            if achievement_data is not None
+            else None
+        ),
+        description=(
+            achievement_data.get("description")
+            if achievement_data is not None
+            else None
+        ),
+        guid=raw_achievement["guid"],
+        image_url=(
+            f"{BASE_URL}/static/war/images/achievements/{raw_achievement['guid']}.png"
+        ),
+        date=datatime_from_string(raw_achievement["date"])
+    )
+
+
+def build_full_asset(data: Mapping[str, Any], comments: List[Comment]) -> FullAsset:
+    return FullAsset(
+        id=int(data["input"]),
+        name=data["name"],
+        author_name=data["author"],
+        create_at=datatime_from_string(data["created"]),
+        rating=float(data["rating"]),
+        type=AssetType(data["type"]),
+        subtype=AssetSubtype(int(data["subtype"], 16)),
+        parent_id=(
+            None
+            if data["parent"] == "NULL" else
+            int(data["parent"])
+        ),
+        description=(
+            None
+            if data["description"] == "NULL" else
+            data["description"]
+        ),
+        tags=(
+            None
+            if data["tags"] == "NULL" else
+            data["tags"].split(",")
+        ),
+        author_id=data["authorid"],
+        comments=Comments(comments=comments)
+    )
+
+
+def build_comment(raw_comment: Mapping[str, Any]) -> Comment:
+    return Comment(
+        message=raw_comment["message"],
+        sender_name=raw_comment["sender"]
+    )
+
+
+def build_buddy(raw_buddy: Mapping[str, Any]) -> Buddy:
+    return Buddy(
+        name=raw_buddy["name"],
+        id=int(raw_buddy["id"])
+    )
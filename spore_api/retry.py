@@ -0,0 +1,163 @@
+import random
+import asyncio
+from collections import deque
+from typing import Collection, Deque, Dict, Optional
+
+import aiohttp
+
+from .enums import Endpoint
+
+
+DEFAULT_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy():
+    """
+    Retries of transient failures: connection errors, timeouts,
+    and `retry_statuses` responses of idempotent requests.
+
+    Attempt `n` waits up to `backoff * multiplier ** n` seconds
+    (at most `max_backoff`, or the `Retry-After` of the response),
+    a random part of it with `jitter`.
+
+    Retries are limited by a budget: every request adds `budget_ratio`
+    tokens up to `budget_reserve`, a retry takes one. So retries can't
+    multiply the load on a failing server, None disables the budget.
+    """
+    def __init__(
+        self,
+        attempts: int = 3,
+        backoff: float = 0.1,
+        multiplier: float = 2.0,
+        max_backoff: float = 10.0,
+        jitter: bool = True,
+        retry_statuses: Collection[int] = DEFAULT_RETRY_STATUSES,
+        budget_ratio: Optional[float] = 0.2,
+        budget_reserve: float = 10.0,
+    ) -> None:
+        if attempts < 1:
+            raise ValueError("attempts must be positive")
+
+        self.attempts = attempts
+        self.backoff = backoff
+        self.multiplier = multiplier
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.budget_ratio = budget_ratio
+        self.budget_reserve = budget_reserve
+        self.retries = 0
+        self._tokens = budget_reserve
+
+    def on_request(self) -> None:
+        if self.budget_ratio is not None:
+            self._tokens = min(self.budget_reserve, self._tokens + self.budget_ratio)
+
+    def should_retry(self, method: str, attempt: int, error: BaseException) -> bool:
+        """
+        Whether to retry after the failed `attempt` (0 is the first one),
+        takes a token of the budget if so
+        """
+        if (
+            attempt + 1 >= self.attempts
+            or method.upper() not in IDEMPOTENT_METHODS
+            or not self.is_retryable(error)
+        ):
+            return False
+
+        if self.budget_ratio is not None:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+
+        self.retries += 1
+        return True
+
+    def is_retryable(self, error: BaseException) -> bool:
+        if isinstance(error, aiohttp.ClientResponseError):
+            return error.status in self.retry_statuses
+        return isinstance(
+            error,
+            (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError, asyncio.TimeoutError),
+        )
+
+    def get_delay(self, attempt: int, error: Optional[BaseException] = None) -> float:
+        delay = min(self.max_backoff, self.backoff * self.multiplier ** attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        retry_after = _get_retry_after(error)
+        if retry_after is not None:
+            delay = max(delay, min(self.max_backoff, retry_after))
+
+        return delay
+
+
+class HedgePolicy():
+    """
+    Hedged requests: if a request has not answered within
+    the `quantile` of the recent latencies of its endpoint, up to
+    `max_hedges` duplicates are sent and the first response wins.
+
+    Hedging starts after `min_samples` latencies of the endpoint
+    are recorded, of the last `window` ones. Attempts cancelled
+    by a faster one are recorded with their elapsed time.
+    """
+    def __init__(
+        self,
+        quantile: float = 0.95,
+        max_hedges: int = 1,
+        min_delay: float = 0.01,
+        min_samples: int = 20,
+        window: int = 500,
+    ) -> None:
+        if not 0 < quantile < 1:
+            raise ValueError("quantile must be between 0 and 1")
+
+        self.quantile = quantile
+        self.max_hedges = max_hedges
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.hedges = 0
+        self._latencies: Dict[Optional[Endpoint], Deque[float]] = {}
+        self._delays: Dict[Optional[Endpoint], float] = {}
+        self._stale: Dict[Optional[Endpoint], int] = {}
+
+    def record(self, endpoint: Optional[Endpoint], latency: float) -> None:
+        latencies = self._latencies.get(endpoint)
+        if latencies is None:
+            latencies = self._latencies[endpoint] = deque(maxlen=self.window)
+
+        latencies.append(latency)
+        self._stale[endpoint] = self._stale.get(endpoint, 0) + 1
+
+    def get_delay(self, endpoint: Optional[Endpoint]) -> Optional[float]:
+        """The time to wait before hedging, None if it is not known yet"""
+        latencies = self._latencies.get(endpoint)
+        if latencies is None or len(latencies) < self.min_samples:
+            return None
+
+        # Sorting the window on every request is too slow,
+        # the quantile is recomputed after 5% of it is replaced
+        if self._stale[endpoint] * 20 >= len(latencies) or endpoint not in self._delays:
+            ordered = sorted(latencies)
+            self._delays[endpoint] = max(
+                self.min_delay,
+                ordered[int(self.quantile * (len(ordered) - 1))],
+            )
+            self._stale[endpoint] = 0
+
+        return self._delays[endpoint]
+
+
+def _get_retry_after(error: Optional[BaseException]) -> Optional[float]:
+    if not isinstance(error, aiohttp.ClientResponseError) or not error.headers:
+        return None
+
+    retry_after = error.headers.get(aiohttp.hdrs.RETRY_AFTER)
+    try:
+        return None if retry_after is None else float(retry_after)
+    except ValueError:
+        return None
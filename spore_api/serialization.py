@@ -0,0 +1,145 @@
+"""
+Fast JSON serialization of the models.
+
+Encoders are generated once per model type from its type hints,
+so datetimes, enums and nested models are converted without
+the per-call introspection of `DataClassJsonMixin.to_json`.
+`dumps(model)` gives the same text as `model.to_json()`.
+"""
+
+import json
+import typing
+from dataclasses import fields, is_dataclass
+from datetime import datetime
+from enum import Enum
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Optional,
+)
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None
+
+from . import models
+
+
+_encoders: Dict[type, Callable[[Any], Dict[str, Any]]] = {}
+
+
+def get_encoder(model_type: type) -> Callable[[Any], Dict[str, Any]]:
+    """Get the function converting a model to a JSON compatible dict"""
+    encoder = _encoders.get(model_type)
+    if encoder is None:
+        encoder = _encoders[model_type] = _compile_encoder(model_type)
+    return encoder
+
+
+def to_jsonable(model: Any) -> Dict[str, Any]:
+    return get_encoder(type(model))(model)
+
+
+def dumps(model: Any, compact: bool = False) -> str:
+    """
+    Serialize a model to JSON.
+    The default output is byte-compatible with `model.to_json()`,
+    `compact` drops the whitespace and uses orjson when it is installed.
+    """
+    data = to_jsonable(model)
+
+    if not compact:
+        return json.dumps(data)
+    if orjson is not None:
+        return orjson.dumps(data).decode()
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def write_json_lines(items: Iterable[Any], fp: IO[str], compact: bool = False) -> int:
+    """Write models one JSON document per line, return the count of them"""
+    count = 0
+    for model in items:
+        fp.write(dumps(model, compact=compact))
+        fp.write("\n")
+        count += 1
+    return count
+
+
+def write_json_array(items: Iterable[Any], fp: IO[str], compact: bool = False) -> int:
+    """Write models as one JSON array without building it in memory"""
+    separator = "," if compact else ", "
+
+    count = 0
+    fp.write("[")
+    for model in items:
+        if count:
+            fp.write(separator)
+        fp.write(dumps(model, compact=compact))
+        count += 1
+    fp.write("]")
+
+    return count
+
+
+def _compile_encoder(model_type: type) -> Callable[[Any], Dict[str, Any]]:
+    if not is_dataclass(model_type):
+        raise TypeError(f"{model_type!r} is not a model")
+
+    hints = typing.get_type_hints(model_type, vars(models))
+    namespace: Dict[str, Any] = {}
+    items = []
+
+    for index, field in enumerate(fields(model_type)):
+        value = f"model.{field.name}"
+        encode_value = _get_value_encoder(hints[field.name])
+
+        if encode_value is not None:
+            name = f"_encode_{index}"
+            namespace[name] = encode_value
+            value = f"{name}({value})"
+
+        items.append(f"{field.name!r}: {value}")
+
+    source = "def encode(model):\n    return {" + ", ".join(items) + "}\n"
+    exec(source, namespace)
+
+    return namespace["encode"]
+
+
+def _get_value_encoder(value_type: Any) -> Optional[Callable[[Any], Any]]:
+    """None means that the value is already JSON compatible"""
+    origin = getattr(value_type, "__origin__", None)
+    arguments = getattr(value_type, "__args__", ())
+
+    if origin is typing.Union:
+        encode_value = _get_value_encoder(
+            next(argument for argument in arguments if argument is not type(None))
+        )
+        if encode_value is None:
+            return None
+        return lambda value: None if value is None else encode_value(value)  # type: ignore
+
+    if origin in (list, typing.List):
+        encode_item = _get_value_encoder(arguments[0])
+        if encode_item is None:
+            return None
+        return lambda value: [encode_item(item) for item in value]  # type: ignore
+
+    if value_type is datetime:
+        return datetime.timestamp
+
+    if isinstance(value_type, type) and issubclass(value_type, Enum):
+        return _encode_enum
+
+    if is_dataclass(value_type):
+        return get_encoder(value_type)  # type: ignore
+
+    return None
+
+
+def _encode_enum(value: Enum) -> Any:
+    return value.value
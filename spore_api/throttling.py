@@ -0,0 +1,144 @@
+import time
+import asyncio
+from collections import deque
+from typing import Deque, Dict, Mapping, Optional, Tuple, Union
+
+from .enums import Endpoint
+
+
+class TokenBucket():
+    """
+    Allows `rate` acquisitions per second on average
+    and bursts of up to `burst` acquisitions.
+    Waiters are served in order.
+    """
+    def __init__(self, rate: float, burst: Optional[float] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = max(1.0, rate if burst is None else burst)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        # Created on first use to be bound to the running loop
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self) -> None:
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+
+class RateLimiter():
+    """
+    Token buckets for all requests and for endpoint families.
+    `endpoint_rates` values are a rate or a `(rate, burst)` pair.
+    """
+    def __init__(
+        self,
+        rate: Optional[float] = None,
+        burst: Optional[float] = None,
+        endpoint_rates: Optional[
+            Mapping[Endpoint, Union[float, Tuple[float, Optional[float]]]]
+        ] = None,
+    ) -> None:
+        self._bucket = None if rate is None else TokenBucket(rate, burst)
+        self._endpoint_buckets: Dict[Endpoint, TokenBucket] = {}
+
+        for endpoint, endpoint_rate in (endpoint_rates or {}).items():
+            self._endpoint_buckets[endpoint] = (
+                TokenBucket(*endpoint_rate)
+                if isinstance(endpoint_rate, tuple) else
+                TokenBucket(endpoint_rate)
+            )
+
+    async def acquire(self, endpoint: Optional[Endpoint] = None) -> None:
+        endpoint_bucket = self._endpoint_buckets.get(endpoint)  # type: ignore
+        if endpoint_bucket is not None:
+            await endpoint_bucket.acquire()
+        if self._bucket is not None:
+            await self._bucket.acquire()
+
+
+class AdaptiveConcurrency():
+    """
+    Limit of concurrent requests adjusted by AIMD:
+    it grows by `increase` per `limit` successful requests answered within
+    `target_latency` seconds, and is multiplied by `decrease_factor` on
+    overload (5xx, timeouts, Spore API errors), at most once per
+    `target_latency` so that one burst of failures counts once.
+    """
+    def __init__(
+        self,
+        initial: float = 10,
+        minimum: float = 1,
+        maximum: float = 100,
+        increase: float = 1,
+        decrease_factor: float = 0.5,
+        target_latency: float = 1.0,
+    ) -> None:
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.target_latency = target_latency
+        self.in_flight = 0
+        self._decreased_at = float("-inf")
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    async def acquire(self) -> None:
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # The slot is taken on our behalf by `_wake`
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(None)
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: Optional[float], overloaded: bool = False) -> None:
+        """Free the slot, `latency` is None if the request didn't complete"""
+        self.in_flight -= 1
+
+        if overloaded:
+            self._decrease()
+        elif latency is not None and latency <= self.target_latency:
+            self.limit = min(self.maximum, self.limit + self.increase / self.limit)
+
+        self._wake()
+
+    def on_overload(self) -> None:
+        """Report an overload found after the request was released"""
+        self._decrease()
+
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._decreased_at >= self.target_latency:
+            self.limit = max(self.minimum, self.limit * self.decrease_factor)
+            self._decreased_at = now
+
+    def _wake(self) -> None:
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
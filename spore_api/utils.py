@@ -1,18 +1,75 @@
-from typing import Any, Dict, List, Optional
-from datetime import datetime
+import re
+from typing import Optional
+from datetime import datetime, timezone
+
+from .enums import Endpoint
+
+
+_ENDPOINT_PATHS = {
+    ("stats", None): Endpoint.stats,
+    ("creature", None): Endpoint.creature,
+    ("user", None): Endpoint.user,
+    ("sporecasts", None): Endpoint.sporecasts,
+    ("achievements", None): Endpoint.achievements,
+    ("asset", None): Endpoint.asset,
+    ("comments", None): Endpoint.comments,
+    ("assets", "user"): Endpoint.user_assets,
+    ("assets", "sporecast"): Endpoint.sporecast_assets,
+    ("assets", "search"): Endpoint.search,
+    ("users", "buddies"): Endpoint.buddies,
+    ("users", "subscribers"): Endpoint.subscribers,
+}
+_ENDPOINT_PATH_RE = re.compile(r"/rest/([^/]+)(?:/([^/]+))?")
+
+
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
 
 
 def datatime_from_string(string: str) -> datetime:
-    return datetime.strptime(string, "%Y-%m-%d %H:%M:%S.%f")
+    """
+    Parse `DATETIME_FORMAT`.
+    The fraction is padded to 6 digits, which `datetime.fromisoformat` reads
+    on all Python versions much faster than `datetime.strptime`.
+    `strptime` is still used for anything else, to accept and reject
+    the same strings with the same errors.
+    """
+    if (
+        20 < len(string) <= 26
+        and string[10] == " "
+        and string[19] == "."
+        and string[20:].isdigit()
+    ):
+        try:
+            return datetime.fromisoformat(string.ljust(26, "0"))
+        except ValueError:
+            pass
+
+    return datetime.strptime(string, DATETIME_FORMAT)
+
+
+def timestamp_from_datetime(value: datetime) -> float:
+    """
+    POSIX timestamp of the datetime. Naive datetimes, like the parsed
+    API times, are taken as UTC, so the timestamp doesn't depend on the local timezone
+    """
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def datetime_from_timestamp(timestamp: float) -> datetime:
+    """Naive UTC datetime of the timestamp, the inverse of `timestamp_from_datetime`"""
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(tzinfo=None)
 
 
-def find_dict_by_value(
-    lst: List[Dict[Any, Any]],
-    seek_key: Any,
-    seek_value: Any,
-) -> Optional[Dict[Any, Any]]:
-    for dct in lst:
-        if dct.get(seek_key) == seek_value:
-            return dct
+def endpoint_from_url(url: str) -> Optional[Endpoint]:
+    """Get the endpoint family of a Spore REST API url"""
+    match = _ENDPOINT_PATH_RE.search(url)
+    if match is None:
+        return None
 
-    return None
+    section, subsection = match.groups()
+    return (
+        _ENDPOINT_PATHS.get((section, None))
+        or _ENDPOINT_PATHS.get((section, subsection))
+    )
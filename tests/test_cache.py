@@ -0,0 +1,147 @@
+import asyncio
+from typing import List
+
+from aiohttp import web
+
+from benchmarks import fixtures
+from spore_api import Endpoint, MemoryCache, SporeApiStatusError, SporeClient
+
+
+ASSET_ID = 500000000000
+
+
+async def _serve(responses: List[str]) -> web.AppRunner:
+    """Serve `/rest/creature/<id>` with the next document of `responses` per request"""
+    async def handle(request: web.Request) -> web.Response:
+        return web.Response(text=responses.pop(0), content_type="text/xml")
+
+    app = web.Application()
+    app.router.add_get("/rest/creature/{asset_id}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+def test_status_error_is_not_cached() -> None:
+    async def main() -> None:
+        responses = [
+            fixtures.status_error_document("creature"),
+            fixtures.creature_document(ASSET_ID),
+        ]
+        runner = await _serve(responses)
+        host, port = runner.addresses[0][:2]
+        cache = MemoryCache()
+        try:
+            async with SporeClient(base_url=f"http://{host}:{port}", cache=cache) as client:
+                try:
+                    await client.get_creature(ASSET_ID)
+                except SporeApiStatusError:
+                    pass
+                else:
+                    raise AssertionError("The status error was not raised")
+
+                # Creatures never expire, a cached error would be raised forever
+                creature = await client.get_creature(ASSET_ID)
+                assert creature.asset_id == ASSET_ID
+                assert responses == []
+
+                assert await client.get_creature(ASSET_ID) is creature
+                assert cache.hits == 1
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def test_too_large_entry_replaces_the_old_one() -> None:
+    cache = MemoryCache(max_bytes=10)
+    cache.set("url", "small", None)
+    cache.set("url", "far too large", None)
+    assert cache.get("url") is None
+    assert cache.size == 0 and len(cache) == 0
+
+
+class _Versioned():
+    """Serves `/rest/creature/<id>` with an ETag, and 304 to requests that have it"""
+    def __init__(self) -> None:
+        self.etag = '"1"'
+        self.conditional_requests = 0
+        self.not_modified = 0
+
+    async def handle(self, request: web.Request) -> web.Response:
+        if_none_match = request.headers.get("If-None-Match")
+        if if_none_match is not None:
+            self.conditional_requests += 1
+            if if_none_match == self.etag:
+                self.not_modified += 1
+                return web.Response(status=304, headers={"ETag": self.etag})
+
+        return web.Response(
+            text=fixtures.creature_document(ASSET_ID),
+            content_type="text/xml",
+            headers={"ETag": self.etag},
+        )
+
+    async def serve(self) -> web.AppRunner:
+        app = web.Application()
+        app.router.add_get("/rest/creature/{asset_id}", self.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        return runner
+
+
+def test_expired_entry_is_revalidated() -> None:
+    async def main() -> None:
+        versioned = _Versioned()
+        runner = await versioned.serve()
+        host, port = runner.addresses[0][:2]
+        cache = MemoryCache()
+        try:
+            # Entries expire at once
+            async with SporeClient(
+                base_url=f"http://{host}:{port}",
+                cache=cache,
+                cache_ttls={Endpoint.creature: 0},
+            ) as client:
+                creature = await client.get_creature(ASSET_ID)
+                assert cache.misses == 1 and versioned.conditional_requests == 0
+
+                assert await client.get_creature(ASSET_ID) == creature
+                assert versioned.not_modified == 1
+                assert cache.hits == 1 and cache.revalidations == 1
+
+                # A changed response replaces the entry
+                versioned.etag = '"2"'
+                assert await client.get_creature(ASSET_ID) == creature
+                assert versioned.conditional_requests == 2 and versioned.not_modified == 1
+                assert cache.misses == 2
+                assert cache.get(f"http://{host}:{port}/rest/creature/{ASSET_ID}").etag == '"2"'
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def test_revalidation_can_be_disabled() -> None:
+    async def main() -> None:
+        versioned = _Versioned()
+        runner = await versioned.serve()
+        host, port = runner.addresses[0][:2]
+        cache = MemoryCache()
+        try:
+            async with SporeClient(
+                base_url=f"http://{host}:{port}",
+                cache=cache,
+                cache_ttls={Endpoint.creature: 0},
+                revalidate=False,
+            ) as client:
+                await client.get_creature(ASSET_ID)
+                await client.get_creature(ASSET_ID)
+                assert versioned.conditional_requests == 0
+                assert cache.misses == 2 and cache.revalidations == 0
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
@@ -0,0 +1,101 @@
+import asyncio
+import functools
+import json
+from typing import Any, Dict, List, Tuple
+
+import pytest
+from asyncclick.testing import CliRunner
+
+from benchmarks.mock_server import MockSporeServer
+from spore_api import client as client_module
+from spore_api.__main__ import cli
+
+
+ASSET_ID = 500000000000
+
+
+def _batch(
+    monkeypatch: pytest.MonkeyPatch,
+    args: List[str],
+    input: str,
+    **server_options: Any,
+) -> Tuple[int, List[Dict[str, Any]], int]:
+    """Run `batch` against the mock server, return the exit code, the lines and the requests"""
+    async def main() -> Tuple[int, List[Dict[str, Any]], int]:
+        server = MockSporeServer(**server_options)
+        base_url = await server.start()
+        monkeypatch.setattr(
+            client_module,
+            "SporeClient",
+            functools.partial(client_module.SporeClient, base_url=base_url),
+        )
+        try:
+            result = await CliRunner().invoke(cli, ["batch", *args], input=input)
+        finally:
+            await server.close()
+
+        if result.exception is not None and not isinstance(result.exception, SystemExit):
+            raise result.exception
+        lines = [json.loads(line) for line in result.output.splitlines()]
+        return result.exit_code, lines, server.requests
+
+    return asyncio.run(main())
+
+
+def test_batch_runs_every_line(monkeypatch: pytest.MonkeyPatch) -> None:
+    input = "\n".join([
+        "# Comments and blank lines are skipped",
+        "",
+        f"get-creature {ASSET_ID}",
+        "get-user-info MaxisCactus",
+        "get-user-assets MaxisCactus 0 5",
+        "get-stats",
+    ])
+    exit_code, lines, requests = _batch(monkeypatch, ["--concurrency", "2"], input)
+
+    assert exit_code == 0
+    assert requests == 4
+    results = {line["input"]: line["result"] for line in lines}
+    assert results.keys() == {
+        f"get-creature {ASSET_ID}",
+        "get-user-info MaxisCactus",
+        "get-user-assets MaxisCactus 0 5",
+        "get-stats",
+    }
+    assert results[f"get-creature {ASSET_ID}"]["asset_id"] == ASSET_ID
+    assert len(results["get-user-assets MaxisCactus 0 5"]["assets"]) == 5
+
+
+def test_batch_command_option(monkeypatch: pytest.MonkeyPatch) -> None:
+    input = "\n".join(str(ASSET_ID + index) for index in range(10))
+    exit_code, lines, requests = _batch(monkeypatch, ["--command", "get-creature"], input)
+
+    assert exit_code == 0
+    assert requests == 10
+    assert sorted(line["result"]["asset_id"] for line in lines) == [
+        ASSET_ID + index for index in range(10)
+    ]
+
+
+def test_batch_reports_errors_and_continues(monkeypatch: pytest.MonkeyPatch) -> None:
+    input = "\n".join([
+        "no-such-command 1",
+        "get-creature not-an-id",
+        f"get-creature {ASSET_ID}",
+    ])
+    exit_code, lines, requests = _batch(monkeypatch, [], input)
+
+    assert exit_code == 1
+    assert requests == 1
+    lines_by_input = {line["input"]: line for line in lines}
+    assert "No such command" in lines_by_input["no-such-command 1"]["error"]
+    assert "not-an-id" in lines_by_input["get-creature not-an-id"]["error"]
+    assert lines_by_input[f"get-creature {ASSET_ID}"]["result"]["asset_id"] == ASSET_ID
+
+
+def test_batch_reports_request_errors(monkeypatch: pytest.MonkeyPatch) -> None:
+    exit_code, lines, _ = _batch(monkeypatch, [], f"get-creature {ASSET_ID}", error_rate=1.0)
+
+    assert exit_code == 1
+    assert len(lines) == 1
+    assert "503" in lines[0]["error"]
@@ -0,0 +1,66 @@
+import asyncio
+
+from benchmarks.mock_server import MockSporeServer
+from spore_api import Endpoint, SporeApiStatusError, SporeClient
+
+
+ASSET_ID = 500000000000
+
+
+def test_requests_are_not_coalesced_by_default() -> None:
+    async def main() -> None:
+        server = MockSporeServer(latency=0.05)
+        base_url = await server.start()
+        try:
+            async with SporeClient(base_url=base_url) as client:
+                first, second = await asyncio.gather(
+                    client.get_creature(ASSET_ID),
+                    client.get_creature(ASSET_ID),
+                )
+                assert first is not second
+                assert server.requests == 2
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_shared_error_reaches_every_caller() -> None:
+    async def main() -> None:
+        server = MockSporeServer(latency=0.05, status_error_rate=1.0)
+        base_url = await server.start()
+        try:
+            client = SporeClient(base_url=base_url, coalesced_endpoints={Endpoint.creature})
+            async with client:
+                results = await asyncio.gather(
+                    *(client.get_creature(ASSET_ID) for _ in range(3)),
+                    return_exceptions=True,
+                )
+                assert all(isinstance(result, SporeApiStatusError) for result in results)
+                assert server.requests == 1
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_request() -> None:
+    async def main() -> None:
+        server = MockSporeServer(latency=0.1)
+        base_url = await server.start()
+        try:
+            client = SporeClient(base_url=base_url, coalesced_endpoints={Endpoint.creature})
+            async with client:
+                cancelled = asyncio.ensure_future(client.get_creature(ASSET_ID))
+                waiting = asyncio.ensure_future(client.get_creature(ASSET_ID))
+                await asyncio.sleep(0.02)
+                cancelled.cancel()
+
+                creature = await waiting
+                assert creature.asset_id == ASSET_ID
+                assert cancelled.cancelled()
+                assert server.requests == 1
+        finally:
+            await server.close()
+
+    asyncio.run(main())
@@ -0,0 +1,114 @@
+import asyncio
+import random
+from datetime import datetime
+from pathlib import Path
+from typing import AsyncIterator, Dict, List
+
+from spore_api import BuddyGraphCrawler
+from spore_api.crawler import RELATION_BUDDY
+from spore_api.models import Buddy, User
+
+
+USERS = 200
+
+
+class _FakeClient():
+    """Random buddy graph of `USERS` users named `u<id>`"""
+    def __init__(self) -> None:
+        rng = random.Random(1)
+        self.buddies: Dict[int, List[int]] = {
+            user_id: rng.sample(range(USERS), 5) for user_id in range(USERS)
+        }
+        self.subscribers: Dict[int, List[int]] = {user_id: [] for user_id in range(USERS)}
+        for user_id, buddies in self.buddies.items():
+            for buddy_id in buddies:
+                self.subscribers[buddy_id].append(user_id)
+
+    async def get_user_info(self, username: str) -> User:
+        return User(
+            id=int(username[1:]),
+            name=username,
+            image_url="",
+            tagline="",
+            create_at=datetime(2015, 1, 1),
+        )
+
+    async def _iter_users(self, user_ids: List[int]) -> AsyncIterator[Buddy]:
+        await asyncio.sleep(0)
+        for user_id in user_ids:
+            yield Buddy(id=user_id, name=f"u{user_id}")
+
+    def iter_user_buddies(
+        self,
+        username: str,
+        page_size: int,
+        read_ahead: int,
+    ) -> AsyncIterator[Buddy]:
+        return self._iter_users(self.buddies[int(username[1:])])
+
+    def iter_user_subscribers(
+        self,
+        username: str,
+        page_size: int,
+        read_ahead: int,
+    ) -> AsyncIterator[Buddy]:
+        return self._iter_users(self.subscribers[int(username[1:])])
+
+
+class _Crash(BaseException):
+    pass
+
+
+def test_checkpoints_append_edges_and_resume(tmp_path: Path) -> None:
+    client = _FakeClient()
+    checkpoint_path = tmp_path / "crawl.json"
+    edges_path = tmp_path / "crawl.json.edges"
+    crawler = BuddyGraphCrawler(
+        client,  # type: ignore
+        concurrency=4,
+        checkpoint_path=checkpoint_path,
+        checkpoint_interval=10,
+    )
+
+    edges_sizes: List[int] = []
+    save_checkpoint = crawler.save_checkpoint
+
+    def save_and_crash() -> None:
+        save_checkpoint()
+        edges_sizes.append(edges_path.stat().st_size)
+        if len(edges_sizes) == 3:
+            # A chunk written after the last checkpoint is dropped on resume
+            with open(edges_path, "ab") as fp:
+                fp.write(crawler.graph.dump_edges())
+            raise _Crash
+
+    crawler.save_checkpoint = save_and_crash  # type: ignore
+    try:
+        asyncio.run(crawler.crawl(["u0"]))
+    except _Crash:
+        pass
+    else:
+        raise AssertionError("The crawl did not crash")
+
+    # Every checkpoint only appended the new edges
+    assert edges_sizes == sorted(edges_sizes)
+    first_size = edges_path.read_bytes()[:edges_sizes[0]]
+
+    resumed = BuddyGraphCrawler(client, checkpoint_path=checkpoint_path)  # type: ignore
+    assert resumed.crawled == crawler.crawled
+    assert len(resumed.graph) == len(crawler.graph)
+    graph = asyncio.run(resumed.crawl())
+    assert edges_path.read_bytes()[:edges_sizes[0]] == first_size
+
+    assert resumed.crawled == USERS
+    expected_edges = {
+        (user_id, buddy_id)
+        for user_id, buddies in client.buddies.items()
+        for buddy_id in buddies
+    }
+    assert len(graph) == 2 * sum(len(buddies) for buddies in client.buddies.values())
+    assert set(graph.iter_edges(RELATION_BUDDY)) == expected_edges
+    assert graph.names[3] == "u3"
+
+    reloaded = BuddyGraphCrawler(client, checkpoint_path=checkpoint_path)  # type: ignore
+    assert list(reloaded.graph.iter_edges()) == list(graph.iter_edges())
@@ -0,0 +1,39 @@
+import pytest
+
+from benchmarks import fixtures
+from spore_api import SporeApiStatusError, parsers
+
+pytest.importorskip("numpy")
+
+from spore_api.creature_table import CreatureTable  # noqa: E402
+
+
+def test_from_xml_builds_same_creatures() -> None:
+    texts = [fixtures.creature_document(500000000000 + index) for index in range(10)]
+
+    assert list(CreatureTable.from_xml(texts)) == [parsers.parse_creature(text) for text in texts]
+
+
+def test_from_xml_keeps_large_ids() -> None:
+    asset_id = 2 ** 53 + 1
+    table = CreatureTable.from_xml([fixtures.creature_document(asset_id)])
+
+    assert table[0].asset_id == asset_id
+
+
+def test_from_xml_reads_attributes_and_whitespace() -> None:
+    text = fixtures.creature_document(500000000000)
+    formatted = text.replace("<cost>", '<cost type="int">\n  ').replace("</cost>", "\n</cost >")
+
+    assert CreatureTable.from_xml([formatted])[0] == parsers.parse_creature(text)
+
+
+def test_extend_from_xml_appends_nothing_on_status_error() -> None:
+    table = CreatureTable.from_xml([fixtures.creature_document(500000000000)])
+
+    with pytest.raises(SporeApiStatusError):
+        table.extend_from_xml([
+            fixtures.creature_document(500000000001),
+            fixtures.status_error_document("creature"),
+        ])
+    assert len(table) == 1
@@ -0,0 +1,108 @@
+import asyncio
+import calendar
+import json
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import List
+
+import pytest
+from aiohttp import web
+
+from benchmarks import fixtures
+from spore_api import NewAssetsFeed, SporeClient
+
+
+FIRST_ID = 500000000000
+EPOCH = datetime(2015, 6, 13)
+
+
+class _Uploads():
+    """Serves `/rest/assets/search/{view_type}/{start}/{length}`, newest uploads first"""
+    def __init__(self) -> None:
+        self.count = 0
+        self.requests = 0
+
+    def upload(self, count: int) -> None:
+        self.count += count
+
+    def get_created(self, index: int) -> datetime:
+        return EPOCH + timedelta(minutes=index)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        start = int(request.match_info["start"])
+        length = int(request.match_info["length"])
+        indexes = range(self.count - 1 - start, max(-1, self.count - 1 - start - length), -1)
+        items = "".join(
+            fixtures.asset_xml(index).replace(
+                f"<created>2015-06-13 10:11:{index % 60:02d}.{index % 1000:03d}</created>",
+                f"<created>{self.get_created(index):%Y-%m-%d %H:%M:%S}.000</created>",
+            )
+            for index in indexes
+        )
+        text = f"<assets><status>1</status><input>newest</input>{items}</assets>"
+        return web.Response(text=text, content_type="text/xml")
+
+    async def serve(self) -> web.AppRunner:
+        app = web.Application()
+        app.router.add_get("/rest/assets/search/{view_type}/{start}/{length}", self.handle)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        return runner
+
+
+def test_feed_yields_new_uploads_oldest_first(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    state_path = tmp_path / "feed.json"
+    if hasattr(time, "tzset"):
+        monkeypatch.setenv("TZ", "America/New_York")
+        time.tzset()
+
+    async def main() -> None:
+        uploads = _Uploads()
+        uploads.upload(3)
+        runner = await uploads.serve()
+        host, port = runner.addresses[0][:2]
+        try:
+            async with SporeClient(base_url=f"http://{host}:{port}") as client:
+                feed = NewAssetsFeed(client, state_path, page_size=5)
+                # The first poll only sets the watermark
+                assert await feed.poll() == []
+                assert feed.watermark is not None
+
+                uploads.upload(12)
+                assets = await feed.poll()
+                assert [asset.id for asset in assets] == list(range(FIRST_ID + 3, FIRST_ID + 15))
+                # The poll stopped at the watermark
+                assert uploads.requests == 1 + 3
+
+                received: List[int] = []
+                async for asset in feed:
+                    received.append(asset.id)
+                    if len(received) == 12:
+                        break
+                assert received == [asset.id for asset in assets]
+
+                # The last asset was not acknowledged, a restarted feed yields it again
+                restarted = NewAssetsFeed(client, state_path, page_size=5)
+                assert [asset.id for asset in await restarted.poll()] == [FIRST_ID + 14]
+        finally:
+            await runner.cleanup()
+
+    try:
+        asyncio.run(main())
+    finally:
+        monkeypatch.undo()
+        if hasattr(time, "tzset"):
+            time.tzset()
+
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    # UTC, whatever the local timezone is
+    assert state == {
+        "create_at": calendar.timegm(EPOCH.timetuple()) + 13 * 60,
+        "id": FIRST_ID + 13,
+    }
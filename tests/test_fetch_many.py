@@ -0,0 +1,64 @@
+import asyncio
+from typing import List
+
+from benchmarks.mock_server import MockSporeServer
+from spore_api import SporeClient
+from spore_api.models import Creature
+
+
+FIRST_ID = 500000000000
+CONCURRENCY = 4
+
+
+def test_ordered_results_wait_for_a_slow_key() -> None:
+    async def main() -> None:
+        server = MockSporeServer()
+        base_url = await server.start()
+        try:
+            async with SporeClient(base_url=base_url) as client:
+                started: List[int] = []
+                get_creature = client.get_creature
+
+                async def fetch(asset_id: int) -> Creature:
+                    started.append(asset_id)
+                    if asset_id == FIRST_ID:
+                        await asyncio.sleep(0.2)
+                    return await get_creature(asset_id)
+
+                client.get_creature = fetch  # type: ignore
+                asset_ids = range(FIRST_ID, FIRST_ID + 100)
+                results = client.get_creatures_many(
+                    asset_ids,
+                    concurrency=CONCURRENCY,
+                    ordered=True,
+                )
+
+                first = await results.__anext__()
+                assert first.key == FIRST_ID and first.ok
+                # The keys after the slow one took the other slots only
+                assert len(started) <= 2 * CONCURRENCY
+
+                keys = [first.key] + [result.key async for result in results]
+                assert keys == list(asset_ids)
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_results_are_yielded_as_they_complete() -> None:
+    async def main() -> None:
+        server = MockSporeServer()
+        base_url = await server.start()
+        try:
+            async with SporeClient(base_url=base_url) as client:
+                asset_ids = list(range(FIRST_ID, FIRST_ID + 50))
+                batch = client.get_creatures_many(asset_ids, concurrency=CONCURRENCY)
+                results = [result async for result in batch]
+                assert all(result.ok for result in results)
+                assert sorted(result.key for result in results) == asset_ids
+                assert server.requests == len(asset_ids)
+        finally:
+            await server.close()
+
+    asyncio.run(main())
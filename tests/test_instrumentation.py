@@ -0,0 +1,100 @@
+import asyncio
+from typing import List
+
+from benchmarks import fixtures
+from benchmarks.mock_server import MockSporeServer
+from spore_api import Endpoint, Observer, RequestMetrics, SporeApiStatusError, SporeClient
+
+
+ASSET_ID = 500000000000
+
+
+class _ListObserver(Observer):
+    def __init__(self) -> None:
+        self.metrics: List[RequestMetrics] = []
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        self.metrics.append(metrics)
+
+
+def test_request_metrics() -> None:
+    async def main() -> None:
+        server = MockSporeServer()
+        base_url = await server.start()
+        observer = _ListObserver()
+        try:
+            async with SporeClient(base_url=base_url, observer=observer) as client:
+                await client.get_creature(ASSET_ID)
+        finally:
+            await server.close()
+
+        metrics, = observer.metrics
+        assert metrics.endpoint is Endpoint.creature
+        assert metrics.http_status == 200 and metrics.api_status == 1
+        assert metrics.error is None
+        assert metrics.body_size == len(fixtures.creature_document(ASSET_ID).encode("utf-8"))
+        assert metrics.parse_duration is not None and metrics.parse_duration >= 0
+        assert metrics.ttfb is not None and metrics.duration is not None
+
+    asyncio.run(main())
+
+
+def test_stream_metrics() -> None:
+    async def main() -> None:
+        server = MockSporeServer(total_items=30)
+        base_url = await server.start()
+        observer = _ListObserver()
+        try:
+            async with SporeClient(base_url=base_url, observer=observer) as client:
+                assets = [asset async for asset in client.stream_user_assets("MaxisCactus", 0, 50)]
+        finally:
+            await server.close()
+
+        assert len(assets) == 30
+        metrics, = observer.metrics
+        assert metrics.endpoint is Endpoint.user_assets
+        assert metrics.api_status == 1 and metrics.error is None
+        assert metrics.body_size == len(fixtures.assets_document(30).encode("utf-8"))
+        assert metrics.parse_duration is not None and metrics.parse_duration > 0
+
+    asyncio.run(main())
+
+
+def test_stream_status_error_metrics() -> None:
+    async def main() -> None:
+        server = MockSporeServer(status_error_rate=1.0)
+        base_url = await server.start()
+        observer = _ListObserver()
+        try:
+            async with SporeClient(base_url=base_url, observer=observer) as client:
+                try:
+                    async for _ in client.stream_user_assets("MaxisCactus", 0, 50):
+                        pass
+                except SporeApiStatusError:
+                    pass
+                else:
+                    raise AssertionError("The status error was not raised")
+        finally:
+            await server.close()
+
+        metrics, = observer.metrics
+        assert metrics.http_status == 200 and metrics.api_status == 0
+        assert isinstance(metrics.error, SporeApiStatusError)
+        assert metrics.body_size == len(fixtures.status_error_document("assets"))
+
+    asyncio.run(main())
+
+
+def test_stream_without_observer() -> None:
+    async def main() -> None:
+        server = MockSporeServer(total_items=30)
+        base_url = await server.start()
+        try:
+            async with SporeClient(base_url=base_url) as client:
+                assets = [asset async for asset in client.stream_user_assets("MaxisCactus", 0, 50)]
+                page = await client.get_user_assets("MaxisCactus", 0, 50)
+                assert [asset.id for asset in assets] == [asset.id for asset in page.assets]
+        finally:
+            await server.close()
+
+    asyncio.run(main())
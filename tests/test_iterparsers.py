@@ -0,0 +1,45 @@
+import re
+from typing import Callable, Dict
+
+import pytest
+
+from benchmarks import fixtures
+from spore_api import iterparsers, parsers
+
+
+DOCUMENTS: Dict[str, Callable[[], str]] = {
+    "parse_stats": fixtures.stats_document,
+    "parse_creature": lambda: fixtures.creature_document(500000000000),
+    "parse_user": lambda: fixtures.user_document("user"),
+    "parse_assets": lambda: fixtures.assets_document(10),
+    "parse_sporecasts": lambda: fixtures.sporecasts_document(3),
+    "parse_sporecast_assets": lambda: fixtures.sporecast_assets_document(10),
+    "parse_achievements": lambda: fixtures.achievements_document(10),
+    "parse_full_asset": lambda: fixtures.full_asset_document(500000000000),
+    "parse_asset_comments": lambda: fixtures.comments_document(10),
+    "parse_buddies": lambda: fixtures.buddies_document(10),
+}
+
+
+def _format(text: str) -> str:
+    """Put every tag and text on its own indented line"""
+    return re.sub(r">\s*([^<]*?)\s*<", lambda match: f">\n  {match.group(1)}\n  <", text)
+
+
+@pytest.mark.parametrize("name", DOCUMENTS)
+@pytest.mark.parametrize("format_document", [False, True])
+def test_backends_build_same_models(name: str, format_document: bool) -> None:
+    text = DOCUMENTS[name]()
+    if format_document:
+        text = _format(text)
+
+    assert getattr(iterparsers, name)(text) == getattr(parsers, name)(text)
+
+
+def test_empty_elements() -> None:
+    text = fixtures.assets_document(1).replace(
+        "<description>NULL</description>",
+        "<description>  </description>",
+    )
+
+    assert iterparsers.parse_assets(text) == parsers.parse_assets(text)
@@ -0,0 +1,139 @@
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import AsyncIterator, List, Optional, Set
+
+import pytest
+
+from spore_api import Asset, AssetSubtype, AssetType, SporeMirror
+
+
+USERNAME = "MaxisCactus"
+EPOCH = datetime(2020, 1, 1)
+
+
+class _FakeClient():
+    """Assets of one user, newest first, as `SporeClient.iter_user_assets` pages them"""
+    def __init__(self) -> None:
+        self.assets: List[Asset] = []
+
+    def upload(self, count: int) -> None:
+        for _ in range(count):
+            asset_id = len(self.assets) + 1
+            self.assets.insert(0, Asset(
+                id=asset_id,
+                name=f"Asset {asset_id}",
+                author_name=USERNAME,
+                create_at=EPOCH + timedelta(minutes=asset_id),
+                rating=0.0,
+                type=AssetType.creature,
+                subtype=AssetSubtype.сreature,
+                parent_id=None,
+                description=None,
+                tags=None,
+                thumbnail_url="",
+                image_url="",
+            ))
+
+    async def iter_user_assets(
+        self,
+        username: str,
+        start_index: int = 0,
+        page_size: int = 10,
+        read_ahead: int = 0,
+    ) -> AsyncIterator[Asset]:
+        for asset in self.assets[start_index:]:
+            yield asset
+
+
+def _mirrored_ids(mirror: SporeMirror) -> Set[int]:
+    return {asset.id for asset in mirror.get_user_assets(USERNAME)}
+
+
+def _sync(mirror: SporeMirror, limit: Optional[int] = None) -> int:
+    return asyncio.run(mirror.sync_user_assets(USERNAME, limit=limit))
+
+
+def _sync_to_end(mirror: SporeMirror, limit: int) -> int:
+    """Sync until a sync finds no new assets, return the count of new assets"""
+    new_count = 0
+    for _ in range(10):
+        synced = _sync(mirror, limit)
+        if not synced:
+            return new_count
+        new_count += synced
+    raise AssertionError("The syncs never finished")
+
+
+def test_limited_sync_leaves_no_gap() -> None:
+    client = _FakeClient()
+    mirror = SporeMirror(":memory:", client, overlap=2)  # type: ignore
+    try:
+        client.upload(10)
+        assert _sync(mirror) == 10
+
+        # The limit stops the sync far above the watermark
+        client.upload(30)
+        assert _sync(mirror, limit=10) == 10
+        assert _mirrored_ids(mirror) == set(range(1, 11)) | set(range(31, 41))
+
+        # The next syncs take the new uploads, then continue below the stopped one
+        client.upload(5)
+        assert _sync_to_end(mirror, limit=10) == 5 + 20
+        assert _mirrored_ids(mirror) == set(range(1, 46))
+
+        # Finished: only the new uploads are fetched
+        client.upload(3)
+        assert _sync(mirror, limit=10) == 3
+        assert _sync(mirror) == 0
+        assert _mirrored_ids(mirror) == set(range(1, 49))
+    finally:
+        mirror.close()
+
+
+def test_limited_first_sync_continues_to_the_end() -> None:
+    client = _FakeClient()
+    mirror = SporeMirror(":memory:", client, overlap=2)  # type: ignore
+    try:
+        client.upload(25)
+        assert _sync_to_end(mirror, limit=10) == 25
+        assert _mirrored_ids(mirror) == set(range(1, 26))
+    finally:
+        mirror.close()
+
+
+def test_asset_repeated_in_a_sync_is_new_once() -> None:
+    client = _FakeClient()
+    mirror = SporeMirror(":memory:", client, overlap=2)  # type: ignore
+    try:
+        client.upload(5)
+        # An upload during the paging moves an asset to the next page
+        client.assets.insert(3, client.assets[2])
+        assert _sync(mirror) == 5
+        assert _mirrored_ids(mirror) == set(range(1, 6))
+    finally:
+        mirror.close()
+
+
+@pytest.mark.skipif(not hasattr(time, "tzset"), reason="needs time.tzset")
+def test_times_do_not_depend_on_the_local_timezone(monkeypatch: pytest.MonkeyPatch) -> None:
+    client = _FakeClient()
+    client.upload(1)
+    asset = client.assets[0]
+    mirror = SporeMirror(":memory:", client)  # type: ignore
+    try:
+        monkeypatch.setenv("TZ", "UTC")
+        time.tzset()
+        assert _sync(mirror) == 1
+
+        for timezone_name in ("America/New_York", "Asia/Tokyo"):
+            monkeypatch.setenv("TZ", timezone_name)
+            time.tzset()
+            mirrored, = mirror.get_user_assets(USERNAME)
+            assert mirrored.create_at == asset.create_at
+            until = asset.create_at + timedelta(seconds=1)
+            assert mirror.search_assets(since=asset.create_at, until=until) == [mirrored]
+    finally:
+        mirror.close()
+        monkeypatch.undo()
+        time.tzset()
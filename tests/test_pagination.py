@@ -0,0 +1,72 @@
+import asyncio
+
+from benchmarks.mock_server import MockSporeServer
+from spore_api import SporeClient, ViewType
+
+
+FIRST_ID = 500000000000
+
+
+def test_iteration_stops_on_a_short_page() -> None:
+    async def main() -> None:
+        server = MockSporeServer(total_items=25)
+        base_url = await server.start()
+        try:
+            async with SporeClient(base_url=base_url) as client:
+                pages = client.iter_user_assets("MaxisCactus", page_size=10, read_ahead=0)
+                assets = [asset async for asset in pages]
+                assert [asset.id for asset in assets] == list(range(FIRST_ID, FIRST_ID + 25))
+                assert server.requests == 3
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_iteration_stops_on_an_empty_page() -> None:
+    async def main() -> None:
+        server = MockSporeServer(total_items=20)
+        base_url = await server.start()
+        try:
+            async with SporeClient(base_url=base_url) as client:
+                pages = client.iter_user_buddies("MaxisCactus", page_size=10, read_ahead=0)
+                buddies = [buddy async for buddy in pages]
+                assert [buddy.id for buddy in buddies] == list(range(20))
+                assert server.requests == 3
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_read_ahead_pages_are_cancelled_when_iteration_stops() -> None:
+    async def main() -> None:
+        server = MockSporeServer(latency=0.05, total_items=1000)
+        base_url = await server.start()
+        try:
+            async with SporeClient(base_url=base_url) as client:
+                assets = client.iter_search_assets(
+                    ViewType.newest,
+                    start_index=10,
+                    page_size=10,
+                    read_ahead=2,
+                    asset_type=None,
+                )
+                ids = []
+                async for asset in assets:
+                    ids.append(asset.id)
+                    if len(ids) == 15:
+                        break
+                await assets.aclose()  # type: ignore
+                assert ids == list(range(FIRST_ID + 10, FIRST_ID + 25))
+
+                # Two pages consumed and at most two read ahead, which are
+                # cancelled and not followed by more pages
+                requests = server.requests
+                assert requests <= 4
+                await asyncio.sleep(0.1)
+                assert server.requests == requests
+        finally:
+            await server.close()
+
+    asyncio.run(main())
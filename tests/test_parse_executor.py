@@ -0,0 +1,74 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, List, Optional
+
+import pytest
+
+from benchmarks.mock_server import MockSporeServer
+from spore_api import SporeApiStatusError, SporeClient
+
+
+ASSET_ID = 500000000000
+
+
+class _RecordingExecutor(ThreadPoolExecutor):
+    """Counts the offloaded parses"""
+    def __init__(self) -> None:
+        super().__init__(max_workers=2)
+        self.submitted = 0
+
+    def submit(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        self.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+async def _get_all(client: SporeClient) -> List[Any]:
+    return [
+        await client.get_creature(ASSET_ID),
+        await client.get_user_assets("MaxisCactus", 0, 20),
+        await client.get_asset_info(ASSET_ID),
+        await client.get_user_buddies("MaxisCactus", 0, 20),
+    ]
+
+
+def _run(executor: Optional[Executor], threshold: int, **server_options: Any) -> List[Any]:
+    async def main() -> List[Any]:
+        server = MockSporeServer(**server_options)
+        base_url = await server.start()
+        try:
+            async with SporeClient(
+                base_url=base_url,
+                parse_executor=executor,
+                parse_offload_threshold=threshold,
+            ) as client:
+                return await _get_all(client)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_offloaded_parses_give_same_models() -> None:
+    expected = _run(None, 0)
+    with _RecordingExecutor() as executor:
+        assert _run(executor, 0) == expected
+        assert executor.submitted == 4
+
+
+def test_small_responses_are_parsed_on_the_loop() -> None:
+    with _RecordingExecutor() as executor:
+        _run(executor, 10 ** 9)
+        assert executor.submitted == 0
+
+
+def test_process_pool_parses() -> None:
+    expected = _run(None, 0)
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        assert _run(executor, 0) == expected
+
+
+def test_status_errors_are_raised_from_the_executor() -> None:
+    with _RecordingExecutor() as executor:
+        with pytest.raises(SporeApiStatusError):
+            _run(executor, 0, status_error_rate=1.0)
+        assert executor.submitted == 1
@@ -0,0 +1,114 @@
+import asyncio
+import time
+from typing import List
+
+import aiohttp
+from aiohttp import web
+
+from benchmarks import fixtures
+from benchmarks.mock_server import MockSporeServer
+from spore_api import Endpoint, HedgePolicy, RetryPolicy, SporeClient
+
+
+ASSET_ID = 500000000000
+
+
+async def _serve(responses: List[float]) -> web.AppRunner:
+    """
+    Serve `/rest/creature/<id>`, the next value of `responses` per request
+    is a status to answer or a delay before the document (the last one repeats)
+    """
+    async def handle(request: web.Request) -> web.Response:
+        response = responses.pop(0) if len(responses) > 1 else responses[0]
+        if isinstance(response, int):
+            return web.Response(status=response, headers={"Retry-After": "0"})
+        await asyncio.sleep(response)
+        return web.Response(text=fixtures.creature_document(ASSET_ID), content_type="text/xml")
+
+    app = web.Application()
+    app.router.add_get("/rest/creature/{asset_id}", handle)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    return runner
+
+
+def test_transient_errors_are_retried() -> None:
+    async def main() -> None:
+        runner = await _serve([503, 502, 0.0])
+        host, port = runner.addresses[0][:2]
+        policy = RetryPolicy(attempts=3, backoff=0.01)
+        try:
+            async with SporeClient(base_url=f"http://{host}:{port}", retry_policy=policy) as client:
+                creature = await client.get_creature(ASSET_ID)
+                assert creature.asset_id == ASSET_ID
+                assert policy.retries == 2
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def test_client_errors_are_not_retried() -> None:
+    async def main() -> None:
+        runner = await _serve([404, 0.0])
+        host, port = runner.addresses[0][:2]
+        policy = RetryPolicy(attempts=3, backoff=0.01)
+        try:
+            async with SporeClient(base_url=f"http://{host}:{port}", retry_policy=policy) as client:
+                try:
+                    await client.get_creature(ASSET_ID)
+                except aiohttp.ClientResponseError as error:
+                    assert error.status == 404
+                else:
+                    raise AssertionError("The 404 response was not raised")
+                assert policy.retries == 0
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def test_retry_budget_limits_retries_of_a_failing_server() -> None:
+    async def main() -> None:
+        server = MockSporeServer(error_rate=1.0)
+        base_url = await server.start()
+        policy = RetryPolicy(attempts=5, backoff=0, budget_ratio=0.1, budget_reserve=2)
+        try:
+            async with SporeClient(base_url=base_url, retry_policy=policy) as client:
+                for index in range(10):
+                    try:
+                        await client.get_creature(ASSET_ID + index)
+                    except aiohttp.ClientResponseError:
+                        pass
+                # The reserve is spent, the next 9 requests earn less than a retry
+                assert policy.retries == 2
+                assert server.requests == 10 + 2
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_slow_request_is_hedged() -> None:
+    async def main() -> None:
+        # Fast requests set the latency quantile, then one hangs
+        runner = await _serve([0.0] * 5 + [2.0, 0.0])
+        host, port = runner.addresses[0][:2]
+        policy = HedgePolicy(quantile=0.5, min_samples=5, min_delay=0.05)
+        try:
+            async with SporeClient(base_url=f"http://{host}:{port}", hedge_policy=policy) as client:
+                for _ in range(5):
+                    await client.get_creature(ASSET_ID)
+                assert policy.hedges == 0
+
+                started_at = time.monotonic()
+                await client.get_creature(ASSET_ID)
+                assert time.monotonic() - started_at < 1
+                assert policy.hedges == 1
+                # The cancelled attempt is recorded with the winner
+                assert len(policy._latencies[Endpoint.creature]) == 5 + 2
+        finally:
+            await runner.cleanup()
+
+    asyncio.run(main())
@@ -0,0 +1,82 @@
+import io
+import json
+from typing import Any, Callable, Dict
+
+import pytest
+
+from benchmarks import fixtures
+from spore_api import parsers, serialization
+from spore_api.models import CompactAsset, CompactComment, CompactCreature
+
+
+DOCUMENTS: Dict[str, Callable[[], str]] = {
+    "parse_stats": fixtures.stats_document,
+    "parse_creature": lambda: fixtures.creature_document(500000000000),
+    "parse_user": lambda: fixtures.user_document("user"),
+    "parse_assets": lambda: fixtures.assets_document(10),
+    "parse_sporecasts": lambda: fixtures.sporecasts_document(3),
+    "parse_sporecast_assets": lambda: fixtures.sporecast_assets_document(10),
+    "parse_achievements": lambda: fixtures.achievements_document(10),
+    "parse_full_asset": lambda: fixtures.full_asset_document(500000000000),
+    "parse_asset_comments": lambda: fixtures.comments_document(10),
+    "parse_buddies": lambda: fixtures.buddies_document(10),
+}
+
+
+def _parse(name: str) -> Any:
+    return getattr(parsers, name)(DOCUMENTS[name]())
+
+
+@pytest.mark.parametrize("name", DOCUMENTS)
+def test_dumps_is_byte_compatible_with_to_json(name: str) -> None:
+    model = _parse(name)
+    assert serialization.dumps(model) == model.to_json()
+
+
+@pytest.mark.parametrize("name", DOCUMENTS)
+def test_compact_dumps_has_same_data(name: str) -> None:
+    model = _parse(name)
+    text = serialization.dumps(model, compact=True)
+    assert len(text) < len(model.to_json())
+    assert json.loads(text) == json.loads(model.to_json())
+
+
+def test_dumps_escapes_like_to_json() -> None:
+    text = fixtures.assets_document(2).replace("<name>", "<name>Créature «\"ü\"» ")
+    assets = parsers.parse_assets(text)
+    assets.assets[1].parent_id = None
+    assets.assets[1].tags = None
+    assert serialization.dumps(assets) == assets.to_json()
+    assert "Créature" in serialization.dumps(assets, compact=True)
+
+
+def test_dumps_compact_models() -> None:
+    assets = parsers.parse_assets(fixtures.assets_document(3)).assets
+    creature = parsers.parse_creature(fixtures.creature_document(500000000000))
+    comments = parsers.parse_asset_comments(fixtures.comments_document(3)).comments
+
+    models = [
+        *(CompactAsset.from_model(asset) for asset in assets),
+        CompactCreature.from_model(creature),
+        *(CompactComment.from_model(comment) for comment in comments),
+    ]
+    for model in models:
+        assert serialization.dumps(model) == model.to_json()
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_write_json_lines_and_array(compact: bool) -> None:
+    assets = parsers.parse_assets(fixtures.assets_document(5)).assets
+    expected = [json.loads(asset.to_json()) for asset in assets]
+
+    lines = io.StringIO()
+    assert serialization.write_json_lines(assets, lines, compact=compact) == 5
+    assert [json.loads(line) for line in lines.getvalue().splitlines()] == expected
+
+    array = io.StringIO()
+    assert serialization.write_json_array(iter(assets), array, compact=compact) == 5
+    assert json.loads(array.getvalue()) == expected
+
+    empty = io.StringIO()
+    assert serialization.write_json_array([], empty, compact=compact) == 0
+    assert empty.getvalue() == "[]"
@@ -0,0 +1,109 @@
+import asyncio
+import time
+
+import aiohttp
+
+from benchmarks.mock_server import MockSporeServer
+from spore_api import AdaptiveConcurrency, Endpoint, RateLimiter, SporeClient, TokenBucket
+
+
+ASSET_ID = 500000000000
+
+
+def test_token_bucket_spreads_acquisitions() -> None:
+    async def main() -> None:
+        bucket = TokenBucket(rate=50, burst=5)
+        started_at = time.monotonic()
+        for _ in range(15):
+            await bucket.acquire()
+        # The burst is free, the other 10 acquisitions wait for 1/50 s each
+        assert time.monotonic() - started_at >= 10 / 50 * 0.9
+
+    asyncio.run(main())
+
+
+def test_rate_limiter_limits_endpoints_separately() -> None:
+    async def main() -> None:
+        server = MockSporeServer()
+        base_url = await server.start()
+        limiter = RateLimiter(endpoint_rates={Endpoint.creature: (20, 1)})
+        try:
+            async with SporeClient(base_url=base_url, rate_limiter=limiter) as client:
+                started_at = time.monotonic()
+                await asyncio.gather(*(client.get_user_info(f"user{index}") for index in range(10)))
+                # Limited like creatures, they would take 9 / 20 s
+                assert time.monotonic() - started_at < 9 / 20
+
+                started_at = time.monotonic()
+                await asyncio.gather(*(client.get_creature(ASSET_ID + index) for index in range(6)))
+                assert time.monotonic() - started_at >= 5 / 20 * 0.9
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_adaptive_concurrency_bounds_requests_in_flight() -> None:
+    async def main() -> None:
+        server = MockSporeServer(latency=0.05)
+        base_url = await server.start()
+        controller = AdaptiveConcurrency(initial=2, maximum=2)
+        try:
+            async with SporeClient(base_url=base_url, concurrency_controller=controller) as client:
+                started_at = time.monotonic()
+                await asyncio.gather(*(client.get_creature(ASSET_ID + index) for index in range(8)))
+                # 4 rounds of 2 requests
+                assert time.monotonic() - started_at >= 4 * 0.05 * 0.9
+                assert controller.in_flight == 0
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_adaptive_concurrency_decreases_on_overload() -> None:
+    async def main() -> None:
+        server = MockSporeServer(error_rate=1.0)
+        base_url = await server.start()
+        controller = AdaptiveConcurrency(initial=8, minimum=1, target_latency=10)
+        try:
+            async with SporeClient(base_url=base_url, concurrency_controller=controller) as client:
+                results = await asyncio.gather(
+                    *(client.get_creature(ASSET_ID + index) for index in range(8)),
+                    return_exceptions=True,
+                )
+                assert all(isinstance(result, aiohttp.ClientResponseError) for result in results)
+                # A burst of failures within `target_latency` decreases the limit once
+                assert controller.limit == 4
+                assert controller.in_flight == 0
+        finally:
+            await server.close()
+
+    asyncio.run(main())
+
+
+def test_adaptive_concurrency_grows_with_fast_responses() -> None:
+    async def main() -> None:
+        controller = AdaptiveConcurrency(initial=2, maximum=3, target_latency=1)
+        for _ in range(20):
+            await controller.acquire()
+            controller.release(0.01)
+        assert controller.limit == 3
+
+    asyncio.run(main())
+
+
+def test_cancelled_waiter_gives_its_slot_back() -> None:
+    async def main() -> None:
+        controller = AdaptiveConcurrency(initial=1, maximum=1)
+        await controller.acquire()
+        waiter = asyncio.ensure_future(controller.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+
+        controller.release(0.01)
+        assert controller.in_flight == 0
+        await asyncio.wait_for(controller.acquire(), 1)
+
+    asyncio.run(main())